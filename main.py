@@ -17,6 +17,7 @@ if sys.platform == "win32":
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.orchestration import run_pipeline, run_batch, run_batch_pipeline
+from src.batching import install_fast_event_loop
 import yaml
 
 
@@ -613,7 +614,8 @@ Notes:
     # Setup logging
     setup_logging(args.verbose)
 
-    # Run async main
+    # Run async main (on uvloop/winloop when installed)
+    install_fast_event_loop()
     asyncio.run(main_async(args))
 
 
@@ -0,0 +1,74 @@
+"""
+On-disk cache of Sentence-BERT embeddings for the evaluation scripts.
+
+Embeddings are stored in a dbm database per model, keyed by the SHA-256
+digest of the text, so re-running eval_metrics.py over the same JSONL
+only encodes bullets it has not seen before. Vectors are stored
+L2-normalized, so cosine similarity on cached embeddings is a plain
+dot product with no per-run normalization.
+"""
+
+import dbm
+import hashlib
+import re
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """Persistent text -> float32 embedding cache backed by dbm."""
+
+    def __init__(self, cache_dir: Path, model_name: str):
+        """
+        Open (or create) the cache database for a model.
+
+        Args:
+            cache_dir: Directory holding one database per model
+            model_name: Sentence-BERT model name (may contain '/')
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '__', model_name)
+        self.path = cache_dir / f"{safe_name}.db"
+        self._db = dbm.open(str(self.path), 'c')
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha256(text.encode('utf-8')).digest()
+
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings for a list of texts.
+
+        Returns:
+            One float32 vector per text, or None for cache misses
+        """
+        db = self._db
+        results: List[Optional[np.ndarray]] = []
+        for text in texts:
+            value = db.get(self._key(text))
+            results.append(None if value is None else np.frombuffer(value, dtype=np.float32))
+        return results
+
+    def put_many(self, texts: List[str], embeddings: np.ndarray) -> None:
+        """Store one embedding row per text, normalized to unit length."""
+        if not texts:
+            return
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.maximum(norms, 1e-12)
+        db = self._db
+        for text, vector in zip(texts, vectors):
+            db[self._key(text)] = vector.tobytes()
+
+    def close(self) -> None:
+        """Flush and close the underlying database."""
+        self._db.close()
+
+    def __enter__(self) -> "EmbeddingCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -4,14 +4,28 @@ Analyze pairs with low skill coverage to identify root causes.
 
 Usage:
     python scripts/analyze_problem_pairs.py --input outputs/eval/baseline_vs_full.jsonl
+
+The module is fully annotated so it can be compiled with mypyc for very
+large inputs (the compiled extension takes precedence on import):
+    cd scripts && mypyc --ignore-missing-imports analyze_problem_pairs.py
+    python -c "import analyze_problem_pairs as m; m.main()" --input ...
 """
 
+import heapq
 import json
+import mmap
+import os
+import re
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from os.path import basename
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Final, Optional, Tuple
 import sys
 
+import numpy as np
+
 
 def inspect_structure(pair: Dict[str, Any]) -> None:
     """Print the structure of a pair to debug."""
@@ -36,30 +50,89 @@ def inspect_structure(pair: Dict[str, Any]) -> None:
     print()
 
 
+# Key names tried, in order, when looking for a coverage value
+_COVERAGE_KEYS: Final = ('required_skill_coverage', 'required_coverage', 'skill_coverage', 'coverage')
+
+
+# Path of keys from a pair (or mode dict) down to a coverage value
+CoveragePath = Tuple[str, ...]
+CoverageGetter = Callable[[Dict[str, Any]], Tuple[Optional[float], Optional[float]]]
+
+
+def find_coverage_path(data: Dict[str, Any]) -> Optional[CoveragePath]:
+    """
+    Search depth-first for the key path of a skill coverage value in nested dict.
+
+    Tries multiple possible locations and key names. Uses an explicit
+    stack rather than recursion, visiting nested dicts in preorder.
+    """
+    stack: List[Tuple[Dict[str, Any], CoveragePath]] = [(data, ())]
+    while stack:
+        node, path = stack.pop()
+
+        # Try direct metrics access
+        metrics = node.get('metrics')
+        if isinstance(metrics, dict):
+            for key in _COVERAGE_KEYS:
+                if metrics.get(key) is not None:
+                    return path + ('metrics', key)
+
+        # Try direct access (metrics might be at top level)
+        for key in _COVERAGE_KEYS:
+            if node.get(key) is not None:
+                return path + (key,)
+
+        # Queue nested dicts, reversed so the first one is searched next
+        stack.extend(reversed([
+            (value, path + (key,))
+            for key, value in node.items()
+            if isinstance(value, dict)
+        ]))
+
+    return None
+
+
 def find_coverage_value(data: Dict[str, Any]) -> Optional[float]:
+    """Search depth-first for skill coverage value in nested dict."""
+    path = find_coverage_path(data)
+    if path is None:
+        return None
+    return get_path(data, path)
+
+
+def get_path(data: Dict[str, Any], path: CoveragePath) -> Any:
+    """Follow a key path into nested dicts (raises KeyError/TypeError on mismatch)."""
+    value: Any = data
+    for key in path:
+        value = value[key]
+    return value
+
+
+def extract_coverage_path(pair: Dict[str, Any], mode: str) -> Optional[CoveragePath]:
     """
-    Recursively search for skill coverage value in nested dict.
+    Locate the coverage value for baseline or full mode.
+
+    Args:
+        pair: The pair dictionary
+        mode: 'baseline' or 'full'
 
-    Tries multiple possible locations and key names.
+    Returns:
+        Key path from the pair to the coverage value, or None if not found
     """
-    # Try direct metrics access
-    if 'metrics' in data:
-        metrics = data['metrics']
-        for key in ['required_skill_coverage', 'required_coverage', 'skill_coverage', 'coverage']:
-            if key in metrics:
-                return metrics[key]
-
-    # Try direct access (metrics might be at top level)
-    for key in ['required_skill_coverage', 'required_coverage', 'skill_coverage', 'coverage']:
-        if key in data:
-            return data[key]
-
-    # Try nested search
-    for value in data.values():
-        if isinstance(value, dict):
-            result = find_coverage_value(value)
-            if result is not None:
-                return result
+    if mode not in pair:
+        return None
+
+    # Try finding it in the mode section
+    path = find_coverage_path(pair[mode])
+    if path is not None:
+        return (mode,) + path
+
+    # If still not found, try comparison section for computed values
+    comp = pair.get('comparison')
+    if isinstance(comp, dict):
+        key = f'{mode}_required_coverage'
+        if key in comp:
+            return ('comparison', key)
 
     return None
 
@@ -75,23 +148,27 @@ def extract_coverage(pair: Dict[str, Any], mode: str) -> Optional[float]:
     Returns:
         Coverage value (0.0-1.0) or None if not found
     """
-    if mode not in pair:
+    path = extract_coverage_path(pair, mode)
+    if path is None:
         return None
+    return get_path(pair, path)
 
-    mode_data = pair[mode]
 
-    # Try finding it recursively
-    coverage = find_coverage_value(mode_data)
+def make_coverage_getter(
+    baseline_path: CoveragePath,
+    full_path: CoveragePath
+) -> CoverageGetter:
+    """
+    Build an extractor specialized to one file's schema.
 
-    # If still not found, try comparison section for computed values
-    if coverage is None and 'comparison' in pair:
-        comp = pair['comparison']
-        if mode == 'baseline' and 'baseline_required_coverage' in comp:
-            return comp['baseline_required_coverage']
-        if mode == 'full' and 'full_required_coverage' in comp:
-            return comp['full_required_coverage']
+    JSONL written by a single eval run has the same layout on every line,
+    so once the coverage paths are known for one pair, later pairs can be
+    read with direct subscripts instead of a full search.
+    """
+    def get_coverage(pair: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+        return get_path(pair, baseline_path), get_path(pair, full_path)
 
-    return coverage
+    return get_coverage
 
 
 def analyze_pair(pair: Dict[str, Any], threshold: float) -> Optional[Dict[str, Any]]:
@@ -115,13 +192,342 @@ def analyze_pair(pair: Dict[str, Any], threshold: float) -> Optional[Dict[str, A
             'baseline_coverage': baseline_cov,
             'full_coverage': full_cov,
             'delta': delta,
-            'job_path': pair.get('job_path', 'N/A'),
-            'resume_path': pair.get('resume_path', 'N/A')
+            'job_name': basename(pair.get('job_path', '')) or 'N/A',
+            'resume_name': basename(pair.get('resume_path', '')) or 'N/A'
         }
 
     return None
 
 
+# Files smaller than this (roughly 10k pairs) are analyzed in-process;
+# above it the cost of spawning workers is easily recovered.
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+
+# Byte patterns for the fast path in scan_coverage()
+_BASELINE_KEY = b'"baseline":'
+_FULL_KEY = b'"full":'
+_METRICS_KEY = b'"metrics":'
+_COVERAGE_KEY = b'"required_skill_coverage":'
+_NUMBER_RE = re.compile(rb'\s*(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)')
+
+
+def scan_coverage(line: bytes) -> Optional[Tuple[float, float]]:
+    """
+    Extract (baseline, full) coverage from a raw JSONL line without decoding it.
+
+    Only handles the common schema written by run_dataset_eval, where each
+    mode carries exactly one metrics.required_skill_coverage value. Anything
+    else returns None so the caller can fall back to json.loads().
+    """
+    baseline_pos = line.find(_BASELINE_KEY)
+    full_pos = line.find(_FULL_KEY)
+    if baseline_pos == -1 or full_pos == -1:
+        return None
+
+    first = line.find(_COVERAGE_KEY)
+    if first == -1:
+        return None
+    second = line.find(_COVERAGE_KEY, first + 1)
+    if second == -1 or line.find(_COVERAGE_KEY, second + 1) != -1:
+        return None
+
+    # Each coverage key must sit in the metrics of a different mode
+    if baseline_pos < first < full_pos < second:
+        baseline_at, full_at = first, second
+    elif full_pos < first < baseline_pos < second:
+        baseline_at, full_at = second, first
+    else:
+        return None
+    if line.rfind(_METRICS_KEY, baseline_pos, baseline_at) == -1:
+        return None
+    if line.rfind(_METRICS_KEY, full_pos, full_at) == -1:
+        return None
+
+    baseline_match = _NUMBER_RE.match(line, baseline_at + len(_COVERAGE_KEY))
+    full_match = _NUMBER_RE.match(line, full_at + len(_COVERAGE_KEY))
+    if baseline_match is None or full_match is None:
+        return None
+    return float(baseline_match.group(1)), float(full_match.group(1))
+
+
+def load_first_pair(path: Path) -> Optional[Dict[str, Any]]:
+    """Load only the first pair from a JSONL file (None if it has no pairs)."""
+    with open(path, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                return json.loads(line)
+    return None
+
+
+def chunk_offsets(path: Path, n_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split a JSONL file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path: Path to the JSONL file
+        n_chunks: Desired number of chunks
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file
+    """
+    size = path.stat().st_size
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, n_chunks):
+            f.seek(size * i // n_chunks)
+            f.readline()
+            pos = f.tell()
+            if bounds[-1] < pos < size:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def analyze_chunk(
+    path: str,
+    start: int,
+    end: int,
+    threshold: float,
+    top_k: int = 0
+) -> Dict[str, Any]:
+    """
+    Analyze every pair in a byte range of the JSONL file.
+
+    Runs in a worker process for large inputs, so it only takes picklable
+    arguments and returns plain containers that can be merged by the parent.
+
+    Args:
+        path: Path to the JSONL file
+        start: Byte offset of the first line in the range
+        end: Byte offset just past the last line in the range
+        threshold: Coverage drop threshold to flag as problem
+        top_k: Keep only this many worst problem pairs (0 keeps all)
+
+    Returns:
+        Dict with 'total' (pairs seen), 'deltas' (float64 array),
+        'problems' (problem pair dicts, worst first), 'n_problems'
+        (problem pairs seen, including any dropped by top_k) and
+        'failed' (pair ids)
+    """
+    problem_pairs: List[Dict[str, Any]] = []
+    failed_pairs: List[str] = []
+    total = 0
+    n_problems = 0
+    if end <= start:
+        return {
+            'total': total,
+            'deltas': np.empty(0, dtype=np.float64),
+            'problems': problem_pairs,
+            'n_problems': n_problems,
+            'failed': failed_pairs,
+        }
+
+    # Bounded max-heap of (-delta, -seq, pair) holding the top_k worst pairs;
+    # on equal deltas the later pair is evicted first, like a stable sort
+    worst: List[Tuple[float, int, Dict[str, Any]]] = []
+
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with mm:
+        # Deltas are filled in place so the statistics run on a contiguous
+        # float64 array instead of a list of per-pair dicts
+        deltas = np.empty(mm[start:end].count(b'\n') + 1, dtype=np.float64)
+        n_deltas = 0
+        pos = start
+
+        # Bind hot lookups once; this loop runs for every line in the file
+        find = mm.find
+        scan = scan_coverage
+        extract_path = extract_coverage_path
+        get_coverage: Optional[CoverageGetter] = None
+        loads = json.loads
+        problem_append = problem_pairs.append
+        failed_append = failed_pairs.append
+
+        while pos < end:
+            newline = find(b'\n', pos, end)
+            if newline == -1:
+                newline = end
+            if newline == pos:
+                # Bare newline: skip without slicing
+                pos += 1
+                continue
+            line = mm[pos:newline]
+            pos = newline + 1
+
+            # json.loads and the byte scan both tolerate surrounding
+            # whitespace, so no strip(); isspace() stops at the first
+            # non-blank byte and only skips blank lines such as '\r'
+            if line.isspace():
+                continue
+            total += 1
+
+            # Most pairs are not problems, so read the two coverage values
+            # straight from the bytes and only decode JSON when needed
+            baseline_cov: Optional[float]
+            full_cov: Optional[float]
+            pair: Optional[Dict[str, Any]] = None
+            coverage = scan(line)
+            if coverage is not None:
+                baseline_cov, full_cov = coverage
+                delta = full_cov - baseline_cov
+                deltas[n_deltas] = delta
+                n_deltas += 1
+                if delta >= threshold:
+                    continue
+            else:
+                pair = loads(line)
+                baseline_cov = full_cov = None
+                if get_coverage is not None:
+                    try:
+                        baseline_cov, full_cov = get_coverage(pair)
+                    except (KeyError, TypeError):
+                        pass
+
+                # Schema not known yet (or it changed): search the pair and
+                # specialize the getter to the paths found
+                if baseline_cov is None or full_cov is None:
+                    baseline_path = extract_path(pair, 'baseline')
+                    full_path = extract_path(pair, 'full')
+                    if baseline_path is None or full_path is None:
+                        failed_append(pair.get('pair_id', 'unknown'))
+                        continue
+                    get_coverage = make_coverage_getter(baseline_path, full_path)
+                    baseline_cov, full_cov = get_coverage(pair)
+                    if baseline_cov is None or full_cov is None:
+                        failed_append(pair.get('pair_id', 'unknown'))
+                        continue
+
+                delta = full_cov - baseline_cov
+                deltas[n_deltas] = delta
+                n_deltas += 1
+
+                if delta >= threshold:
+                    continue
+
+            n_problems += 1
+            if top_k and len(worst) == top_k and -delta <= worst[0][0]:
+                continue
+
+            if pair is None:
+                pair = loads(line)
+            problem = {
+                'pair_id': pair.get('pair_id', 'unknown'),
+                'baseline_coverage': baseline_cov,
+                'full_coverage': full_cov,
+                'delta': delta,
+                'job_name': basename(pair.get('job_path', '')) or 'N/A',
+                'resume_name': basename(pair.get('resume_path', '')) or 'N/A'
+            }
+
+            if not top_k:
+                problem_append(problem)
+            elif len(worst) < top_k:
+                heapq.heappush(worst, (-delta, -n_problems, problem))
+            else:
+                heapq.heapreplace(worst, (-delta, -n_problems, problem))
+
+    if top_k:
+        problem_pairs = [entry[2] for entry in sorted(worst, reverse=True)]
+    else:
+        problem_pairs.sort(key=itemgetter('delta'))
+
+    return {
+        'total': total,
+        'deltas': deltas[:n_deltas],
+        'problems': problem_pairs,
+        'n_problems': n_problems,
+        'failed': failed_pairs,
+    }
+
+
+def analyze_file(
+    path: Path,
+    threshold: float,
+    workers: int,
+    top_k: int = 0
+) -> Dict[str, Any]:
+    """
+    Analyze all pairs in a JSONL file, in parallel for large inputs.
+
+    Partial results are merged in file order, so the output is identical
+    to a sequential scan.
+
+    Args:
+        path: Path to the JSONL file
+        threshold: Coverage drop threshold to flag as problem
+        workers: Maximum number of worker processes
+        top_k: Keep only this many worst problem pairs (0 keeps all)
+
+    Returns:
+        Merged result with the same keys as analyze_chunk()
+    """
+    if workers <= 1 or path.stat().st_size < PARALLEL_MIN_BYTES:
+        return analyze_chunk(str(path), 0, path.stat().st_size, threshold, top_k)
+
+    ranges = chunk_offsets(path, workers)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        futures = [
+            pool.submit(analyze_chunk, str(path), start, end, threshold, top_k)
+            for start, end in ranges
+        ]
+        partials = [future.result() for future in futures]
+
+    return {
+        'total': sum(p['total'] for p in partials),
+        'deltas': np.concatenate([p['deltas'] for p in partials]),
+        'problems': heapq.nsmallest(
+            top_k or sys.maxsize,
+            (pair for p in partials for pair in p['problems']),
+            key=itemgetter('delta')
+        ),
+        'n_problems': sum(p['n_problems'] for p in partials),
+        'failed': [pid for p in partials for pid in p['failed']],
+    }
+
+
+# Report block for one problem pair; positional field 0 is the rank
+PROBLEM_PAIR_TEMPLATE = (
+    "{0}. {pair_id}\n"
+    "   Baseline coverage: {baseline_coverage:.1%}\n"
+    "   Full coverage: {full_coverage:.1%}\n"
+    "   Delta: {delta:+.1%} [!]\n"
+    "   Job: {job_name}\n"
+    "   Resume: {resume_name}\n"
+    "\n"
+)
+
+
+def delta_statistics(deltas: np.ndarray) -> Dict[str, Any]:
+    """
+    Summarize coverage deltas with vectorized NumPy reductions.
+
+    The median is found by in-place partial selection (O(n), no sort and
+    no copy), so ``deltas`` is left reordered.
+
+    Args:
+        deltas: Non-empty float64 array of full - baseline coverage
+
+    Returns:
+        Dict with mean, min, max, median, std (0.0 for a single delta),
+        and the positive/negative counts beyond the ±1% band
+    """
+    stats = {
+        'mean': float(deltas.mean()),
+        'min': float(deltas.min()),
+        'max': float(deltas.max()),
+        'std': float(deltas.std(ddof=1)) if len(deltas) > 1 else 0.0,
+        'positive': int(np.count_nonzero(deltas > 0.01)),
+        'negative': int(np.count_nonzero(deltas < -0.01)),
+    }
+    # Must run last: partitions the array in place
+    stats['median'] = float(np.median(deltas, overwrite_input=True))
+    return stats
+
+
 def main():
     parser = argparse.ArgumentParser(description="Analyze problem pairs with low skill coverage")
     parser.add_argument(
@@ -141,6 +547,18 @@ def main():
         action='store_true',
         help='Print structure of first pair and exit'
     )
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        default=0,
+        help='Only list the K worst problem pairs (default: 0 = all)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes for large inputs (default: CPU count)'
+    )
 
     args = parser.parse_args()
 
@@ -148,60 +566,34 @@ def main():
         print(f"ERROR: Input file not found: {args.input}")
         sys.exit(1)
 
-    # Load pairs
-    pairs = []
-    with open(args.input, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                pairs.append(json.loads(line))
-
-    if not pairs:
-        print("ERROR: No pairs found in input file")
-        sys.exit(1)
-
     # Inspection mode
     if args.inspect:
-        inspect_structure(pairs[0])
+        first_pair = load_first_pair(args.input)
+        if first_pair is None:
+            print("ERROR: No pairs found in input file")
+            sys.exit(1)
+        inspect_structure(first_pair)
         sys.exit(0)
 
+    # Analyze all pairs
+    result = analyze_file(args.input, args.threshold, args.workers, args.top_k)
+    total_pairs = result['total']
+    deltas = result['deltas']
+    n_deltas = len(deltas)
+    problem_pairs = result['problems']
+    n_problems = result['n_problems']
+    failed_pairs = result['failed']
+
+    if not total_pairs:
+        print("ERROR: No pairs found in input file")
+        sys.exit(1)
+
     print('='*80)
     print('SKILL COVERAGE ANALYSIS')
     print('='*80)
-    print(f'Total pairs analyzed: {len(pairs)}')
+    print(f'Total pairs analyzed: {total_pairs}')
     print(f'Problem threshold: {args.threshold:.1%} coverage drop\n')
 
-    # Analyze all pairs
-    problem_pairs = []
-    all_deltas = []
-    failed_pairs = []
-
-    for pair in pairs:
-        baseline_cov = extract_coverage(pair, 'baseline')
-        full_cov = extract_coverage(pair, 'full')
-
-        if baseline_cov is None or full_cov is None:
-            failed_pairs.append(pair.get('pair_id', 'unknown'))
-            continue
-
-        delta = full_cov - baseline_cov
-        all_deltas.append({
-            'pair_id': pair.get('pair_id', 'unknown'),
-            'baseline': baseline_cov,
-            'full': full_cov,
-            'delta': delta
-        })
-
-        if delta < args.threshold:
-            problem_pairs.append({
-                'pair_id': pair.get('pair_id', 'unknown'),
-                'baseline_coverage': baseline_cov,
-                'full_coverage': full_cov,
-                'delta': delta,
-                'job_path': pair.get('job_path', 'N/A'),
-                'resume_path': pair.get('resume_path', 'N/A')
-            })
-
     # Report failed extractions
     if failed_pairs:
         print(f"WARNING: Could not extract coverage for {len(failed_pairs)} pairs:")
@@ -212,48 +604,44 @@ def main():
         print("\nRun with --inspect to see the structure.\n")
 
     # Report problem pairs
-    print(f'Problem pairs (>{abs(args.threshold):.0%} drop): {len(problem_pairs)}\n')
+    print(f'Problem pairs (>{abs(args.threshold):.0%} drop): {n_problems}\n')
 
     if problem_pairs:
-        problem_pairs.sort(key=lambda x: x['delta'])
+        if len(problem_pairs) < n_problems:
+            print(f'Showing the {len(problem_pairs)} worst (--top-k)\n')
         print('-'*80)
-        for i, p in enumerate(problem_pairs, 1):
-            print(f"{i}. {p['pair_id']}")
-            print(f"   Baseline coverage: {p['baseline_coverage']:.1%}")
-            print(f"   Full coverage: {p['full_coverage']:.1%}")
-            print(f"   Delta: {p['delta']:+.1%} [!]")
-            print(f"   Job: {Path(p['job_path']).name if p['job_path'] != 'N/A' else 'N/A'}")
-            print(f"   Resume: {Path(p['resume_path']).name if p['resume_path'] != 'N/A' else 'N/A'}")
-            print()
+        # One format call per pair and a single write for the whole list
+        render = PROBLEM_PAIR_TEMPLATE.format
+        sys.stdout.write(''.join(
+            render(i, **p) for i, p in enumerate(problem_pairs, 1)
+        ))
     else:
         print('SUCCESS: No problem pairs! All pairs maintain good skill coverage.\n')
 
     # Overall statistics
-    if all_deltas:
+    if n_deltas:
         print('='*80)
         print('OVERALL STATISTICS')
         print('='*80)
 
-        deltas_only = [d['delta'] for d in all_deltas]
-        avg_delta = sum(deltas_only) / len(deltas_only)
-        positive = sum(1 for d in deltas_only if d > 0.01)
-        negative = sum(1 for d in deltas_only if d < -0.01)
-        unchanged = len(deltas_only) - positive - negative
+        stats = delta_statistics(deltas)
+        positive = stats['positive']
+        negative = stats['negative']
+        unchanged = n_deltas - positive - negative
 
-        print(f'Pairs analyzed: {len(all_deltas)}/{len(pairs)}')
-        print(f'Average delta: {avg_delta:+.2%}')
-        print(f'Pairs with improvement (>1%): {positive} ({positive/len(all_deltas)*100:.1f}%)')
-        print(f'Pairs with degradation (<-1%): {negative} ({negative/len(all_deltas)*100:.1f}%)')
-        print(f'Pairs essentially unchanged (±1%): {unchanged} ({unchanged/len(all_deltas)*100:.1f}%)')
+        print(f'Pairs analyzed: {n_deltas}/{total_pairs}')
+        print(f"Average delta: {stats['mean']:+.2%}")
+        print(f'Pairs with improvement (>1%): {positive} ({positive/n_deltas*100:.1f}%)')
+        print(f'Pairs with degradation (<-1%): {negative} ({negative/n_deltas*100:.1f}%)')
+        print(f'Pairs essentially unchanged (±1%): {unchanged} ({unchanged/n_deltas*100:.1f}%)')
 
         # Distribution
-        import statistics
-        if len(deltas_only) > 1:
+        if n_deltas > 1:
             print(f'\nDelta distribution:')
-            print(f'  Min: {min(deltas_only):+.1%}')
-            print(f'  Max: {max(deltas_only):+.1%}')
-            print(f'  Median: {statistics.median(deltas_only):+.1%}')
-            print(f'  Std Dev: {statistics.stdev(deltas_only):.2%}')
+            print(f"  Min: {stats['min']:+.1%}")
+            print(f"  Max: {stats['max']:+.1%}")
+            print(f"  Median: {stats['median']:+.1%}")
+            print(f"  Std Dev: {stats['std']:.2%}")
 
         print('='*80)
 
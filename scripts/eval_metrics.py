@@ -9,27 +9,58 @@ Usage:
     python scripts/eval_metrics.py --input outputs/eval/baseline_vs_full.jsonl --outdir outputs/eval/metrics --verbose
 """
 
+from __future__ import annotations
+
+import csv
 import json
 import logging
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Iterable, Tuple, Optional, TYPE_CHECKING
 from collections import defaultdict
 import sys
 
 # Add helpful import error handling
+MISSING_PACKAGES_HINT = "  pip install sentence-transformers pandas matplotlib numpy"
+
 try:
     import numpy as np
     import pandas as pd
-    import matplotlib.pyplot as plt
-    from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
 except ImportError as e:
     print(f"Error: Missing required package. Please install dependencies:")
-    print(f"  pip install sentence-transformers scikit-learn pandas matplotlib numpy")
+    print(MISSING_PACKAGES_HINT)
     print(f"\nOriginal error: {e}")
     sys.exit(1)
 
+# torch, sentence-transformers and matplotlib are imported lazily so that
+# --help and argument errors return without paying their import cost
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+from _embedding_cache import EmbeddingCache
+
+# Optional: faster JSON parsing (pip install orjson); stdlib json otherwise
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional: SIMD cosine kernels (pip install simsimd); NumPy matmul otherwise
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# Optional: JIT-compiled greedy matching (pip install numba); NumPy otherwise
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging with appropriate level."""
@@ -52,18 +83,20 @@ def load_jsonl(filepath: Path) -> List[Dict[str, Any]]:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
+
+    Invalid JSON lines are logged and skipped. Lines are parsed with
+    orjson when it is installed.
     """
     records = []
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'rb') as f:
         for line_num, line in enumerate(f, start=1):
             line = line.strip()
             if not line:
                 continue
             try:
-                record = json.loads(line)
+                record = json_loads(line)
                 records.append(record)
-            except json.JSONDecodeError as e:
+            except ValueError as e:  # json/orjson decode errors subclass ValueError
                 logging.warning(f"Skipping invalid JSON at line {line_num}: {e}")
                 continue
     return records
@@ -87,8 +120,6 @@ def extract_bullets(mode_data: Dict[str, Any]) -> List[str]:
     Returns:
         List of bullet text strings
     """
-    bullets = []
-
     # Try to find bullets in different locations
     bullet_data = None
     if 'package' in mode_data and isinstance(mode_data['package'], dict):
@@ -100,26 +131,246 @@ def extract_bullets(mode_data: Dict[str, Any]) -> List[str]:
     if bullet_data is None:
         return []
 
-    # Extract text from bullet data
-    for item in bullet_data:
-        if isinstance(item, dict):
-            # Bullet is a dict with 'text' key
-            if 'text' in item:
-                bullets.append(item['text'])
-            elif 'content' in item:
-                bullets.append(item['content'])
-        elif isinstance(item, str):
-            # Bullet is already a string
-            bullets.append(item)
+    # Fast path: bullets are already strings (all() stops at the first dict)
+    if isinstance(bullet_data, list) and all(isinstance(item, str) for item in bullet_data):
+        return list(bullet_data)
+
+    # Extract text from bullet data: strings as-is, dicts by 'text' then 'content'
+    return [
+        item if isinstance(item, str) else item['text'] if 'text' in item else item['content']
+        for item in bullet_data
+        if isinstance(item, str) or (isinstance(item, dict) and ('text' in item or 'content' in item))
+    ]
+
+
+def gather_bullets(
+    records: List[Dict[str, Any]]
+) -> Tuple[List[str], List[Tuple[int, int, int, int]]]:
+    """
+    Flatten the bullets of every record into one list for batch encoding.
+
+    Args:
+        records: List of pair records
+
+    Returns:
+        Tuple of (all bullet texts, per-record offsets). Each offset is
+        (baseline_start, baseline_end, full_start, full_end) into the list;
+        records whose full bullets equal the baseline reuse its range.
+    """
+    all_texts: List[str] = []
+    offsets = []
+    for record in records:
+        baseline_bullets = extract_bullets(record.get('baseline', {}))
+        full_bullets = extract_bullets(record.get('full', {}))
+        baseline_start = len(all_texts)
+        all_texts.extend(baseline_bullets)
+        full_start = len(all_texts)
+        if full_bullets == baseline_bullets:
+            # Unchanged bullets share the baseline slice instead of re-encoding
+            offsets.append((baseline_start, full_start, baseline_start, full_start))
+            continue
+        all_texts.extend(full_bullets)
+        offsets.append((baseline_start, full_start, full_start, len(all_texts)))
+    return all_texts, offsets
+
+
+def import_pyplot():
+    """Import pyplot on the non-interactive Agg backend (file output only)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def select_device() -> str:
+    """Pick the fastest available torch device for Sentence-BERT."""
+    import torch
+
+    if torch.cuda.is_available():
+        return 'cuda'
+    mps = getattr(torch.backends, 'mps', None)
+    if mps is not None and mps.is_available():
+        return 'mps'
+    return 'cpu'
+
+
+def encode_bullets(model: SentenceTransformer, texts: List[str]) -> np.ndarray:
+    """
+    Encode bullet texts into unit-length embeddings in a single batched call.
+
+    Args:
+        model: SentenceTransformer model
+        texts: Bullet texts to encode
+
+    Returns:
+        Array of shape [len(texts) x dim]
+    """
+    import torch
+
+    with torch.inference_mode():
+        return model.encode(
+            texts,
+            batch_size=128,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+
+
+def encode_bullets_cached(
+    model: SentenceTransformer,
+    texts: List[str],
+    cache: EmbeddingCache
+) -> np.ndarray:
+    """
+    Encode bullet texts, reusing embeddings from an on-disk cache.
+
+    Only cache misses are sent to the model; new embeddings are written
+    back so later runs over the same data skip encoding entirely.
+
+    Args:
+        model: SentenceTransformer model
+        texts: Bullet texts to encode
+        cache: Embedding cache for this model
+
+    Returns:
+        Array of shape [len(texts) x dim], in the order of ``texts``
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)  # Nothing to look up or encode
+
+    cached = cache.get_many(texts)
+    misses = [i for i, vector in enumerate(cached) if vector is None]
+    if len(misses) == len(texts):
+        embeddings = encode_bullets(model, texts)
+        cache.put_many(texts, embeddings)
+        return embeddings
+
+    # Cached vectors are already unit length; fill hits and misses into
+    # one preallocated matrix instead of stacking a list of rows
+    hits = [i for i, vector in enumerate(cached) if vector is not None]
+    dim = len(cached[hits[0]])
+    embeddings = np.empty((len(texts), dim), dtype=np.float32)
+    embeddings[hits] = [cached[i] for i in hits]
+    if misses:
+        miss_texts = [texts[i] for i in misses]
+        new_embeddings = encode_bullets(model, miss_texts)
+        cache.put_many(miss_texts, new_embeddings)
+        embeddings[misses] = new_embeddings
+
+    return embeddings
+
+
+def quantize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Quantize embeddings to int8 with a per-row scale.
+
+    Cosine similarity is scale-invariant, so each row is stretched to use
+    the full [-127, 127] range; similarities stay within ~1e-3 of float32.
+
+    Args:
+        embeddings: Float embeddings of shape [n x dim]
+
+    Returns:
+        int8 array of the same shape
+    """
+    if embeddings.size == 0:
+        return embeddings.astype(np.int8)
+
+    peak = np.abs(embeddings).max(axis=1, keepdims=True)
+    scale = 127.0 / np.maximum(peak, 1e-12)
+    return np.round(embeddings * scale).astype(np.int8)
+
+
+def cosine_similarity_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Compute the cosine similarity matrix between two sets of embeddings.
+
+    Uses simsimd's SIMD cdist kernels when installed. Otherwise float
+    embeddings must be unit length and the matrix is a single matmul;
+    int8 embeddings (see quantize_embeddings) are normalized first.
+
+    Args:
+        a: Embeddings of shape [n x dim]
+        b: Embeddings of shape [m x dim]
+
+    Returns:
+        Similarity matrix of shape [n x m]
+    """
+    if simsimd is not None:
+        return 1.0 - np.asarray(simsimd.cdist(a, b, metric='cos'))
+    if a.dtype == np.int8:
+        a = a.astype(np.float32)
+        a /= np.maximum(np.linalg.norm(a, axis=1, keepdims=True), 1e-12)
+        b = b.astype(np.float32)
+        b /= np.maximum(np.linalg.norm(b, axis=1, keepdims=True), 1e-12)
+    return a @ b.T
 
-    return bullets
+
+def _greedy_match_loop(sim_matrix: np.ndarray, threshold: float) -> Tuple[int, int, int]:
+    """
+    Single-pass version of greedy_match, compiled with numba when available.
+
+    Scans each row once for its first maximum and marks qualifying columns
+    in a claimed mask, so no argmax/fancy-index/unique temporaries are built.
+    """
+    num_baseline, num_full = sim_matrix.shape
+    claimed = np.zeros(num_full, dtype=np.bool_)
+    tp = 0
+    for i in range(num_baseline):
+        best = 0
+        best_similarity = sim_matrix[i, 0]
+        for j in range(1, num_full):
+            if sim_matrix[i, j] > best_similarity:
+                best = j
+                best_similarity = sim_matrix[i, j]
+        if best_similarity >= threshold and not claimed[best]:
+            claimed[best] = True
+            tp += 1
+    return tp, num_full - tp, num_baseline - tp
+
+
+_greedy_match_numba = (
+    numba.njit(cache=True)(_greedy_match_loop) if numba is not None else None
+)
+
+
+def greedy_match(sim_matrix: np.ndarray, threshold: float) -> Tuple[int, int, int]:
+    """
+    Greedily match baseline rows to full columns of a similarity matrix.
+
+    Each baseline bullet (in order) claims its most similar full bullet if
+    the similarity is >= threshold and no earlier baseline bullet claimed
+    it. Because every row's candidate is its fixed argmax, the number of
+    matches is simply the number of distinct qualifying argmax columns.
+
+    Args:
+        sim_matrix: Similarity matrix [num_baseline x num_full]
+        threshold: Minimum similarity for a match
+
+    Returns:
+        Tuple of (tp, fp, fn)
+    """
+    if _greedy_match_numba is not None:
+        return _greedy_match_numba(np.ascontiguousarray(sim_matrix), threshold)
+
+    num_baseline, num_full = sim_matrix.shape
+    best_full = sim_matrix.argmax(axis=1)
+    best_similarity = sim_matrix[np.arange(num_baseline), best_full]
+    tp = len(np.unique(best_full[best_similarity >= threshold]))
+
+    fp = num_full - tp  # Unmatched full bullets
+    fn = num_baseline - tp  # Unmatched baseline bullets
+    return tp, fp, fn
 
 
 def compute_semantic_matching(
     baseline_bullets: List[str],
     full_bullets: List[str],
     model: Optional[SentenceTransformer],
-    threshold: float = 0.7
+    threshold: float = 0.7,
+    baseline_embeddings: Optional[np.ndarray] = None,
+    full_embeddings: Optional[np.ndarray] = None
 ) -> Dict[str, float]:
     """
     Compute semantic matching metrics between baseline and full bullets.
@@ -131,6 +382,10 @@ def compute_semantic_matching(
         full_bullets: List of full mode bullet texts
         model: SentenceTransformer model (or None to skip)
         threshold: Minimum cosine similarity for a match (0.0-1.0)
+        baseline_embeddings: Pre-computed unit-length embeddings of
+            baseline_bullets (e.g. from one batched encode_bullets() call);
+            encoded with ``model`` when omitted
+        full_embeddings: Pre-computed unit-length embeddings of full_bullets
 
     Returns:
         Dict with keys: precision, recall, f1, tp, fp, fn
@@ -170,7 +425,7 @@ def compute_semantic_matching(
         }
 
     # Now check if model is available (needed for non-empty bullets)
-    if model is None:
+    if model is None and (baseline_embeddings is None or full_embeddings is None):
         return {
             'precision': 0.0,
             'recall': 0.0,
@@ -180,32 +435,37 @@ def compute_semantic_matching(
             'fn': 0
         }
 
+    # Same bullets (possibly reordered): every bullet's best match is an
+    # identical text, which the first copy claims, so no encoding is needed
+    if threshold < 1.0 and len(baseline_bullets) == len(full_bullets) and (
+        baseline_bullets == full_bullets or sorted(baseline_bullets) == sorted(full_bullets)
+    ):
+        tp = len(set(baseline_bullets))
+        fp = len(full_bullets) - tp
+        fn = len(baseline_bullets) - tp
+        precision = tp / (tp + fp)
+        recall = tp / (tp + fn)
+        return {
+            'precision': precision,
+            'recall': recall,
+            'f1': 2 * precision * recall / (precision + recall),
+            'tp': tp,
+            'fp': fp,
+            'fn': fn
+        }
+
     try:
-        # Encode bullets
-        baseline_embeddings = model.encode(baseline_bullets, convert_to_numpy=True)
-        full_embeddings = model.encode(full_bullets, convert_to_numpy=True)
+        # Encode bullets unless embeddings were passed in
+        if baseline_embeddings is None:
+            baseline_embeddings = encode_bullets(model, baseline_bullets)
+        if full_embeddings is None:
+            full_embeddings = encode_bullets(model, full_bullets)
 
         # Compute cosine similarity matrix: [num_baseline x num_full]
-        sim_matrix = cosine_similarity(baseline_embeddings, full_embeddings)
+        sim_matrix = cosine_similarity_matrix(baseline_embeddings, full_embeddings)
 
         # Greedy 1:1 matching
-        matched_baseline = set()
-        matched_full = set()
-
-        # For each baseline bullet, find best matching full bullet
-        for baseline_idx in range(len(baseline_bullets)):
-            best_full_idx = np.argmax(sim_matrix[baseline_idx])
-            best_similarity = sim_matrix[baseline_idx, best_full_idx]
-
-            # Only match if similarity >= threshold and full bullet not already matched
-            if best_similarity >= threshold and best_full_idx not in matched_full:
-                matched_baseline.add(baseline_idx)
-                matched_full.add(best_full_idx)
-
-        # Count metrics
-        tp = len(matched_baseline)  # Successfully matched baseline bullets
-        fp = len(full_bullets) - len(matched_full)  # Unmatched full bullets
-        fn = len(baseline_bullets) - len(matched_baseline)  # Unmatched baseline bullets
+        tp, fp, fn = greedy_match(sim_matrix, threshold)
 
         # Compute precision, recall, F1
         precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
@@ -236,7 +496,8 @@ def compute_semantic_matching(
 def compute_per_pair_metrics(
     record: Dict[str, Any],
     model: Optional[SentenceTransformer],
-    threshold: float
+    threshold: float,
+    embeddings: Optional[Tuple[np.ndarray, np.ndarray]] = None
 ) -> Dict[str, Any]:
     """
     Compute all metrics for a single job-resume pair.
@@ -245,6 +506,7 @@ def compute_per_pair_metrics(
         record: Dictionary containing baseline and full mode results
         model: SentenceTransformer model for semantic matching
         threshold: Similarity threshold for matching
+        embeddings: Optional pre-computed (baseline, full) bullet embeddings
 
     Returns:
         Dictionary with all per-pair metrics
@@ -266,31 +528,42 @@ def compute_per_pair_metrics(
     full_bullets = extract_bullets(full)
 
     # Compute semantic matching
+    baseline_embeddings, full_embeddings = embeddings if embeddings is not None else (None, None)
     semantic_metrics = compute_semantic_matching(
         baseline_bullets,
         full_bullets,
         model,
-        threshold
+        threshold,
+        baseline_embeddings,
+        full_embeddings
     )
 
+    # Read each metric once into locals; deltas reuse them
+    baseline_num_bullets = baseline_metrics.get('num_bullets', 0)
+    full_num_bullets = full_metrics.get('num_bullets', 0)
+    baseline_required = baseline_metrics.get('required_skill_coverage', 0.0)
+    full_required = full_metrics.get('required_skill_coverage', 0.0)
+    baseline_nice = baseline_metrics.get('nice_to_have_skill_coverage', 0.0)
+    full_nice = full_metrics.get('nice_to_have_skill_coverage', 0.0)
+
     # Build metrics dictionary
     metrics = {
         'pair_id': pair_id,
-        'baseline_success': len(baseline_errors) == 0,
-        'full_success': len(full_errors) == 0,
+        'baseline_success': not baseline_errors,
+        'full_success': not full_errors,
         'baseline_has_cover_letter': baseline_metrics.get('has_cover_letter', False),
         'full_has_cover_letter': full_metrics.get('has_cover_letter', False),
-        'baseline_num_bullets': baseline_metrics.get('num_bullets', 0),
-        'full_num_bullets': full_metrics.get('num_bullets', 0),
-        'baseline_required_coverage': baseline_metrics.get('required_skill_coverage', 0.0),
-        'full_required_coverage': full_metrics.get('required_skill_coverage', 0.0),
-        'baseline_nice_coverage': baseline_metrics.get('nice_to_have_skill_coverage', 0.0),
-        'full_nice_coverage': full_metrics.get('nice_to_have_skill_coverage', 0.0),
+        'baseline_num_bullets': baseline_num_bullets,
+        'full_num_bullets': full_num_bullets,
+        'baseline_required_coverage': baseline_required,
+        'full_required_coverage': full_required,
+        'baseline_nice_coverage': baseline_nice,
+        'full_nice_coverage': full_nice,
         'baseline_avg_bullet_length': baseline_metrics.get('avg_bullet_length_chars', 0.0),
         'full_avg_bullet_length': full_metrics.get('avg_bullet_length_chars', 0.0),
-        'delta_num_bullets': full_metrics.get('num_bullets', 0) - baseline_metrics.get('num_bullets', 0),
-        'delta_required_coverage': round(full_metrics.get('required_skill_coverage', 0.0) - baseline_metrics.get('required_skill_coverage', 0.0), 10),
-        'delta_nice_coverage': round(full_metrics.get('nice_to_have_skill_coverage', 0.0) - baseline_metrics.get('nice_to_have_skill_coverage', 0.0), 10),
+        'delta_num_bullets': full_num_bullets - baseline_num_bullets,
+        'delta_required_coverage': round(full_required - baseline_required, 10),
+        'delta_nice_coverage': round(full_nice - baseline_nice, 10),
         'semantic_precision': semantic_metrics['precision'],
         'semantic_recall': semantic_metrics['recall'],
         'semantic_f1': semantic_metrics['f1'],
@@ -302,6 +575,75 @@ def compute_per_pair_metrics(
     return metrics
 
 
+# Column order of metrics_summary_per_pair.csv (keys of compute_per_pair_metrics)
+PER_PAIR_FIELDS = [
+    'pair_id',
+    'baseline_success',
+    'full_success',
+    'baseline_has_cover_letter',
+    'full_has_cover_letter',
+    'baseline_num_bullets',
+    'full_num_bullets',
+    'baseline_required_coverage',
+    'full_required_coverage',
+    'baseline_nice_coverage',
+    'full_nice_coverage',
+    'baseline_avg_bullet_length',
+    'full_avg_bullet_length',
+    'delta_num_bullets',
+    'delta_required_coverage',
+    'delta_nice_coverage',
+    'semantic_precision',
+    'semantic_recall',
+    'semantic_f1',
+    'semantic_tp',
+    'semantic_fp',
+    'semantic_fn'
+]
+
+
+def write_per_pair_csv(
+    rows: Iterable[Dict[str, Any]],
+    output_path: Path
+) -> Dict[str, List[Any]]:
+    """
+    Stream per-pair metric dicts to a CSV file as they are produced.
+
+    Each value is also appended to a per-column list, so the caller can
+    build the per-pair DataFrame in one call without re-reading the CSV.
+
+    Args:
+        rows: Iterable of compute_per_pair_metrics() results
+        output_path: Path to the CSV file
+
+    Returns:
+        Dict mapping each column in PER_PAIR_FIELDS to its list of values
+    """
+    columns: Dict[str, List[Any]] = {field: [] for field in PER_PAIR_FIELDS}
+    appends = [(field, columns[field].append) for field in PER_PAIR_FIELDS]
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=PER_PAIR_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            for field, append in appends:
+                append(row.get(field))
+    return columns
+
+
+# Below this many pairs, process start-up costs more than it saves
+PARALLEL_MIN_PAIRS = 256
+
+
+def _per_pair_worker(
+    record: Dict[str, Any],
+    embeddings: Optional[Tuple[np.ndarray, np.ndarray]],
+    threshold: float
+) -> Dict[str, Any]:
+    """Process-pool entry point: per-pair metrics from pre-computed embeddings."""
+    return compute_per_pair_metrics(record, None, threshold, embeddings)
+
+
 def compute_aggregate_metrics(per_pair_df: pd.DataFrame) -> pd.DataFrame:
     """
     Compute aggregate statistics across all pairs.
@@ -330,96 +672,66 @@ def compute_aggregate_metrics(per_pair_df: pd.DataFrame) -> pd.DataFrame:
         'semantic_f1'
     ]
 
-    # Compute statistics
-    stats = []
-    for metric in numeric_metrics:
-        if metric in per_pair_df.columns:
-            stats.append({
-                'metric': metric,
-                'mean': per_pair_df[metric].mean(),
-                'std': per_pair_df[metric].std(),
-                'min': per_pair_df[metric].min(),
-                'max': per_pair_df[metric].max(),
-                'median': per_pair_df[metric].median()
-            })
-
-    # Add success rates
-    if 'baseline_success' in per_pair_df.columns:
-        stats.append({
-            'metric': 'baseline_success_rate',
-            'mean': per_pair_df['baseline_success'].mean(),
-            'std': 0.0,
-            'min': 0.0,
-            'max': 1.0,
-            'median': per_pair_df['baseline_success'].median()
-        })
-
-    if 'full_success' in per_pair_df.columns:
-        stats.append({
-            'metric': 'full_success_rate',
-            'mean': per_pair_df['full_success'].mean(),
-            'std': 0.0,
-            'min': 0.0,
-            'max': 1.0,
-            'median': per_pair_df['full_success'].median()
-        })
-
-    # Add cover letter percentages
-    if 'baseline_has_cover_letter' in per_pair_df.columns:
-        stats.append({
-            'metric': 'baseline_cover_letter_pct',
-            'mean': per_pair_df['baseline_has_cover_letter'].mean(),
-            'std': 0.0,
-            'min': 0.0,
-            'max': 1.0,
-            'median': per_pair_df['baseline_has_cover_letter'].median()
-        })
-
-    if 'full_has_cover_letter' in per_pair_df.columns:
-        stats.append({
-            'metric': 'full_cover_letter_pct',
-            'mean': per_pair_df['full_has_cover_letter'].mean(),
-            'std': 0.0,
-            'min': 0.0,
-            'max': 1.0,
-            'median': per_pair_df['full_has_cover_letter'].median()
-        })
-
-    aggregate_df = pd.DataFrame(stats)
-    aggregate_df.set_index('metric', inplace=True)
+    # Rates of boolean flags: only mean and median vary, range is fixed
+    rate_metrics = {
+        'baseline_success': 'baseline_success_rate',
+        'full_success': 'full_success_rate',
+        'baseline_has_cover_letter': 'baseline_cover_letter_pct',
+        'full_has_cover_letter': 'full_cover_letter_pct'
+    }
+
+    # Compute all statistics in one pass per column group
+    numeric_cols = [m for m in numeric_metrics if m in per_pair_df.columns]
+    aggregate_df = per_pair_df[numeric_cols].agg(['mean', 'std', 'min', 'max', 'median']).T
+
+    rate_cols = [c for c in rate_metrics if c in per_pair_df.columns]
+    if rate_cols:
+        rates = per_pair_df[rate_cols].astype(float).agg(['mean', 'median']).T
+        rates = rates.rename(index=rate_metrics)
+        rates['std'] = 0.0
+        rates['min'] = 0.0
+        rates['max'] = 1.0
+        aggregate_df = pd.concat([aggregate_df, rates[aggregate_df.columns]])
+
+    aggregate_df.index.name = 'metric'
 
     return aggregate_df
 
 
-def plot_comparison_bars(
+def prepare_axes(ax=None):
+    """
+    Return (figure, axes, owns_figure) for a per-pair bar chart.
+
+    A passed-in axes is cleared and reused so several plots can share one
+    figure; otherwise a new figure is created for the caller to close.
+    """
+    if ax is not None:
+        ax.clear()
+        return ax.figure, ax, False
+    plt = import_pyplot()
+    fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
+    return fig, ax, True
+
+
+def draw_comparison_bars(
+    ax,
     per_pair_df: pd.DataFrame,
     metric_name: str,
     ylabel: str,
-    output_path: Path,
     baseline_col: str,
     full_col: str
 ) -> None:
-    """
-    Create bar chart comparing baseline vs full for a metric.
-
-    Args:
-        per_pair_df: DataFrame with per-pair metrics
-        metric_name: Name for the plot title
-        ylabel: Label for y-axis
-        output_path: Path to save PNG
-        baseline_col: Column name for baseline values
-        full_col: Column name for full values
-    """
-    fig, ax = plt.subplots(figsize=(12, 6))
-
+    """Draw grouped baseline vs full bars for a metric onto an axes."""
     x = np.arange(len(per_pair_df))
     width = 0.35
 
     baseline_vals = per_pair_df[baseline_col].values
     full_vals = per_pair_df[full_col].values
 
-    bars1 = ax.bar(x - width/2, baseline_vals, width, label='Baseline', color='#3498db', alpha=0.8)
-    bars2 = ax.bar(x + width/2, full_vals, width, label='Full (Semantic)', color='#e67e22', alpha=0.8)
+    ax.bar(x - width/2, baseline_vals, width, label='Baseline', color='#3498db', alpha=0.8,
+           rasterized=True)
+    ax.bar(x + width/2, full_vals, width, label='Full (Semantic)', color='#e67e22', alpha=0.8,
+           rasterized=True)
 
     ax.set_xlabel('Pair ID', fontsize=12)
     ax.set_ylabel(ylabel, fontsize=12)
@@ -429,16 +741,68 @@ def plot_comparison_bars(
     ax.legend(fontsize=11)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+
+def draw_single_metric(
+    ax,
+    per_pair_df: pd.DataFrame,
+    metric_col: str,
+    ylabel: str
+) -> None:
+    """Draw per-pair bars for a 0-1 metric, colored by quality band, onto an axes."""
+    x = np.arange(len(per_pair_df))
+    values = per_pair_df[metric_col].values
+
+    # Color bars based on value (green=good, yellow=medium, red=low)
+    colors = np.where(values >= 0.7, '#2ecc71', np.where(values >= 0.5, '#f39c12', '#e74c3c'))
+    ax.bar(x, values, color=colors, edgecolor=colors, alpha=0.8, linewidth=0.5, rasterized=True)
+
+    ax.set_xlabel('Pair ID', fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_title(f'{ylabel} per Pair', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(per_pair_df['pair_id'].values, rotation=45, ha='right', fontsize=9)
+    ax.set_ylim(0, 1.0)
+    ax.axhline(y=0.7, color='gray', linestyle='--', linewidth=1, alpha=0.5, label='Good threshold (0.7)')
+    ax.axhline(y=0.5, color='gray', linestyle=':', linewidth=1, alpha=0.5, label='Medium threshold (0.5)')
+    ax.legend(fontsize=10)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+
+def plot_comparison_bars(
+    per_pair_df: pd.DataFrame,
+    metric_name: str,
+    ylabel: str,
+    output_path: Path,
+    baseline_col: str,
+    full_col: str,
+    ax=None
+) -> None:
+    """
+    Create bar chart comparing baseline vs full for a metric.
+
+    Args:
+        per_pair_df: DataFrame with per-pair metrics
+        metric_name: Name for the plot title
+        ylabel: Label for y-axis
+        output_path: Path to save PNG
+        baseline_col: Column name for baseline values
+        full_col: Column name for full values
+        ax: Optional axes to clear and draw on (reused across plots)
+    """
+    fig, ax, owns_figure = prepare_axes(ax)
+    draw_comparison_bars(ax, per_pair_df, metric_name, ylabel, baseline_col, full_col)
+
+    fig.savefig(output_path, dpi=100)
+    if owns_figure:
+        import_pyplot().close(fig)
 
 
 def plot_single_metric(
     per_pair_df: pd.DataFrame,
     metric_col: str,
     ylabel: str,
-    output_path: Path
+    output_path: Path,
+    ax=None
 ) -> None:
     """
     Create bar chart for a single metric per pair.
@@ -448,37 +812,53 @@ def plot_single_metric(
         metric_col: Column name for the metric
         ylabel: Label for y-axis
         output_path: Path to save PNG
+        ax: Optional axes to clear and draw on (reused across plots)
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax, owns_figure = prepare_axes(ax)
+    draw_single_metric(ax, per_pair_df, metric_col, ylabel)
 
-    x = np.arange(len(per_pair_df))
-    values = per_pair_df[metric_col].values
+    fig.savefig(output_path, dpi=100)
+    if owns_figure:
+        import_pyplot().close(fig)
 
-    bars = ax.bar(x, values, color='#2ecc71', alpha=0.8, edgecolor='black', linewidth=0.5)
 
-    # Color bars based on value (green=good, yellow=medium, red=low)
-    for i, (bar, val) in enumerate(zip(bars, values)):
-        if val >= 0.7:
-            bar.set_color('#2ecc71')  # Green
-        elif val >= 0.5:
-            bar.set_color('#f39c12')  # Orange
-        else:
-            bar.set_color('#e74c3c')  # Red
+def plot_all_in_one(
+    per_pair_df: pd.DataFrame,
+    output_path: Path,
+    include_f1: bool
+) -> None:
+    """
+    Draw all per-pair charts as one stacked figure and save a single PNG.
 
-    ax.set_xlabel('Pair ID', fontsize=12)
-    ax.set_ylabel(ylabel, fontsize=12)
-    ax.set_title(f'{ylabel} per Pair', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(per_pair_df['pair_id'].values, rotation=45, ha='right', fontsize=9)
-    ax.set_ylim(0, 1.0)
-    ax.axhline(y=0.7, color='gray', linestyle='--', linewidth=1, alpha=0.5, label='Good threshold (0.7)')
-    ax.axhline(y=0.5, color='gray', linestyle=':', linewidth=1, alpha=0.5, label='Medium threshold (0.5)')
-    ax.legend(fontsize=10)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    Args:
+        per_pair_df: DataFrame with per-pair metrics
+        output_path: Path to save PNG
+        include_f1: Whether to add the semantic F1 panel
+    """
+    plt = import_pyplot()
+    num_panels = 3 if include_f1 else 2
+    fig, axes = plt.subplots(
+        num_panels, 1, figsize=(12, 4.5 * num_panels + 0.5), sharex=True, layout='constrained'
+    )
+
+    draw_comparison_bars(
+        axes[0], per_pair_df, "Number of Bullets", "Number of Bullets",
+        "baseline_num_bullets", "full_num_bullets"
+    )
+    draw_comparison_bars(
+        axes[1], per_pair_df, "Required Skill Coverage", "Required Skill Coverage (0.0-1.0)",
+        "baseline_required_coverage", "full_required_coverage"
+    )
+    if include_f1:
+        draw_single_metric(axes[2], per_pair_df, "semantic_f1", "Semantic F1 Score")
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    # Pair IDs are only labelled on the bottom panel
+    for ax in axes[:-1]:
+        ax.set_xlabel('')
+        ax.tick_params(axis='x', labelbottom=False)
+
+    fig.savefig(output_path, dpi=100)
+    plt.close(fig)
 
 
 def main() -> None:
@@ -504,12 +884,45 @@ def main() -> None:
         default="all-MiniLM-L6-v2",
         help="Sentence-BERT model name"
     )
+    parser.add_argument(
+        "--device",
+        type=str,
+        default=None,
+        help="Torch device for Sentence-BERT (default: cuda, then mps, then cpu)"
+    )
     parser.add_argument(
         "--match_threshold",
         type=float,
         default=0.7,
         help="Similarity threshold for semantic matching (0.0-1.0)"
     )
+    parser.add_argument(
+        "--embedding_cache_dir",
+        type=Path,
+        default=None,
+        help="Directory for the on-disk embedding cache (default: <outdir>/.embcache)"
+    )
+    parser.add_argument(
+        "--no_embedding_cache",
+        action="store_true",
+        help="Always re-encode bullets instead of using the embedding cache"
+    )
+    parser.add_argument(
+        "--quantize_int8",
+        action="store_true",
+        help="Quantize bullet embeddings to int8 before matching (faster, ~1e-3 similarity error)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for per-pair metrics on large inputs (default: CPU count)"
+    )
+    parser.add_argument(
+        "--combined_plot",
+        action="store_true",
+        help="Save all per-pair charts as one per_pair_overview.png instead of one PNG each"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -526,6 +939,17 @@ def main() -> None:
         logger.error(f"Input file not found: {args.input}")
         sys.exit(1)
 
+    # Heavy dependencies are only imported once the arguments are valid
+    try:
+        import torch  # noqa: F401
+        import matplotlib  # noqa: F401
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        print(f"Error: Missing required package. Please install dependencies:")
+        print(MISSING_PACKAGES_HINT)
+        print(f"\nOriginal error: {e}")
+        sys.exit(1)
+
     # Create output directory
     args.outdir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Output directory: {args.outdir}")
@@ -539,32 +963,76 @@ def main() -> None:
         logger.error("No records found in input file")
         sys.exit(1)
 
-    # Load Sentence-BERT model (with fallback)
-    logger.info(f"Loading Sentence-BERT model: {args.sbert_model}")
+    # Load Sentence-BERT model once (with fallback); it is reused for all pairs
+    device = args.device or select_device()
+    logger.info(f"Loading Sentence-BERT model: {args.sbert_model} (device: {device})")
     model = None
     try:
-        model = SentenceTransformer(args.sbert_model)
+        model = SentenceTransformer(args.sbert_model, device=device)
         logger.info("Model loaded successfully")
     except Exception as e:
         logger.error(f"Failed to load SBERT model: {e}")
         logger.warning("Continuing without semantic matching metrics...")
 
-    # Compute per-pair metrics
-    logger.info("Computing per-pair metrics...")
-    per_pair_metrics = []
-    for i, record in enumerate(records, start=1):
-        if args.verbose:
-            logger.debug(f"Processing pair {i}/{len(records)}: {record.get('pair_id', 'unknown')}")
-        metrics = compute_per_pair_metrics(record, model, args.match_threshold)
-        per_pair_metrics.append(metrics)
-
-    per_pair_df = pd.DataFrame(per_pair_metrics)
+    # Encode every bullet of every pair in one batched call
+    embeddings = None
+    offsets: List[Tuple[int, int, int, int]] = []
+    if model is not None:
+        all_texts, offsets = gather_bullets(records)
 
-    # Save per-pair CSV
+        # Bullets repeat across pairs and modes; encode each distinct text once
+        unique_texts = list(dict.fromkeys(all_texts))
+        logger.info(f"Encoding {len(unique_texts)} unique bullets ({len(all_texts)} total)...")
+        if args.no_embedding_cache:
+            unique_embeddings = encode_bullets(model, unique_texts)
+        else:
+            cache_dir = args.embedding_cache_dir or args.outdir / ".embcache"
+            with EmbeddingCache(cache_dir, args.sbert_model) as cache:
+                unique_embeddings = encode_bullets_cached(model, unique_texts, cache)
+        if args.quantize_int8:
+            unique_embeddings = quantize_embeddings(unique_embeddings)
+
+        text_index = {text: i for i, text in enumerate(unique_texts)}
+        embeddings = unique_embeddings[[text_index[text] for text in all_texts]]
+
+    # Slice each pair's embeddings out of the batched matrix
+    if embeddings is not None:
+        pair_embeddings = [
+            (embeddings[b_start:b_end], embeddings[f_start:f_end])
+            for b_start, b_end, f_start, f_end in offsets
+        ]
+    else:
+        pair_embeddings = [None] * len(records)
+
+    # Compute per-pair metrics, streaming each row to the per-pair CSV
+    logger.info("Computing per-pair metrics...")
     per_pair_csv = args.outdir / "metrics_summary_per_pair.csv"
-    per_pair_df.to_csv(per_pair_csv, index=False)
+    if args.workers > 1 and len(records) >= PARALLEL_MIN_PAIRS:
+        # Workers only do matching and dict assembly, so the model is never pickled
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            per_pair_columns = write_per_pair_csv(
+                pool.map(
+                    _per_pair_worker,
+                    records,
+                    pair_embeddings,
+                    repeat(args.match_threshold),
+                    chunksize=8
+                ),
+                per_pair_csv
+            )
+    else:
+        def iter_per_pair_metrics():
+            for i, (record, embedding_pair) in enumerate(zip(records, pair_embeddings), start=1):
+                if args.verbose:
+                    logger.debug(f"Processing pair {i}/{len(records)}: {record.get('pair_id', 'unknown')}")
+                yield compute_per_pair_metrics(record, model, args.match_threshold, embedding_pair)
+
+        per_pair_columns = write_per_pair_csv(iter_per_pair_metrics(), per_pair_csv)
     logger.info(f"Saved per-pair metrics: {per_pair_csv}")
 
+    # Aggregates and plots work on a column-oriented DataFrame built in one call
+    per_pair_df = pd.DataFrame(per_pair_columns)
+
     # Compute aggregate metrics
     logger.info("Computing aggregate metrics...")
     aggregate_df = compute_aggregate_metrics(per_pair_df)
@@ -574,37 +1042,48 @@ def main() -> None:
     aggregate_df.to_csv(aggregate_csv, index=True)
     logger.info(f"Saved aggregate metrics: {aggregate_csv}")
 
-    # Generate plots
+    # Generate plots: one stacked PNG, or one PNG per chart sharing a figure
     logger.info("Generating plots...")
+    if args.combined_plot:
+        plot_all_in_one(per_pair_df, args.outdir / "per_pair_overview.png", model is not None)
+        logger.info("Generated per_pair_overview.png")
+    else:
+        plt = import_pyplot()
+        fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
+
+        plot_comparison_bars(
+            per_pair_df,
+            "Number of Bullets",
+            "Number of Bullets",
+            args.outdir / "num_bullets_per_pair.png",
+            "baseline_num_bullets",
+            "full_num_bullets",
+            ax=ax
+        )
+        logger.info("Generated num_bullets_per_pair.png")
 
-    plot_comparison_bars(
-        per_pair_df,
-        "Number of Bullets",
-        "Number of Bullets",
-        args.outdir / "num_bullets_per_pair.png",
-        "baseline_num_bullets",
-        "full_num_bullets"
-    )
-    logger.info("Generated num_bullets_per_pair.png")
-
-    plot_comparison_bars(
-        per_pair_df,
-        "Required Skill Coverage",
-        "Required Skill Coverage (0.0-1.0)",
-        args.outdir / "req_skill_coverage_per_pair.png",
-        "baseline_required_coverage",
-        "full_required_coverage"
-    )
-    logger.info("Generated req_skill_coverage_per_pair.png")
-
-    if model is not None:
-        plot_single_metric(
+        plot_comparison_bars(
             per_pair_df,
-            "semantic_f1",
-            "Semantic F1 Score",
-            args.outdir / "semantic_f1_per_pair.png"
+            "Required Skill Coverage",
+            "Required Skill Coverage (0.0-1.0)",
+            args.outdir / "req_skill_coverage_per_pair.png",
+            "baseline_required_coverage",
+            "full_required_coverage",
+            ax=ax
         )
-        logger.info("Generated semantic_f1_per_pair.png")
+        logger.info("Generated req_skill_coverage_per_pair.png")
+
+        if model is not None:
+            plot_single_metric(
+                per_pair_df,
+                "semantic_f1",
+                "Semantic F1 Score",
+                args.outdir / "semantic_f1_per_pair.png",
+                ax=ax
+            )
+            logger.info("Generated semantic_f1_per_pair.png")
+
+        plt.close(fig)
 
     logger.info("=" * 60)
     logger.info("EVALUATION COMPLETE")
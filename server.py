@@ -10,15 +10,37 @@ import os
 import json
 import yaml
 import asyncio
+import hashlib
 import logging
+import traceback
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Any, Callable, Optional
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+# Optional: faster JSON parsing and response rendering (pip install orjson)
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    json_dumps = orjson.dumps
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    DefaultResponse = JSONResponse
+
+# libyaml-backed loader when PyYAML was built with it; pure-Python SafeLoader otherwise
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,25 +50,41 @@ logger = logging.getLogger(__name__)
 
 # AutoResuAgent imports
 from src.llm import OpenAILLMClient
-from src.embeddings import SentenceBertEncoder
+from src.embeddings import SentenceBertEncoder, ResumeFaissIndex
+from src.embeddings.sentence_bert import configure_cpu_threads, detect_device
 from src.agent import AgentExecutor
 from src.parsers import DataParser
-from src.models import load_job_from_yaml, load_resume_from_json
+from src.generation_cache import GenerationCache
+from src.models import JobDescription, CandidateProfile
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and close the generation cache on shutdown."""
+    await startup_event()
+    yield
+    await shutdown_event()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="AutoResuAgent API",
     description="API for parsing and generating tailored resumes",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
-# CORS middleware - allow all origins for development
+# CORS middleware - origins from CORS_ORIGINS (comma-separated), defaulting to
+# the frontend dev server / docker-compose port. The frontend sends no cookies,
+# so credentials stay off; max_age lets browsers cache preflights for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
-    allow_credentials=True,
+    allow_origins=os.getenv("CORS_ORIGINS", "http://localhost:3000").split(","),
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 # Global state for LLM and encoder (initialized on startup)
@@ -54,6 +92,28 @@ llm_client: Optional[OpenAILLMClient] = None
 encoder: Optional[SentenceBertEncoder] = None
 parser: Optional[DataParser] = None
 
+# Set AUTORESUAGENT_ONNX_ENCODER=1 on CPU-only hosts to run Sentence-BERT as an
+# int8-quantized ONNX model (requires sentence-transformers[onnx])
+USE_ONNX_ENCODER = os.getenv("AUTORESUAGENT_ONNX_ENCODER", "").lower() in ("1", "true", "yes")
+
+# Successful /generate responses are cached by hash(job, resume); set REDIS_URL to
+# share the cache across workers, otherwise it is kept in process
+generation_cache: Optional[GenerationCache] = None
+
+# FAISS indexes of resume bullets, reused when the same resume is tailored to
+# several jobs (LRU keyed by a hash of the resume JSON)
+FAISS_CACHE_MAX_ENTRIES = 256
+faiss_cache: "OrderedDict[str, ResumeFaissIndex]" = OrderedDict()
+
+# Set AUTORESUAGENT_SAVE_INPUTS=1 to keep each /generate job/resume in data/temp for debugging
+SAVE_INPUTS = os.getenv("AUTORESUAGENT_SAVE_INPUTS", "").lower() in ("1", "true", "yes")
+# Strong references to fire-and-forget debug writes so they are not garbage collected
+background_tasks: set[asyncio.Task] = set()
+
+
+# GenerateResponse fields streamed by /generate/stream, in typical completion order
+STREAM_EVENTS = ("bullets", "cover_letter", "resume_latex", "cover_letter_latex", "change_summary")
+
 
 # Request/Response Models
 class ParseJobRequest(BaseModel):
@@ -95,11 +155,10 @@ class GenerateResponse(BaseModel):
     candidate_id: Optional[str] = None
 
 
-# Startup event - initialize LLM and encoder
-@app.on_event("startup")
+# Startup - initialize LLM and encoder (called from lifespan)
 async def startup_event():
     """Initialize LLM client and encoder on server startup."""
-    global llm_client, encoder, parser
+    global llm_client, encoder, parser, generation_cache
 
     logger.info("=" * 60)
     logger.info("Starting AutoResuAgent API Server")
@@ -125,19 +184,37 @@ async def startup_event():
     logger.info(f"✅ LLM client initialized: {llm_client.model}")
 
     logger.info("Initializing SentenceBERT encoder...")
-    # Initialize SentenceBERT encoder
-    encoder = SentenceBertEncoder()
-    logger.info(f"✅ Encoder initialized: {encoder.model_name}")
+    # Size torch's thread pools before anything imports torch (device
+    # detection does); containers often misreport the usable core count
+    num_threads = configure_cpu_threads()
+    logger.info(f"Torch CPU threads: {num_threads}")
+    # Initialize SentenceBERT encoder on the best available device and warm it
+    # up so the first /generate request does not pay model load / CUDA init
+    encoder = SentenceBertEncoder(device=detect_device(), use_onnx=USE_ONNX_ENCODER)
+    encoder.warmup()
+    logger.info(
+        f"✅ Encoder initialized: {encoder.model_name} on {encoder.device} ({encoder.backend})"
+    )
 
     # Initialize parser
     parser = DataParser(llm_client)
     logger.info("✅ DataParser initialized")
 
+    generation_cache = GenerationCache(redis_url=os.getenv("REDIS_URL"))
+    logger.info(f"✅ Generation cache initialized ({generation_cache.backend})")
+
     logger.info("=" * 60)
     logger.info("Server ready! Listening for requests...")
     logger.info("=" * 60)
 
 
+# Shutdown - release the generation cache (called from lifespan)
+async def shutdown_event():
+    """Close the cache before the server exits."""
+    if generation_cache is not None:
+        await generation_cache.close()
+
+
 # Health check endpoint
 @app.get("/")
 async def root():
@@ -162,6 +239,7 @@ async def parse_job(request: ParseJobRequest):
         raise HTTPException(status_code=503, detail="Parser not initialized")
 
     try:
+        # Parsed on its own: a prompt never mixes documents from different clients
         yaml_content = await parser.parse_raw_job(request.raw_text)
         return ParseJobResponse(yaml_content=yaml_content)
     except Exception as e:
@@ -184,6 +262,7 @@ async def parse_resume(request: ParseResumeRequest):
         raise HTTPException(status_code=503, detail="Parser not initialized")
 
     try:
+        # Parsed on its own: a prompt never mixes documents from different clients
         json_content = await parser.parse_raw_resume(request.raw_text)
         return ParseResumeResponse(json_content=json_content)
     except Exception as e:
@@ -193,212 +272,321 @@ async def parse_resume(request: ParseResumeRequest):
         )
 
 
-# Generate tailored resume endpoint
-@app.post("/generate", response_model=GenerateResponse)
-async def generate_resume(request: GenerateRequest):
+def save_inputs(request_key: str, job_yaml_content: str, resume_json_content: str) -> None:
+    """Write a /generate request's job and resume to data/temp for debugging."""
+    temp_dir = Path("data/temp")
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    job_path = temp_dir / f"job_{request_key}.yaml"
+    with open(job_path, "w", encoding="utf-8") as f:
+        f.write(job_yaml_content)
+    logger.info(f"💾 Job saved to {job_path}")
+
+    resume_path = temp_dir / f"resume_{request_key}.json"
+    with open(resume_path, "w", encoding="utf-8") as f:
+        f.write(resume_json_content)
+    logger.info(f"💾 Resume saved to {resume_path}")
+
+
+def finish_background_task(task: asyncio.Task) -> None:
+    """Drop a finished background task and log its failure, if any."""
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background task failed: {task.exception()}")
+
+
+async def get_resume_index(resume, resume_json_content: str) -> ResumeFaissIndex:
     """
-    Generate tailored resume from structured job and resume data.
+    Return the FAISS index for a resume, building and caching it on a miss.
 
-    Accepts YAML job description and JSON resume, saves them to temp files,
-    runs the agent executor, and returns the generated content.
+    The build (Sentence-BERT encode + FAISS add) runs on the encoder's worker
+    thread so it does not block the event loop.
     """
-    if not llm_client or not encoder:
-        raise HTTPException(status_code=503, detail="Services not initialized")
+    key = hashlib.blake2b(resume_json_content.encode("utf-8"), digest_size=16).hexdigest()
+    index = faiss_cache.get(key)
+    if index is not None:
+        faiss_cache.move_to_end(key)
+        logger.info(f"♻️  Reusing FAISS index for resume ({len(index)} bullets)")
+        return index
+
+    index = ResumeFaissIndex(encoder)
+    await encoder.run_async(index.build_from_experiences, resume.experiences, resume.projects)
+    faiss_cache[key] = index
+    while len(faiss_cache) > FAISS_CACHE_MAX_ENTRIES:
+        faiss_cache.popitem(last=False)
+    return index
+
+
+def format_bullets(bullets) -> list[dict]:
+    """Convert generated bullets to response dicts."""
+    if not bullets:
+        return []
+    # source_project_id is not a field of every bullet schema; check the class once
+    has_project_id = "source_project_id" in type(bullets[0]).model_fields
+    return [
+        {
+            "id": bullet.id,
+            "text": bullet.text,
+            "responsibility_id": bullet.responsibility_id,
+            "source_experience_id": bullet.source_experience_id,
+            "source_project_id": bullet.source_project_id if has_project_id else None
+        }
+        for bullet in bullets
+    ]
+
+
+async def load_generation_inputs(
+    request: GenerateRequest,
+    request_key: str
+) -> tuple[JobDescription, CandidateProfile, str]:
+    """
+    Parse and validate the job and resume of a /generate request.
 
-    # Create temp directory if it doesn't exist
-    temp_dir = Path("data/temp")
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    Structured YAML/JSON is used as-is; raw text is converted by the LLM parser.
+    Raises HTTPException (400/503) on bad input. request_key (the request's
+    content hash) names the debug copies written when SAVE_INPUTS is set.
 
-    # Generate unique filenames with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    job_path = temp_dir / f"job_{timestamp}.yaml"
-    resume_path = temp_dir / f"resume_{timestamp}.json"
+    Returns:
+        Tuple of (job, resume, resume JSON text)
+    """
+    # Smart parsing: Try structured format first, fallback to raw text parsing
 
+    # --- Process Job Data ---
+    logger.info("📄 Processing job data...")
+    job_yaml_content = request.job_yaml
     try:
-        logger.info("=" * 60)
-        logger.info(f"🚀 Starting resume generation (timestamp: {timestamp})")
-        logger.info("=" * 60)
-
-        # Smart parsing: Try structured format first, fallback to raw text parsing
-
-        # --- Process Job Data ---
-        logger.info("📄 Processing job data...")
-        job_yaml_content = request.job_yaml
-        try:
-            # Try parsing as structured YAML
-            job_data = yaml.safe_load(request.job_yaml)
-            # If it's valid YAML but just a string (raw text), it needs parsing
-            if isinstance(job_data, str):
-                raise yaml.YAMLError("Content is plain text, not structured YAML")
-            logger.info("✅ Job data is valid YAML")
-        except yaml.YAMLError:
-            # Failed to parse as YAML - assume it's raw text
-            logger.info("⚠️  Job data is raw text, parsing with LLM...")
-            # Use DataParser to convert raw text to structured YAML
-            if not parser:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Parser not initialized for raw text conversion"
-                )
-            try:
-                job_yaml_content = await parser.parse_raw_job(request.job_yaml)
-                logger.info("✅ Job data parsed successfully")
-            except Exception as e:
-                logger.error(f"❌ Job parsing failed: {e}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to parse job text (raw or YAML): {str(e)}"
-                )
-
-        # Save job YAML
-        with open(job_path, "w", encoding="utf-8") as f:
-            f.write(job_yaml_content)
-        logger.info(f"💾 Job saved to {job_path}")
-
-        # --- Process Resume Data ---
-        logger.info("📄 Processing resume data...")
-        resume_json_content = request.resume_json
+        # Try parsing as structured YAML
+        job_data = yaml.load(request.job_yaml, Loader=YamlSafeLoader)
+        # If it's valid YAML but just a string (raw text), it needs parsing
+        if isinstance(job_data, str):
+            raise yaml.YAMLError("Content is plain text, not structured YAML")
+        logger.info("✅ Job data is valid YAML")
+    except yaml.YAMLError:
+        # Failed to parse as YAML - assume it's raw text
+        logger.info("⚠️  Job data is raw text, parsing with LLM...")
+        # Use DataParser to convert raw text to structured YAML
+        if not parser:
+            raise HTTPException(
+                status_code=503,
+                detail="Parser not initialized for raw text conversion"
+            )
         try:
-            # Try parsing as structured JSON
-            resume_data = json.loads(request.resume_json)
-            logger.info("✅ Resume data is valid JSON")
-        except json.JSONDecodeError:
-            # Failed to parse as JSON - assume it's raw text
-            logger.info("⚠️  Resume data is raw text, parsing with LLM...")
-            # Use DataParser to convert raw text to structured JSON
-            if not parser:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Parser not initialized for raw text conversion"
-                )
-            try:
-                resume_json_content = await parser.parse_raw_resume(request.resume_json)
-                logger.info("✅ Resume data parsed successfully")
-            except Exception as e:
-                logger.error(f"❌ Resume parsing failed: {e}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to parse resume text (raw or JSON): {str(e)}"
-                )
-
-        # Save resume JSON
-        with open(resume_path, "w", encoding="utf-8") as f:
-            f.write(resume_json_content)
-        logger.info(f"💾 Resume saved to {resume_path}")
-
-        # Load and validate using Pydantic models
-        logger.info("🔍 Validating data against Pydantic schemas...")
+            job_yaml_content = await parser.parse_raw_job(request.job_yaml)
+            job_data = yaml.load(job_yaml_content, Loader=YamlSafeLoader)
+            logger.info("✅ Job data parsed successfully")
+        except Exception as e:
+            logger.error(f"❌ Job parsing failed: {e}")
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to parse job text (raw or YAML): {str(e)}"
+            )
+
+    # --- Process Resume Data ---
+    logger.info("📄 Processing resume data...")
+    resume_json_content = request.resume_json
+    try:
+        # Try parsing as structured JSON
+        resume_data = json_loads(request.resume_json)
+        logger.info("✅ Resume data is valid JSON")
+    except json.JSONDecodeError:
+        # Failed to parse as JSON - assume it's raw text
+        logger.info("⚠️  Resume data is raw text, parsing with LLM...")
+        # Use DataParser to convert raw text to structured JSON
+        if not parser:
+            raise HTTPException(
+                status_code=503,
+                detail="Parser not initialized for raw text conversion"
+            )
         try:
-            job = load_job_from_yaml(job_path)
-            resume = load_resume_from_json(resume_path)
-            logger.info(f"✅ Schemas validated: Job='{job.title}' at {job.company}, Candidate='{resume.name}'")
+            resume_json_content = await parser.parse_raw_resume(request.resume_json)
+            resume_data = json_loads(resume_json_content)
+            logger.info("✅ Resume data parsed successfully")
         except Exception as e:
-            logger.error(f"❌ Schema validation failed: {e}")
+            logger.error(f"❌ Resume parsing failed: {e}")
             raise HTTPException(
                 status_code=400,
-                detail=f"Schema validation failed: {str(e)}"
+                detail=f"Failed to parse resume text (raw or JSON): {str(e)}"
             )
 
-        # Run agent executor
-        logger.info("🤖 Initializing AgentExecutor...")
-        executor = AgentExecutor(
-            llm=llm_client,
-            encoder=encoder,
-            max_retries=2  # Reduce retries for faster web response
+    if SAVE_INPUTS:
+        # Written in a worker thread; the response does not wait on disk I/O
+        task = asyncio.create_task(
+            asyncio.to_thread(save_inputs, request_key, job_yaml_content, resume_json_content)
         )
-        logger.info("✅ AgentExecutor initialized")
-
-        logger.info("🎯 Running full generation pipeline (this may take 30-60 seconds)...")
-        logger.info("   Step 1: Building FAISS index from resume experiences...")
-        logger.info("   Step 2: Retrieving relevant experiences for job...")
-        logger.info("   Step 3: Generating tailored bullets with validation...")
-        logger.info("   Step 4: Generating cover letter...")
-
-        package, errors, metrics = await executor.run_single_job(
-            job_path=job_path,
-            resume_path=resume_path,
-            mode="full"
+        background_tasks.add(task)
+        task.add_done_callback(finish_background_task)
+
+    # Validate the parsed data using Pydantic models (no disk round-trip)
+    logger.info("🔍 Validating data against Pydantic schemas...")
+    try:
+        job = JobDescription.model_validate(job_data)
+        resume = CandidateProfile.model_validate(resume_data)
+        logger.info(f"✅ Schemas validated: Job='{job.title}' at {job.company}, Candidate='{resume.name}'")
+    except Exception as e:
+        logger.error(f"❌ Schema validation failed: {e}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Schema validation failed: {str(e)}"
         )
 
-        if not package:
-            logger.error("❌ Generation failed - no package returned")
-            return GenerateResponse(
-                success=False,
-                errors=errors or ["Generation failed"]
-            )
+    return job, resume, resume_json_content
 
-        logger.info(f"✅ Generation complete! Generated {len(package.bullets)} bullets")
-
-        # Format bullets for response
-        bullets_data = [
-            {
-                "id": bullet.id,
-                "text": bullet.text,
-                "responsibility_id": bullet.responsibility_id,
-                "source_experience_id": bullet.source_experience_id,
-                "source_project_id": getattr(bullet, 'source_project_id', None)
-            }
-            for bullet in package.bullets
-        ]
-
-        # === NEW FEATURE 1: Generate LaTeX Output ===
-        logger.info("📝 Generating LaTeX resume...")
-        try:
-            resume_latex = await parser.generate_resume_latex(
-                candidate_data=resume.dict(),
-                tailored_bullets=bullets_data,
-                job_title=job.title,
-                company=job.company or "Target Company"
-            )
-            logger.info(f"✅ Resume LaTeX generated ({len(resume_latex)} chars)")
-        except Exception as e:
-            logger.warning(f"⚠️  LaTeX resume generation failed: {e}")
-            resume_latex = None
 
-        logger.info("📝 Generating LaTeX cover letter...")
-        try:
-            cover_letter_latex = await parser.generate_cover_letter_latex(
-                cover_letter_text=package.cover_letter.text,
-                candidate_name=resume.name,
-                candidate_email=str(resume.email),
-                candidate_phone=resume.phone or "N/A",
-                job_title=job.title,
-                company=job.company or "Target Company"
-            )
-            logger.info(f"✅ Cover letter LaTeX generated ({len(cover_letter_latex)} chars)")
-        except Exception as e:
-            logger.warning(f"⚠️  LaTeX cover letter generation failed: {e}")
-            cover_letter_latex = None
+async def run_generation(
+    job: JobDescription,
+    resume: CandidateProfile,
+    resume_json_content: str,
+    emit: Optional[Callable[[str, Any], None]] = None
+) -> dict:
+    """
+    Run the agent pipeline and post-generation steps for one job/resume pair.
+
+    Args:
+        job: Validated job description
+        resume: Validated resume
+        resume_json_content: Resume JSON text (FAISS index cache key)
+        emit: Optional callback(event, data), called as each output is ready
+
+    Returns:
+        GenerateResponse payload dict
+    """
+    # Serialize the validated models once; the post-generation steps share these dicts
+    candidate_data = resume.model_dump()
+    job_description = job.model_dump()
+
+    # Run agent executor
+    logger.info("🤖 Initializing AgentExecutor...")
+    executor = AgentExecutor(
+        llm=llm_client,
+        encoder=encoder,
+        max_retries=2  # Reduce retries for faster web response
+    )
+    logger.info("✅ AgentExecutor initialized")
+
+    logger.info("🎯 Running full generation pipeline (this may take 30-60 seconds)...")
+    logger.info("   Step 1: Building FAISS index from resume experiences...")
+    logger.info("   Step 2: Retrieving relevant experiences for job...")
+    logger.info("   Step 3: Generating tailored bullets with validation...")
+    logger.info("   Step 4: Generating cover letter...")
+
+    try:
+        index = await get_resume_index(resume, resume_json_content)
+    except ValueError:
+        index = None  # No bullets to index; the executor reports the error
+    package, errors, metrics = await executor.run_single_job(
+        job=job,
+        resume=resume,
+        mode="full",
+        index=index,
+        on_bullets=(lambda bullets: emit("bullets", format_bullets(bullets))) if emit else None
+    )
 
-        # === NEW FEATURE 2: Generate Change Summary ===
-        logger.info("📊 Generating change summary (semantic diff)...")
+    if not package:
+        logger.error("❌ Generation failed - no package returned")
+        return GenerateResponse(
+            success=False,
+            errors=errors or ["Generation failed"]
+        ).model_dump()
+
+    logger.info(f"✅ Generation complete! Generated {len(package.bullets)} bullets")
+    if emit:
+        emit("cover_letter", package.cover_letter.text)
+
+    # Format bullets for response
+    bullets_data = format_bullets(package.bullets)
+
+    async def finish(event: str, label: str, coro) -> Optional[str]:
+        # A failed output is dropped from the response, not fatal
         try:
-            change_summary = await parser.generate_change_summary(
-                original_resume_data=resume.dict(),
-                tailored_bullets=bullets_data,
-                job_description=job.dict()
-            )
-            logger.info(f"✅ Change summary generated")
-            logger.info(f"Summary preview:\n{change_summary[:200]}...")
+            result = await coro
         except Exception as e:
-            logger.warning(f"⚠️  Change summary generation failed: {e}")
-            change_summary = None
+            logger.warning(f"⚠️  {label} generation failed: {e}")
+            result = None
+        else:
+            logger.info(f"✅ {label} generated ({len(result)} chars)")
+        if emit:
+            emit(event, result)
+        return result
+
+    # === NEW FEATURES: LaTeX resume, LaTeX cover letter, change summary ===
+    # The three outputs are independent LLM calls, so run them concurrently
+    logger.info("📝 Generating LaTeX resume, LaTeX cover letter and change summary...")
+    company = job.company or "Target Company"
+    resume_latex, cover_letter_latex, change_summary = await asyncio.gather(
+        finish("resume_latex", "Resume LaTeX", parser.generate_resume_latex(
+            candidate_data=candidate_data,
+            tailored_bullets=bullets_data,
+            job_title=job.title,
+            company=company
+        )),
+        finish("cover_letter_latex", "Cover letter LaTeX", parser.generate_cover_letter_latex(
+            cover_letter_text=package.cover_letter.text,
+            candidate_name=resume.name,
+            candidate_email=str(resume.email),
+            candidate_phone=resume.phone or "N/A",
+            job_title=job.title,
+            company=company
+        )),
+        finish("change_summary", "Change summary", parser.generate_change_summary(
+            original_resume_data=candidate_data,
+            tailored_bullets=bullets_data,
+            job_description=job_description
+        ))
+    )
+    if change_summary is not None:
+        logger.info(f"Summary preview:\n{change_summary[:200]}...")
+
+    logger.info("=" * 60)
+    logger.info("✨ All tasks completed successfully!")
+    logger.info("=" * 60)
+
+    return GenerateResponse(
+        success=True,
+        cover_letter=package.cover_letter.text,
+        cover_letter_latex=cover_letter_latex,
+        bullets=bullets_data,
+        resume_latex=resume_latex,
+        change_summary=change_summary,
+        errors=errors if errors else None,
+        job_id=package.job_id,
+        candidate_id=package.candidate_id
+    ).model_dump()
+
+
+# Generate tailored resume endpoint
+@app.post("/generate", response_model=GenerateResponse)
+async def generate_resume(request: GenerateRequest):
+    """
+    Generate tailored resume from structured job and resume data.
+
+    Accepts YAML job description and JSON resume, validates them in memory,
+    runs the agent executor, and returns the generated content.
+    """
+    if not llm_client or not encoder:
+        raise HTTPException(status_code=503, detail="Services not initialized")
+
+    # Same job + resume as an earlier request: return its response
+    cache_key = GenerationCache.make_key(request.job_yaml, request.resume_json)
+    if generation_cache is not None:
+        cached = await generation_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"♻️  Returning cached generation ({cache_key})")
+            # Already a validated GenerateResponse dump; skip re-validation
+            return DefaultResponse(content=cached)
 
+    try:
         logger.info("=" * 60)
-        logger.info("✨ All tasks completed successfully!")
+        logger.info(f"🚀 Starting resume generation ({cache_key})")
         logger.info("=" * 60)
 
-        return GenerateResponse(
-            success=True,
-            cover_letter=package.cover_letter.text,
-            cover_letter_latex=cover_letter_latex,
-            bullets=bullets_data,
-            resume_latex=resume_latex,
-            change_summary=change_summary,
-            errors=errors if errors else None,
-            job_id=package.job_id,
-            candidate_id=package.candidate_id
-        )
+        job, resume, resume_json_content = await load_generation_inputs(request, cache_key)
+        payload = await run_generation(job, resume, resume_json_content)
+
+        # Returning a Response makes FastAPI skip re-validating the payload
+        # against response_model
+        if payload["success"] and generation_cache is not None:
+            await generation_cache.set(cache_key, payload)
+        return DefaultResponse(content=payload)
 
     except HTTPException:
         raise
@@ -406,27 +594,93 @@ async def generate_resume(request: GenerateRequest):
         logger.error("=" * 60)
         logger.error(f"❌ CRITICAL ERROR: {str(e)}")
         logger.error("=" * 60)
-        import traceback
         logger.error(traceback.format_exc())
         raise HTTPException(
             status_code=500,
             detail=f"Generation failed: {str(e)}"
         )
-    finally:
-        # Clean up temp files (optional - you may want to keep for debugging)
-        # if job_path.exists():
-        #     job_path.unlink()
-        # if resume_path.exists():
-        #     resume_path.unlink()
-        pass
+
+
+# Streaming variant of /generate
+@app.post("/generate/stream")
+async def generate_resume_stream(request: GenerateRequest):
+    """
+    Generate a tailored resume, streaming each output as it is ready.
+
+    Same inputs and work as /generate, but the response is NDJSON: one
+    {"event": ..., "data": ...} line per output, in completion order
+    ("bullets", "cover_letter", then "resume_latex", "cover_letter_latex"
+    and "change_summary"), ending with "done" ({"success", "errors"}) or
+    "error" ({"detail"}). Input errors are still returned as 400/503
+    before the stream starts.
+    """
+    if not llm_client or not encoder:
+        raise HTTPException(status_code=503, detail="Services not initialized")
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(event: str, data: Any) -> None:
+        queue.put_nowait((event, data))
+
+    cache_key = GenerationCache.make_key(request.job_yaml, request.resume_json)
+    cached = await generation_cache.get(cache_key) if generation_cache is not None else None
+
+    if cached is not None:
+        logger.info(f"♻️  Streaming cached generation ({cache_key})")
+        for event in STREAM_EVENTS:
+            emit(event, cached[event])
+        emit("done", {"success": cached["success"], "errors": cached["errors"]})
+        queue.put_nowait(None)
+        producer = None
+    else:
+        logger.info(f"🚀 Starting streamed resume generation ({cache_key})")
+        job, resume, resume_json_content = await load_generation_inputs(request, cache_key)
+
+        async def produce():
+            try:
+                payload = await run_generation(job, resume, resume_json_content, emit=emit)
+                if payload["success"] and generation_cache is not None:
+                    await generation_cache.set(cache_key, payload)
+                emit("done", {"success": payload["success"], "errors": payload["errors"]})
+            except Exception as e:
+                logger.error(f"❌ Streamed generation failed: {e}")
+                logger.error(traceback.format_exc())
+                emit("error", {"detail": f"Generation failed: {str(e)}"})
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+
+    async def events():
+        try:
+            while (item := await queue.get()) is not None:
+                event, data = item
+                yield json_dumps({"event": event, "data": data}) + b"\n"
+        finally:
+            # Client disconnected mid-stream: stop the remaining LLM calls
+            if producer is not None and not producer.done():
+                producer.cancel()
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
 
 
 # Run server
 if __name__ == "__main__":
     import uvicorn
+
+    # DEV=1 enables auto-reload (single process). Otherwise run WEB_CONCURRENCY
+    # worker processes; each loads its own encoder and in-process caches, so
+    # set REDIS_URL to share the /generate cache between them
+    dev = os.getenv("DEV") == "1"
+    workers = 1 if dev else int(os.getenv("WEB_CONCURRENCY", "4"))
+    # Workers inherit this, so configure_cpu_threads() splits the CPUs between them
+    os.environ["WEB_CONCURRENCY"] = str(workers)
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True  # Enable auto-reload during development
+        loop="auto",  # uvloop / httptools when installed (uvicorn[standard])
+        http="auto",
+        workers=workers,
+        reload=dev
     )
@@ -3,6 +3,8 @@ Agent Package
 Implements the agentic loop for resume generation.
 """
 
+import importlib
+
 from .validator import (
     validate_bullet_length,
     validate_skill_coverage,
@@ -12,14 +14,32 @@ from .validator import (
     validate_bullets_only,
     format_validation_feedback,
 )
-from .executor import AgentExecutor, build_package_from_components
-from .async_executor import (
-    AsyncJobExecutor,
-    AgentBatchExecutor,
-    AsyncBatchExecutor,
-    BatchJobResult,
-    run_jobs_concurrently,
-)
+
+# The executors pull in models, FAISS retrieval and generators, so they are
+# imported on first attribute access (PEP 562); validators stay eager (cheap)
+_LAZY_ATTRIBUTES = {
+    "AgentExecutor": ".executor",
+    "build_package_from_components": ".executor",
+    "AsyncJobExecutor": ".async_executor",
+    "AgentBatchExecutor": ".async_executor",
+    "AsyncBatchExecutor": ".async_executor",
+    "BatchJobResult": ".async_executor",
+    "run_jobs_concurrently": ".async_executor",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
 
 __all__ = [
     # Validation functions
@@ -1,35 +1,48 @@
 """
 Async Executor
-Handles concurrent processing of multiple jobs using asyncio.Semaphore for rate limiting.
+Handles concurrent processing of multiple jobs with bounded concurrency for rate limiting.
 """
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable
 
 if TYPE_CHECKING:
-    from ..models import FullGeneratedPackage
+    from ..models import CandidateProfile, FullGeneratedPackage, JobDescription
+    from ..embeddings import ResumeFaissIndex, SentenceBertEncoder
     from ..llm import BaseLLMClient
     from ..orchestration.config import Config
 
-from .executor import AgentExecutor
+from ..batching import AdaptiveConcurrency, eager_tasks, run_bounded
+from ..models import load_job_from_yaml, load_resume_from_json
+from ..llm.base import FatalLLMError, QuotaExceededError
+from .executor import AgentExecutor, _load_cached
 
 logger = logging.getLogger(__name__)
 
+# Error recorded for jobs that were never started because the LLM quota ran out
+QUOTA_SKIPPED_ERROR = "Skipped: LLM quota exhausted earlier in the batch; retry this job later"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, eq=False)
 class BatchJobResult:
     """
     Result from processing a single (job, resume) pair in a batch.
 
+    Slotted and immutable: large batches hold one per pair, and results are
+    shared between duplicate pairs and callbacks. Use without_package() or
+    dataclasses.replace() for a modified copy.
+
     Attributes:
         job_path: Path to the job description YAML file
         resume_path: Path to the resume JSON file
         package: Generated package if successful, None otherwise
         errors: List of error/warning messages
         metrics: Dictionary of computed metrics, or None if unavailable
+        package_released: True if the package was dropped after being handed
+                          to a sink (see AsyncBatchExecutor.run)
         success: True if package was generated, False otherwise
 
     Example:
@@ -48,11 +61,74 @@ class BatchJobResult:
     package: "FullGeneratedPackage | None" = None
     errors: list[str] = field(default_factory=list)
     metrics: dict[str, Any] | None = None
+    package_released: bool = False
 
     @property
     def success(self) -> bool:
         """Return True if a package was successfully generated."""
-        return self.package is not None
+        return self.package is not None or self.package_released
+
+    def without_package(self) -> "BatchJobResult":
+        """Return a copy without the package, keeping its success status."""
+        if self.package is None:
+            return self
+        return replace(self, package=None, package_released=True)
+
+
+async def _cached_resume_inputs(
+    executor: AgentExecutor,
+    resume_path: Path
+) -> tuple["CandidateProfile", "ResumeFaissIndex | None"]:
+    """
+    Load a resume and its FAISS index through the executor's caches.
+
+    The parsed resume comes from the executor's mtime-keyed file cache and the
+    index from AgentExecutor._index_for_resume(), so concurrent jobs for the
+    same resume share one build, and later runs on the same executor reuse it.
+    The file is parsed on a worker thread and the encoding runs on the
+    encoder's thread, so neither blocks the event loop.
+
+    Args:
+        executor: Agent executor whose caches hold the resume and index
+        resume_path: Path to resume JSON
+
+    Returns:
+        Tuple of (resume, index); index is None if the resume has no bullets
+
+    Raises:
+        Exception: If the resume cannot be read or validated
+    """
+    resume = await asyncio.to_thread(_load_cached, load_resume_from_json, resume_path)
+    try:
+        index = await executor._index_for_resume(resume, resume_path)
+    except ValueError:
+        return resume, None  # No bullets to index; the executor reports the error
+    return resume, index
+
+
+async def _preload_jobs(job_paths: Iterable[Path]) -> dict[Path, "JobDescription | None"]:
+    """
+    Parse each distinct job file once, on worker threads.
+
+    Keeps YAML parsing and file reads off the event loop and out of the
+    per-job coroutines.
+
+    Args:
+        job_paths: Job description paths (duplicates are parsed once)
+
+    Returns:
+        Map of path to parsed job; None for files that failed to load (the
+        executor loads those itself and reports the error)
+    """
+    def load(path: Path) -> "JobDescription | None":
+        try:
+            return load_job_from_yaml(path)
+        except Exception:
+            return None
+
+    unique_paths = list(dict.fromkeys(job_paths))
+    loaded = await asyncio.gather(*(asyncio.to_thread(load, path) for path in unique_paths))
+    return dict(zip(unique_paths, loaded))
 
 
 async def run_jobs_concurrently(
@@ -63,8 +139,9 @@ async def run_jobs_concurrently(
     """
     Run multiple job applications concurrently with rate limiting.
 
-    Uses asyncio.Semaphore to limit the number of concurrent API calls to
-    prevent rate limiting from LLM providers.
+    Thin wrapper around AsyncBatchExecutor: a fixed pool of `concurrency`
+    workers pulls jobs from a bounded queue, limiting concurrent API calls
+    to prevent rate limiting from LLM providers.
 
     Args:
         job_resume_pairs: List of (job_path, resume_path) tuples
@@ -86,47 +163,20 @@ async def run_jobs_concurrently(
         ...     else:
         ...         print(f"Job {i+1}: Failed with {len(errors)} errors")
     """
-    logger.info(f"Running {len(job_resume_pairs)} jobs with concurrency={concurrency}")
-
-    # Create semaphore for rate limiting
-    semaphore = asyncio.Semaphore(concurrency)
-
-    # Create executor (will be shared across all tasks)
-    from ..embeddings import SentenceBertEncoder
-    encoder = SentenceBertEncoder()
-    executor = AgentExecutor(llm, encoder, max_retries=3)
-
-    async def process_single_job_with_semaphore(
-        job_path: Path,
-        resume_path: Path
-    ) -> tuple["FullGeneratedPackage | None", list[str], dict | None]:
-        """Process a single job with semaphore control."""
-        async with semaphore:
-            logger.info(f"Processing: {job_path.name}")
-            result = await executor.run_single_job(job_path, resume_path)
-            logger.info(f"Completed: {job_path.name}")
-            return result
-
-    # Create tasks for all jobs
-    tasks = [
-        process_single_job_with_semaphore(job_path, resume_path)
-        for job_path, resume_path in job_resume_pairs
-    ]
+    from ..embeddings import get_shared_encoder
+    executor = AgentExecutor(llm, get_shared_encoder(), max_retries=3)
 
-    # Run all tasks concurrently (semaphore limits actual concurrency)
-    logger.info(f"Starting concurrent execution...")
-    results = await asyncio.gather(*tasks, return_exceptions=False)
-
-    logger.info(f"Completed all {len(results)} jobs")
-    return results
+    results = await AsyncBatchExecutor(job_resume_pairs, concurrency).run_with_executor(executor)
+    return [(result.package, result.errors) for result in results]
 
 
 class AsyncJobExecutor:
     """
     Manages concurrent job processing with rate limiting.
 
-    Wraps AgentExecutor to provide concurrent execution capabilities
-    using asyncio.Semaphore for API rate limiting.
+    Wraps AgentExecutor to provide concurrent execution capabilities, returning
+    one result dictionary per job. Batches run through AsyncBatchExecutor;
+    single jobs are limited by an asyncio.Semaphore.
 
     Example:
         >>> from ..embeddings import SentenceBertEncoder
@@ -149,6 +199,21 @@ class AsyncJobExecutor:
         self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
 
+    @staticmethod
+    def _as_dict(result: BatchJobResult) -> dict:
+        """Convert a BatchJobResult to this executor's result dictionary."""
+        if result.package:
+            status = "success" if not result.errors else "success_with_warnings"
+        else:
+            status = "failed"
+        return {
+            "job_path": str(result.job_path),
+            "resume_path": str(result.resume_path),
+            "status": status,
+            "package": result.package,
+            "errors": result.errors
+        }
+
     async def process_single_job(
         self,
         job_path: Path,
@@ -157,43 +222,42 @@ class AsyncJobExecutor:
         """
         Process a single job with semaphore control.
 
+        Runs the shared AgentExecutor directly rather than a one-pair batch, so
+        concurrent calls skip the batch's LLM warm-up and job preloading and
+        reuse the executor's cached job/resume files and FAISS indexes.
+
         Args:
             job_path: Path to job description YAML
             resume_path: Path to resume JSON
 
         Returns:
             Dictionary with job info, status, and results
+
+        Raises:
+            FatalLLMError: If the LLM provider rejects the credentials
         """
         async with self.semaphore:
             try:
-                logger.info(f"Processing: {job_path.name}")
-
                 package, errors, metrics = await self.agent_executor.run_single_job(
                     job_path, resume_path
                 )
-
-                if package:
-                    status = "success" if not errors else "success_with_warnings"
-                else:
-                    status = "failed"
-
-                return {
-                    "job_path": str(job_path),
-                    "resume_path": str(resume_path),
-                    "status": status,
-                    "package": package,
-                    "errors": errors
-                }
-
+                result = BatchJobResult(
+                    job_path=job_path,
+                    resume_path=resume_path,
+                    package=package,
+                    errors=errors if errors else [],
+                    metrics=metrics
+                )
+            except FatalLLMError:
+                raise
             except Exception as e:
-                logger.error(f"Job processing failed for {job_path.name}: {e}")
-                return {
-                    "job_path": str(job_path),
-                    "resume_path": str(resume_path),
-                    "status": "failed",
-                    "package": None,
-                    "errors": [f"Exception: {str(e)}"]
-                }
+                logger.error("Job processing failed for %s: %s", job_path.name, e)
+                result = BatchJobResult(
+                    job_path=job_path,
+                    resume_path=resume_path,
+                    errors=[f"Exception: {str(e)}"]
+                )
+        return self._as_dict(result)
 
     async def process_jobs(
         self,
@@ -217,40 +281,10 @@ class AsyncJobExecutor:
             >>> successful = [r for r in results if r["status"] == "success"]
             >>> print(f"{len(successful)}/{len(results)} jobs completed successfully")
         """
-        logger.info(
-            f"Processing {len(job_resume_pairs)} jobs with max_concurrent={self.max_concurrent}"
-        )
-
-        # Create tasks for all jobs
-        tasks = [
-            self.process_single_job(job_path, resume_path)
-            for job_path, resume_path in job_resume_pairs
-        ]
-
-        # Run all tasks concurrently (semaphore limits actual concurrency)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle any exceptions from gather
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                job_path, resume_path = job_resume_pairs[i]
-                logger.error(f"Job {job_path.name} raised exception: {result}")
-                processed_results.append({
-                    "job_path": str(job_path),
-                    "resume_path": str(resume_path),
-                    "status": "failed",
-                    "package": None,
-                    "errors": [f"Exception: {str(result)}"]
-                })
-            else:
-                processed_results.append(result)
-
-        # Summary
-        successful = sum(1 for r in processed_results if r["status"] == "success")
-        logger.info(f"Completed: {successful}/{len(processed_results)} successful")
-
-        return processed_results
+        results = await AsyncBatchExecutor(
+            job_resume_pairs, self.max_concurrent
+        ).run_with_executor(self.agent_executor)
+        return [self._as_dict(result) for result in results]
 
 
 class AgentBatchExecutor:
@@ -258,7 +292,9 @@ class AgentBatchExecutor:
     Batch executor for processing multiple (job, resume) pairs with controlled concurrency.
 
     This class provides a high-level interface for batch processing jobs using the
-    agent pipeline with semantic retrieval, generation, and validation.
+    agent pipeline with semantic retrieval, generation, and validation. It builds
+    the LLM client and encoder from the config and runs the batch through
+    AsyncBatchExecutor.
 
     Example:
         >>> from ..orchestration.config import Config
@@ -290,90 +326,33 @@ class AgentBatchExecutor:
         self.jobs = jobs
         self.config = config
         self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
 
         # Initialize shared components
-        from ..embeddings import SentenceBertEncoder
-        self.encoder = SentenceBertEncoder()
+        from ..embeddings import get_shared_encoder
+        self.encoder = get_shared_encoder()
 
         # Get LLM client from config
         self.llm = config.get_llm_client()
 
-        logger.info(
-            f"Initialized AgentBatchExecutor with {len(jobs)} jobs, "
-            f"max_concurrent={max_concurrent}"
+        # One executor for every job: it holds no per-job state, and jobs share
+        # the LLM client's HTTP connection pool
+        self.executor = AgentExecutor(
+            self.llm,
+            self.encoder,
+            max_retries=config.max_retries
         )
 
-    async def _process_single_pair(
-        self,
-        job_path: Path,
-        resume_path: Path,
-        index: int
-    ) -> tuple[Path, Path, bool, list[str]]:
-        """
-        Process a single (job, resume) pair with semaphore control.
-
-        Args:
-            job_path: Path to job description YAML
-            resume_path: Path to resume JSON
-            index: Index of this job in the batch (for logging)
-
-        Returns:
-            Tuple of (job_path, resume_path, success_flag, errors)
-        """
-        async with self.semaphore:
-            try:
-                logger.info(
-                    f"[{index + 1}/{len(self.jobs)}] Processing: "
-                    f"job={job_path.name}, resume={resume_path.name}"
-                )
-
-                # Create a fresh AgentExecutor for this job
-                executor = AgentExecutor(
-                    self.llm,
-                    self.encoder,
-                    max_retries=self.config.max_retries
-                )
-
-                # Run the pipeline for this job
-                package, errors, metrics = await executor.run_single_job(job_path, resume_path)
-
-                if package and not errors:
-                    logger.info(
-                        f"[{index + 1}/{len(self.jobs)}] SUCCESS: "
-                        f"job={job_path.name}, resume={resume_path.name}"
-                    )
-                    return (job_path, resume_path, True, [])
-                elif package and errors:
-                    logger.warning(
-                        f"[{index + 1}/{len(self.jobs)}] SUCCESS WITH WARNINGS: "
-                        f"job={job_path.name}, resume={resume_path.name}, "
-                        f"warnings={len(errors)}"
-                    )
-                    return (job_path, resume_path, True, errors)
-                else:
-                    logger.error(
-                        f"[{index + 1}/{len(self.jobs)}] FAILED: "
-                        f"job={job_path.name}, resume={resume_path.name}, "
-                        f"errors={len(errors)}"
-                    )
-                    return (job_path, resume_path, False, errors)
-
-            except Exception as e:
-                logger.error(
-                    f"[{index + 1}/{len(self.jobs)}] EXCEPTION: "
-                    f"job={job_path.name}, resume={resume_path.name}, "
-                    f"error={str(e)}"
-                )
-                return (job_path, resume_path, False, [f"Exception: {str(e)}"])
+        logger.info(
+            "Initialized AgentBatchExecutor with %d jobs, max_concurrent=%d",
+            len(jobs), max_concurrent
+        )
 
     async def run_all(self) -> list[tuple[Path, Path, bool, list[str]]]:
         """
         Run all jobs concurrently with controlled concurrency.
 
-        Uses asyncio.gather with a semaphore to limit concurrent execution.
-        Each job reuses the same encoder and LLM client but creates its own
-        AgentExecutor to avoid state conflicts.
+        See AsyncBatchExecutor.run for scheduling, resume caching and quota
+        handling; this returns the same results as plain tuples.
 
         Returns:
             List of tuples: (job_path, resume_path, success_flag, errors)
@@ -382,47 +361,23 @@ class AgentBatchExecutor:
             - success_flag: True if successful, False otherwise
             - errors: List of error/warning messages
 
+        Raises:
+            FatalLLMError: If the LLM provider rejects the credentials; jobs
+                           still running are cancelled
+
         Example:
             >>> results = await batch_executor.run_all()
             >>> successful = [r for r in results if r[2]]  # r[2] is success_flag
             >>> print(f"{len(successful)}/{len(results)} jobs succeeded")
         """
-        logger.info(f"Starting batch execution of {len(self.jobs)} jobs")
-        logger.info(f"Concurrency limit: {self.max_concurrent}")
-
-        # Create tasks for all job pairs
-        tasks = [
-            self._process_single_pair(job_path, resume_path, i)
-            for i, (job_path, resume_path) in enumerate(self.jobs)
+        results = await AsyncBatchExecutor(
+            self.jobs, self.max_concurrent
+        ).run_with_executor(self.executor)
+        return [
+            (result.job_path, result.resume_path, result.success, result.errors)
+            for result in results
         ]
 
-        # Run all tasks concurrently (semaphore limits actual concurrency)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle any exceptions from gather
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                job_path, resume_path = self.jobs[i]
-                logger.error(
-                    f"[{i + 1}/{len(self.jobs)}] Unexpected exception: "
-                    f"job={job_path.name}, error={str(result)}"
-                )
-                final_results.append(
-                    (job_path, resume_path, False, [f"Unexpected error: {str(result)}"])
-                )
-            else:
-                final_results.append(result)
-
-        # Log summary
-        successful = sum(1 for r in final_results if r[2])
-        failed = len(final_results) - successful
-        logger.info(
-            f"Batch execution completed: {successful} succeeded, {failed} failed"
-        )
-
-        return final_results
-
 
 class AsyncBatchExecutor:
     """
@@ -434,6 +389,9 @@ class AsyncBatchExecutor:
     Args:
         pairs: List of (job_path, resume_path) tuples to process
         max_concurrent: Maximum number of concurrent jobs (default: 3)
+        initial_concurrent: If set, start at this many concurrent jobs and
+                            adapt between 1 and max_concurrent from the LLM
+                            provider's rate-limit responses
 
     Example:
         >>> from ..llm import OpenAILLMClient
@@ -454,7 +412,8 @@ class AsyncBatchExecutor:
     def __init__(
         self,
         pairs: list[tuple[Path, Path]],
-        max_concurrent: int = 3
+        max_concurrent: int = 3,
+        initial_concurrent: int | None = None
     ):
         """
         Initialize async batch executor.
@@ -462,70 +421,188 @@ class AsyncBatchExecutor:
         Args:
             pairs: List of (job_path, resume_path) tuples
             max_concurrent: Maximum number of concurrent jobs (default: 3)
+            initial_concurrent: Starting concurrency for adaptive mode; None
+                                (default) keeps max_concurrent fixed
         """
         self.pairs = pairs
         self.max_concurrent = max_concurrent
-        self._semaphore: asyncio.Semaphore | None = None
+        self.initial_concurrent = initial_concurrent
+
+        # Set when the LLM quota runs out; no further pairs are started
+        self._abort = asyncio.Event()
+
+        # Job descriptions parsed up front by run()
+        self._parsed_jobs: dict[Path, "JobDescription | None"] = {}
 
     async def run(
         self,
         llm: "BaseLLMClient",
         encoder: "SentenceBertEncoder",
-        max_retries: int = 3
+        max_retries: int = 3,
+        on_result: Callable[[BatchJobResult], None] | None = None,
+        sink: Callable[[BatchJobResult], Awaitable[None]] | None = None,
+        keep_packages: bool = True
     ) -> list[BatchJobResult]:
         """
         Run all jobs concurrently and return detailed results.
 
         Each result contains the package, metrics, and errors for downstream
-        processing (LaTeX rendering, metrics persistence, etc.).
+        processing (LaTeX rendering, metrics persistence, etc.). Each resume
+        is loaded and indexed once, however many pairs use it.
+
+        If the LLM quota runs out, no further pairs are started; they are
+        returned as failed results with QUOTA_SKIPPED_ERROR so they can be
+        rerun later.
 
         Args:
             llm: LLM client (OpenAI or Anthropic)
             encoder: SentenceBERT encoder for retrieval
             max_retries: Maximum retry attempts for generation per job
+            on_result: Called with each BatchJobResult as soon as its pair
+                       finishes (completion order), so post-processing can
+                       start before the slowest pair is done
+            sink: Awaited once per distinct pair with its BatchJobResult, on
+                  the worker that produced it, e.g. to write outputs to disk.
+                  The worker takes no new pair until the sink returns; an
+                  exception from the sink aborts the batch
+            keep_packages: If False, returned results omit the package (see
+                           BatchJobResult.without_package) so memory stays
+                           bounded by the pairs in flight; use with a sink
 
         Returns:
-            List of BatchJobResult objects, one per (job, resume) pair
+            List of BatchJobResult objects, one per (job, resume) pair, in
+            input order. A pair listed more than once is processed once and
+            its result object is repeated at each of its positions.
+
+        Raises:
+            FatalLLMError: If the LLM provider rejects the credentials; jobs
+                           still running are cancelled
 
         Example:
             >>> results = await executor.run(llm, encoder)
             >>> successful = [r for r in results if r.success]
             >>> print(f"{len(successful)}/{len(results)} jobs succeeded")
         """
-        logger.info(f"Starting batch: {len(self.pairs)} pairs, max_concurrent={self.max_concurrent}")
+        # One executor for every pair; jobs share the LLM client's connection pool
+        executor = AgentExecutor(llm, encoder, max_retries=max_retries)
+        return await self.run_with_executor(
+            executor, on_result=on_result, sink=sink, keep_packages=keep_packages
+        )
 
-        # Create semaphore for concurrency control
-        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+    async def run_with_executor(
+        self,
+        executor: AgentExecutor,
+        on_result: Callable[[BatchJobResult], None] | None = None,
+        sink: Callable[[BatchJobResult], Awaitable[None]] | None = None,
+        keep_packages: bool = True
+    ) -> list[BatchJobResult]:
+        """
+        Run all jobs on an existing AgentExecutor (see run()).
 
-        # Create tasks
-        tasks = [
-            self._process_pair(job_path, resume_path, idx, llm, encoder, max_retries)
-            for idx, (job_path, resume_path) in enumerate(self.pairs)
-        ]
+        Shared by run() and the other executors in this module, so they all
+        get the same scheduling, caching and quota handling.
 
-        # Run all tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            executor: Agent executor shared by every pair
+            on_result: Called with each BatchJobResult as soon as its pair finishes
+            sink: Awaited with each distinct pair's BatchJobResult (see run())
+            keep_packages: If False, returned results omit the package
+
+        Returns:
+            List of BatchJobResult objects, one per (job, resume) pair, in input order
+
+        Raises:
+            FatalLLMError: If the LLM provider rejects the credentials
+        """
+        total = len(self.pairs)
+
+        # Run each distinct pair once and fan its result out to every position
+        positions: dict[tuple[Path, Path], list[int]] = {}
+        for idx, pair in enumerate(self.pairs):
+            positions.setdefault(pair, []).append(idx)
+        unique_pairs = list(positions)
+
+        logger.info(
+            "Starting batch: %d pairs (%d unique), max_concurrent=%d",
+            total, len(unique_pairs), self.max_concurrent
+        )
 
-        # Process results, converting exceptions to failed results
-        final_results: list[BatchJobResult] = []
-        for idx, result in enumerate(results):
-            if isinstance(result, Exception):
-                job_path, resume_path = self.pairs[idx]
-                logger.error(f"[{idx + 1}/{len(self.pairs)}] Exception: {job_path.name} - {result}")
-                final_results.append(BatchJobResult(
+        # Adaptive mode: max_concurrent workers, of which only limiter.limit
+        # run a pair at once; 429s from the LLM client halve the limit and
+        # streaks of successes raise it again
+        limiter = None
+        if self.initial_concurrent is not None:
+            limiter = AdaptiveConcurrency(
+                min(self.initial_concurrent, self.max_concurrent), self.max_concurrent
+            )
+
+        async def process(pair: tuple[Path, Path], unique_idx: int) -> BatchJobResult:
+            job_path, resume_path = pair
+            if limiter is None:
+                result = await self._process_pair(job_path, resume_path, positions[pair][0], executor)
+            else:
+                async with limiter:
+                    result = await self._process_pair(
+                        job_path, resume_path, positions[pair][0], executor
+                    )
+                if result.success:
+                    limiter.record_success()
+            if sink is not None:
+                await sink(result)
+            return result if keep_packages else result.without_package()
+
+        def collect(unique_idx: int, result: BatchJobResult) -> None:
+            for _ in positions[unique_pairs[unique_idx]]:
+                on_result(result)
+
+        self._abort.clear()
+        # Parse the job files while the LLM client opens its first connection,
+        # so the workers' first requests skip DNS and the TLS handshake
+        self._parsed_jobs, _ = await asyncio.gather(
+            _preload_jobs(job_path for job_path, _ in unique_pairs),
+            executor.llm.warm_up()
+        )
+
+        llm = executor.llm
+        previous_hook = llm.on_rate_limit
+        if limiter is not None:
+            llm.on_rate_limit = limiter.record_throttle
+
+        # max_concurrent workers pull pairs from a bounded queue; each result
+        # is handed to on_result as soon as it completes. Per-pair failures come
+        # back as failed results; a FatalLLMError cancels the remaining pairs
+        # and propagates.
+        try:
+            with eager_tasks():
+                results = await run_bounded(
+                    unique_pairs, process, self.max_concurrent,
+                    on_result=collect if on_result is not None else None,
+                    stop=self._abort
+                )
+        finally:
+            llm.on_rate_limit = previous_hook
+
+        final_results: list[BatchJobResult] = [None] * total
+        for (job_path, resume_path), result in zip(unique_pairs, results):
+            if result is None:
+                # Never started because the quota ran out
+                result = BatchJobResult(
                     job_path=job_path,
                     resume_path=resume_path,
-                    package=None,
-                    errors=[f"Unexpected error: {str(result)}"],
-                    metrics=None
-                ))
-            else:
-                final_results.append(result)
+                    errors=[QUOTA_SKIPPED_ERROR]
+                )
+                if on_result is not None:
+                    for _ in positions[(job_path, resume_path)]:
+                        on_result(result)
+                if sink is not None:
+                    await sink(result)
+            for idx in positions[(job_path, resume_path)]:
+                final_results[idx] = result
 
         # Log summary
         successful = sum(1 for r in final_results if r.success)
         failed = len(final_results) - successful
-        logger.info(f"Batch completed: {successful} succeeded, {failed} failed")
+        logger.info("Batch completed: %d succeeded, %d failed", successful, failed)
 
         return final_results
 
@@ -534,54 +611,76 @@ class AsyncBatchExecutor:
         job_path: Path,
         resume_path: Path,
         idx: int,
-        llm: "BaseLLMClient",
-        encoder: "SentenceBertEncoder",
-        max_retries: int
+        executor: AgentExecutor
     ) -> BatchJobResult:
         """
-        Process a single (job, resume) pair with semaphore control.
+        Process a single (job, resume) pair (called by one of run()'s workers).
 
         Args:
             job_path: Path to job description YAML
             resume_path: Path to resume JSON
             idx: Index of this pair (for logging)
-            llm: LLM client
-            encoder: SentenceBERT encoder
-            max_retries: Maximum retry attempts
+            executor: Agent executor shared by the batch
 
         Returns:
-            BatchJobResult with package, errors, and metrics
-        """
-        async with self._semaphore:
-            logger.info(f"[{idx + 1}/{len(self.pairs)}] Starting: {job_path.name} + {resume_path.name}")
-
-            try:
-                # Create executor for this job
-                executor = AgentExecutor(llm, encoder, max_retries=max_retries)
+            BatchJobResult with package, errors, and metrics; any other
+            exception is returned as a failed result, so the worker pool only
+            ever sees fatal errors
 
-                # Run the agent pipeline
-                package, errors, metrics = await executor.run_single_job(job_path, resume_path)
+        Raises:
+            FatalLLMError: If the LLM provider rejects the credentials
+        """
+        # Computed once; reused by every log line below
+        number = idx + 1
+        total = len(self.pairs)
+        job_name = job_path.name
 
-                if package:
-                    status = "SUCCESS" if not errors else "SUCCESS_WITH_WARNINGS"
-                    logger.info(f"[{idx + 1}/{len(self.pairs)}] {status}: {job_path.name}")
-                else:
-                    logger.error(f"[{idx + 1}/{len(self.pairs)}] FAILED: {job_path.name}")
+        logger.info("[%d/%d] Starting: %s + %s", number, total, job_name, resume_path.name)
 
-                return BatchJobResult(
-                    job_path=job_path,
-                    resume_path=resume_path,
-                    package=package,
-                    errors=errors if errors else [],
-                    metrics=metrics
-                )
-
-            except Exception as e:
-                logger.error(f"[{idx + 1}/{len(self.pairs)}] Exception: {job_path.name} - {e}")
-                return BatchJobResult(
-                    job_path=job_path,
-                    resume_path=resume_path,
-                    package=None,
-                    errors=[f"Exception: {str(e)}"],
-                    metrics=None
-                )
+        try:
+            # Run the agent pipeline
+            try:
+                resume, index = await _cached_resume_inputs(executor, resume_path)
+            except Exception:
+                resume = index = None  # Let the executor load the resume and report the error
+
+            package, errors, metrics = await executor.run_single_job(
+                job_path, resume_path,
+                job=self._parsed_jobs.get(job_path), resume=resume, index=index
+            )
+
+            if package:
+                status = "SUCCESS" if not errors else "SUCCESS_WITH_WARNINGS"
+                logger.info("[%d/%d] %s: %s", number, total, status, job_name)
+            else:
+                logger.error("[%d/%d] FAILED: %s", number, total, job_name)
+
+            return BatchJobResult(
+                job_path=job_path,
+                resume_path=resume_path,
+                package=package,
+                errors=errors if errors else [],
+                metrics=metrics
+            )
+
+        except QuotaExceededError as e:
+            logger.error("[%d/%d] Quota exhausted, skipping remaining pairs: %s", number, total, e)
+            self._abort.set()
+            return BatchJobResult(
+                job_path=job_path,
+                resume_path=resume_path,
+                package=None,
+                errors=[f"Exception: {str(e)}"],
+                metrics=None
+            )
+        except FatalLLMError:
+            raise
+        except Exception as e:
+            logger.error("[%d/%d] Exception: %s - %s", number, total, job_name, e)
+            return BatchJobResult(
+                job_path=job_path,
+                resume_path=resume_path,
+                package=None,
+                errors=[f"Exception: {str(e)}"],
+                metrics=None
+            )
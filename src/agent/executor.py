@@ -3,22 +3,119 @@ Agent Executor
 Implements the agentic loop: Retrieve → Generate → Validate → Retry
 """
 
+import asyncio
+import functools
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 if TYPE_CHECKING:
     from ..models import JobDescription, CandidateProfile, FullGeneratedPackage, GeneratedBullet, GeneratedCoverLetter
     from ..llm import BaseLLMClient
-    from ..embeddings import SentenceBertEncoder
+    from ..embeddings import ResumeFaissIndex, SentenceBertEncoder
 
 from ..models import load_job_from_yaml, load_resume_from_json, FullGeneratedPackage
-from ..embeddings import ResumeFaissIndex, retrieve_relevant_experiences
 from ..generators import generate_bullets_for_job, generate_cover_letter
-from .validator import validate_bullets_only, validate_package, format_validation_feedback
+from ..generators.cover_letter_generator import COVER_LETTER_SAMPLE_BULLETS, _build_cover_letter_prompt
+from ..batching import run_bounded
+from ..llm.base import FatalLLMError, LLMRetriesExhaustedError
+from .validator import MIN_BULLET_LENGTH, validate_bullets_only, validate_package
 
 logger = logging.getLogger(__name__)
 
+# Resume FAISS indexes kept per executor (LRU), see AgentExecutor._index_for_resume()
+INDEX_CACHE_MAX_ENTRIES = 32
+
+# Prefixes of the ids given to assembled packages and placeholder cover letters
+PACKAGE_ID_PREFIX = "pkg-"
+BASELINE_COVER_ID_PREFIX = "baseline-cover-"
+
+
+@functools.lru_cache(maxsize=128)
+def _load_unchanged(loader: Callable[[Path], Any], path: str, mtime_ns: int) -> Any:
+    """Parse a file once per (path, mtime); see _load_cached()."""
+    return loader(Path(path))
+
+
+def _load_cached(loader: Callable[[Path], Any], path: Path) -> Any:
+    """
+    Load a job or resume file, reusing the parsed model while it is unchanged.
+
+    Batch runs load the same resume (and often the same job) for many jobs;
+    the key includes the file's mtime, so an edited file is parsed again.
+    Loaded models are shared between callers and must not be mutated.
+
+    Args:
+        loader: load_job_from_yaml or load_resume_from_json
+        path: File to load
+
+    Returns:
+        The validated model returned by loader
+    """
+    return _load_unchanged(loader, str(path.resolve()), path.stat().st_mtime_ns)
+
+
+class _SpeculativeCoverLetter:
+    """
+    Starts the cover letter while the bullet response is still streaming.
+
+    The cover letter prompt quotes only the first COVER_LETTER_SAMPLE_BULLETS
+    bullets, so once that many have arrived it is generated alongside the rest
+    of the bullet response. It is used only if the final bullets give the
+    exact same prompt; otherwise it is cancelled and the cover letter is
+    generated from the final bullets.
+    """
+
+    __slots__ = ("job", "resume", "llm", "_task", "_prompt")
+
+    def __init__(
+        self,
+        job: "JobDescription",
+        resume: "CandidateProfile",
+        llm: "BaseLLMClient"
+    ):
+        self.job = job
+        self.resume = resume
+        self.llm = llm
+        self._task: asyncio.Task | None = None
+        self._prompt: str | None = None  # Prompt the running task was started with
+
+    def on_partial_bullets(self, bullets: list["GeneratedBullet"]) -> None:
+        """Start the cover letter once enough bullets have streamed in."""
+        sample = bullets[:COVER_LETTER_SAMPLE_BULLETS]
+        if self._task is not None and self._prompt_for(sample) != self._prompt:
+            self.cancel()  # A retry replaced the bullets it was started from
+
+        if self._task is None and len(sample) == COVER_LETTER_SAMPLE_BULLETS:
+            logger.debug("Starting cover letter from the first streamed bullets")
+            self._prompt = self._prompt_for(sample)
+            self._task = asyncio.create_task(
+                generate_cover_letter(self.job, self.resume, sample, self.llm)
+            )
+            # Mark a failure as retrieved in case the task is never awaited
+            self._task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def result_for(self, bullets: list["GeneratedBullet"]) -> "GeneratedCoverLetter":
+        """Return the cover letter for the final bullets."""
+        if self._task is not None and self._prompt_for(bullets) == self._prompt:
+            logger.debug("Using the cover letter started while bullets streamed")
+            return await self._task
+
+        self.cancel()
+        return await generate_cover_letter(self.job, self.resume, bullets, self.llm)
+
+    def cancel(self) -> None:
+        """Cancel the speculative cover letter, if any."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._prompt = None
+
+    def _prompt_for(self, bullets: list["GeneratedBullet"]) -> str:
+        """Build the cover letter prompt generate_cover_letter() would send."""
+        return _build_cover_letter_prompt(self.job, self.resume, bullets)
+
 
 class AgentExecutor:
     """
@@ -33,6 +130,10 @@ class AgentExecutor:
     6. Build and validate full package
     7. Return package + errors
 
+    Holds no per-job state (only the LLM client, encoder, retry limit and a
+    per-resume FAISS index cache), so one instance can serve many concurrent
+    run_single_job() calls.
+
     Example:
         >>> executor = AgentExecutor(llm_client, encoder)
         >>> pkg, errors = await executor.run_single_job(job_path, resume_path)
@@ -59,18 +160,25 @@ class AgentExecutor:
         self.llm = llm
         self.encoder = encoder
         self.max_retries = max_retries
+        # Resolved resume path -> (mtime, index build task), see _index_for_resume()
+        self._index_cache: "OrderedDict[str, tuple[float, asyncio.Task]]" = OrderedDict()
 
     async def run_single_job(
         self,
-        job_path: Path,
-        resume_path: Path,
-        mode: str = "full"
+        job_path: Path | None = None,
+        resume_path: Path | None = None,
+        mode: str = "full",
+        *,
+        job: "JobDescription | None" = None,
+        resume: "CandidateProfile | None" = None,
+        index: "ResumeFaissIndex | None" = None,
+        on_bullets: Callable[[list["GeneratedBullet"]], None] | None = None
     ) -> tuple["FullGeneratedPackage | None", list[str], dict | None]:
         """
         Run the complete agentic loop for a single job.
 
         Steps:
-        1. Load job description and resume from files
+        1. Load job description and resume from files (unless already loaded)
         2. Build FAISS index from resume experiences (full mode only)
         3. Retrieve relevant experiences for job (full mode only)
         4. Generate tailored bullets (with retry on validation failure)
@@ -81,13 +189,23 @@ class AgentExecutor:
         9. Return (package, errors, metrics)
 
         Args:
-            job_path: Path to job description YAML file
-            resume_path: Path to resume JSON file
+            job_path: Path to job description YAML file (ignored if job is given)
+            resume_path: Path to resume JSON file (ignored if resume is given)
             mode: "full" or "baseline" - controls retrieval and validation
+            job: Already-validated job description, skips reading job_path
+            resume: Already-validated resume, skips reading resume_path
+            index: Already-built FAISS index of this resume's bullets (full mode);
+                   lets callers reuse one index across jobs for the same resume
+            on_bullets: Called with the bullets as soon as they are generated,
+                        before the cover letter (e.g. to stream them to a client)
 
         Returns:
             Tuple of (FullGeneratedPackage or None, list of error messages, dict of metrics or None)
 
+        Raises:
+            FatalLLMError: If the LLM provider rejects the credentials; every
+                           other failure is reported in the error list
+
         Example:
             >>> executor = AgentExecutor(llm, encoder)
             >>> pkg, errors, metrics = await executor.run_single_job(
@@ -96,76 +214,102 @@ class AgentExecutor:
             ...     mode="full"
             ... )
         """
-        logger.info(f"Starting job execution: {job_path.name} (mode={mode})")
+        job_name = job_path.name if job_path is not None else getattr(job, "job_id", "job")
+        logger.info(f"Starting job execution: {job_name} (mode={mode})")
 
         try:
-            # Step 1: Load models
-            logger.debug(f"Loading job from {job_path}")
-            job = load_job_from_yaml(job_path)
+            # Step 1: Load models (callers may pass them in already validated)
+            if job is None:
+                logger.debug(f"Loading job from {job_path}")
+                job = _load_cached(load_job_from_yaml, job_path)
             logger.info(f"Loaded job: {job.title} at {job.company}")
 
-            logger.debug(f"Loading resume from {resume_path}")
-            resume = load_resume_from_json(resume_path)
+            if resume is None:
+                logger.debug(f"Loading resume from {resume_path}")
+                resume = _load_cached(load_resume_from_json, resume_path)
             logger.info(f"Loaded resume: {resume.name}")
 
             # Branch based on mode
             if mode == "full":
                 # FULL MODE: Use FAISS retrieval, validation, and retry
+                # (imported here so baseline runs never load numpy/FAISS)
+                from ..embeddings import retrieve_relevant_experiences
+
                 # Step 2: Build FAISS index (includes experiences and projects)
-                logger.debug("Building FAISS index for retrieval")
-                index = ResumeFaissIndex(self.encoder)
-                index.build_from_experiences(resume.experiences, resume.projects)
-                logger.info(f"Built index with {len(index)} bullets")
+                # Encoding runs on the encoder's worker thread so concurrent
+                # jobs keep making progress on their LLM calls meanwhile
+                if index is None:
+                    index = await self._index_for_resume(resume, resume_path)
+                else:
+                    logger.info(f"Reusing prebuilt index with {len(index)} bullets")
 
                 # Step 3: Retrieve relevant experiences
                 logger.debug("Retrieving relevant experiences")
-                retrieved = retrieve_relevant_experiences(
-                    job, resume, self.encoder, index, top_k=5
+                retrieved = await self.encoder.run_async(
+                    retrieve_relevant_experiences, job, resume, self.encoder, index, top_k=5
                 )
                 total_retrieved = sum(len(items) for items in retrieved.values())
                 logger.info(f"Retrieved {total_retrieved} relevant bullets for {len(retrieved)} responsibilities")
 
-                # Step 4: Generate bullets with retry
-                bullets = await self._generate_bullets_with_retry(job, resume, retrieved)
+                # Step 4: Generate bullets with retry. The bullets are streamed
+                # so the cover letter (step 5) can start from the first few
+                speculative_cover_letter = _SpeculativeCoverLetter(job, resume, self.llm)
+                try:
+                    bullets = await self._generate_bullets_with_retry(
+                        job, resume, retrieved,
+                        on_partial_bullets=speculative_cover_letter.on_partial_bullets
+                    )
 
-                if not bullets:
-                    error_msg = "Failed to generate valid bullets after retries"
-                    logger.error(error_msg)
-                    return None, [error_msg], None
+                    if not bullets:
+                        error_msg = "Failed to generate valid bullets after retries"
+                        logger.error(error_msg)
+                        return None, [error_msg], None
 
-                logger.info(f"Generated {len(bullets)} bullets successfully")
+                    logger.info(f"Generated {len(bullets)} bullets successfully")
+                    if on_bullets is not None:
+                        on_bullets(bullets)
 
-                # Step 5: Generate cover letter
-                logger.debug("Generating cover letter")
-                cover_letter = await generate_cover_letter(job, resume, bullets, self.llm)
-                logger.info("Generated cover letter")
+                    # Step 5: Generate cover letter
+                    logger.debug("Generating cover letter")
+                    cover_letter = await speculative_cover_letter.result_for(bullets)
+                    logger.info("Generated cover letter")
+                finally:
+                    speculative_cover_letter.cancel()
 
             elif mode == "baseline":
                 # BASELINE MODE: No FAISS, no retrieval, minimal validation
                 logger.info("Running in BASELINE mode (no retrieval, minimal validation)")
 
-                # Generate bullets using baseline generator
                 from ..generators import generate_bullets_baseline, generate_cover_letter_baseline
 
-                bullets = await generate_bullets_baseline(job, resume, self.llm)
+                # The baseline cover letter does not use the bullets, so both
+                # LLM calls are started together
+                logger.debug("Generating baseline bullets and cover letter")
+                cover_letter_task = asyncio.create_task(
+                    generate_cover_letter_baseline(job, resume, self.llm)
+                )
+                try:
+                    bullets = await generate_bullets_baseline(job, resume, self.llm)
 
-                if not bullets:
-                    error_msg = "Baseline generation failed to produce bullets"
-                    logger.error(error_msg)
-                    return None, [error_msg], None
+                    if not bullets:
+                        error_msg = "Baseline generation failed to produce bullets"
+                        logger.error(error_msg)
+                        return None, [error_msg], None
 
-                logger.info(f"Generated {len(bullets)} baseline bullets")
+                    logger.info(f"Generated {len(bullets)} baseline bullets")
+                    if on_bullets is not None:
+                        on_bullets(bullets)
 
-                # Generate cover letter (baseline)
-                logger.debug("Generating baseline cover letter")
-                cover_letter = await generate_cover_letter_baseline(job, resume, self.llm)
+                    cover_letter = await cover_letter_task
+                finally:
+                    cover_letter_task.cancel()  # No-op once it has finished
 
                 if not cover_letter:
                     logger.warning("Baseline cover letter generation failed")
                     # Create a minimal cover letter
                     from ..models import GeneratedCoverLetter
                     cover_letter = GeneratedCoverLetter(
-                        id=f"baseline-cover-{job.job_id}",
+                        id=BASELINE_COVER_ID_PREFIX + job.job_id,
                         job_id=job.job_id,
                         job_title=job.title,
                         company=job.company,
@@ -180,18 +324,15 @@ class AgentExecutor:
 
             # Step 6: Build full package
             logger.debug("Building full package")
-            package = FullGeneratedPackage(
-                id=f"pkg-{job.job_id}",
-                job_id=job.job_id,
-                candidate_id=resume.candidate_id,
-                bullets=bullets,
-                cover_letter=cover_letter
+            package = build_package_from_components(
+                job.job_id, resume.candidate_id, bullets, cover_letter
             )
 
             # Step 7: Final validation (mode-dependent)
             if mode == "full":
                 logger.debug("Running final package validation")
-                errors = validate_package(package, job, resume)
+                # The bullets already passed validate_bullets_only() in the retry loop
+                errors = validate_package(package, job, resume, skip_bullet_checks=True)
 
                 if errors:
                     logger.warning(f"Package has {len(errors)} validation errors")
@@ -201,10 +342,11 @@ class AgentExecutor:
             elif mode == "baseline":
                 # Minimal validation for baseline: only check min length
                 logger.debug("Running minimal baseline validation")
-                errors = []
-                for bullet in bullets:
-                    if len(bullet.text) < 30:
-                        errors.append(f"Bullet {bullet.id} too short: {len(bullet.text)} chars")
+                errors = [
+                    f"Bullet {bullet.id} too short: {len(bullet.text)} chars"
+                    for bullet in bullets
+                    if len(bullet.text) < MIN_BULLET_LENGTH
+                ]
 
                 if errors:
                     logger.warning(f"Baseline has {len(errors)} validation errors (length only)")
@@ -225,27 +367,150 @@ class AgentExecutor:
 
             return package, errors, metrics
 
+        except FatalLLMError:
+            raise
         except Exception as e:
-            logger.error(f"Job execution failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Job execution failed: {e}")
             return None, [f"Execution error: {str(e)}"], None
 
+    async def run_jobs(
+        self,
+        job_paths: Sequence[Path],
+        resume_path: Path,
+        max_concurrency: int = 10,
+        mode: str = "full"
+    ) -> list[tuple["FullGeneratedPackage | None", list[str], dict | None]]:
+        """
+        Run the agentic loop for many jobs against one resume concurrently.
+
+        The resume is read and (in full mode) indexed once and shared by every
+        job, and at most max_concurrency jobs run at a time, so N jobs take
+        about N / max_concurrency single-job latencies instead of N.
+
+        Args:
+            job_paths: Paths to job description YAML files
+            resume_path: Path to resume JSON file
+            max_concurrency: Maximum number of jobs in flight
+            mode: "full" or "baseline" (see run_single_job)
+
+        Returns:
+            One (package, errors, metrics) tuple per job path, in input order
+
+        Raises:
+            FatalLLMError: If the LLM provider rejects the credentials; jobs
+                           still running are cancelled
+
+        Example:
+            >>> executor = AgentExecutor(llm, encoder)
+            >>> results = await executor.run_jobs(job_paths, Path("data/resumes/jane-doe.json"))
+        """
+        resume = None
+        index = None
+        try:
+            resume = await asyncio.to_thread(_load_cached, load_resume_from_json, resume_path)
+            if mode == "full":
+                index = await self._index_for_resume(resume, resume_path)
+        except Exception as e:
+            # Each job retries the step that failed and reports its own error
+            logger.warning(f"Could not preload resume {resume_path}: {e}")
+            index = None
+
+        async def run_one(job_path: Path, idx: int):
+            return await self.run_single_job(
+                job_path, resume_path, mode, resume=resume, index=index
+            )
+
+        return await run_bounded(list(job_paths), run_one, max_concurrency)
+
+    async def _index_for_resume(
+        self,
+        resume: "CandidateProfile",
+        resume_path: Path | None
+    ) -> "ResumeFaissIndex":
+        """
+        Return the FAISS index for a resume, building it on first use.
+
+        Indexes are memoized by resolved resume path and mtime, so every job
+        run against the same resume file reuses one encoding pass; an edited
+        file is re-encoded and replaces the old entry. Concurrent callers
+        await the same build, and only the INDEX_CACHE_MAX_ENTRIES most
+        recently used resumes are kept.
+
+        Args:
+            resume: Loaded resume to index
+            resume_path: File the resume was loaded from (None disables caching)
+
+        Returns:
+            Built ResumeFaissIndex
+
+        Raises:
+            ValueError: If the resume has no bullets to index
+        """
+        key = mtime = None
+        if resume_path is not None:
+            try:
+                key, mtime = str(resume_path.resolve()), resume_path.stat().st_mtime
+            except OSError:
+                key = None
+
+        if key is None:
+            return await self._build_index(resume)
+
+        cached = self._index_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            self._index_cache.move_to_end(key)
+            logger.debug("Reusing cached index build")
+            return await asyncio.shield(cached[1])
+
+        task = asyncio.ensure_future(self._build_index(resume))
+        self._index_cache[key] = (mtime, task)
+        self._index_cache.move_to_end(key)
+        while len(self._index_cache) > INDEX_CACHE_MAX_ENTRIES:
+            self._index_cache.popitem(last=False)
+
+        try:
+            # Shielded: a cancelled caller must not cancel other callers' build
+            return await asyncio.shield(task)
+        except Exception:
+            # Do not cache failed builds (e.g. no bullets to index)
+            if self._index_cache.get(key, (None, None))[1] is task:
+                del self._index_cache[key]
+            raise
+
+    async def _build_index(self, resume: "CandidateProfile") -> "ResumeFaissIndex":
+        """Encode a resume's bullets into a new FAISS index."""
+        logger.debug("Building FAISS index for retrieval")
+        from ..embeddings import ResumeFaissIndex
+
+        index = ResumeFaissIndex(self.encoder)
+        await self.encoder.run_async(
+            index.build_from_experiences, resume.experiences, resume.projects
+        )
+        logger.info(f"Built index with {len(index)} bullets")
+        return index
+
     async def _generate_bullets_with_retry(
         self,
         job: "JobDescription",
         resume: "CandidateProfile",
-        retrieved: dict[str, list[dict]]
+        retrieved: dict[str, list[dict]],
+        on_partial_bullets: Callable[[list["GeneratedBullet"]], None] | None = None
     ) -> list["GeneratedBullet"] | None:
         """
         Generate bullets with validation and retry logic.
 
         If validation fails, provides feedback to LLM and retries up to max_retries times.
+        Stops early when another attempt cannot change the outcome: when the
+        validation errors are the same as after the previous feedback (the next
+        prompt would be identical), or when the LLM request itself failed after
+        the client's own retries.
 
         Args:
             job: Target job description
             resume: Candidate's resume
             retrieved: Retrieved relevant experiences
+            on_partial_bullets: Streaming callback passed to generate_bullets_for_job();
+                                also called with [] when a retry starts
 
         Returns:
             List of validated bullets, or None if all retries failed
@@ -256,6 +521,8 @@ class AgentExecutor:
         for attempt in range(self.max_retries):
             try:
                 logger.info(f"Bullet generation attempt {attempt + 1}/{self.max_retries}")
+                if attempt > 0 and on_partial_bullets is not None:
+                    on_partial_bullets([])  # The previous attempt's bullets are discarded
 
                 # Generate bullets - pass validation feedback if available
                 bullets = await generate_bullets_for_job(
@@ -263,7 +530,8 @@ class AgentExecutor:
                     resume,
                     retrieved,
                     self.llm,
-                    validation_feedback=validation_feedback
+                    validation_feedback=validation_feedback,
+                    on_partial_bullets=on_partial_bullets
                 )
 
                 # Validate
@@ -280,11 +548,23 @@ class AgentExecutor:
 
                 if attempt < self.max_retries - 1:
                     # Prepare feedback for next attempt
-                    validation_feedback = "\n".join(errors)
+                    feedback = "\n".join(errors)
+                    if feedback == validation_feedback:
+                        logger.warning("Validation errors unchanged by feedback; not retrying")
+                        last_error = errors
+                        break
+                    validation_feedback = feedback
                     logger.info("Retrying with validation feedback...")
                 else:
                     last_error = errors
 
+            except FatalLLMError:
+                raise
+            except LLMRetriesExhaustedError as e:
+                # The client already retried this request with backoff
+                logger.error(f"Bullet generation attempt {attempt + 1} failed: {e}")
+                last_error = [str(e)]
+                break
             except Exception as e:
                 logger.error(f"Bullet generation attempt {attempt + 1} failed: {e}")
                 last_error = [str(e)]
@@ -293,8 +573,8 @@ class AgentExecutor:
                     logger.info("Retrying after error...")
                     validation_feedback = f"Previous attempt raised exception: {str(e)}"
 
-        # All retries exhausted
-        logger.error(f"Failed to generate valid bullets after {self.max_retries} attempts")
+        # All retries exhausted, or further attempts could not help
+        logger.error("Failed to generate valid bullets")
         if last_error:
             logger.error(f"Last errors: {last_error[:3]}")
 
@@ -321,10 +601,8 @@ def build_package_from_components(
     Returns:
         FullGeneratedPackage object
     """
-    from ..models import FullGeneratedPackage
-
     package = FullGeneratedPackage(
-        id=f"pkg-{job_id}",
+        id=PACKAGE_ID_PREFIX + job_id,
         job_id=job_id,
         candidate_id=candidate_id,
         bullets=bullets,
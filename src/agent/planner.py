@@ -68,13 +68,32 @@ class Planner:
         """
         Analyze skill gaps between job and resume.
 
+        Skills are compared case- and whitespace-insensitively through hash
+        sets, so the cost is O(N + M) rather than a scan of every pair.
+
+        Args:
+            job_skills: Skills the job asks for
+            resume_skills: Skills listed on the resume
+
         Returns:
-            Dictionary with 'matched', 'missing', 'extra' skills
+            Dictionary with 'matched', 'missing', 'extra' skills; each list keeps
+            the input order and spelling, without duplicates
 
-        TODO: Implement skill matching logic (consider synonyms)
+        TODO: Consider synonyms (e.g. "JS" / "JavaScript")
         """
+        job_set = {skill.strip().lower() for skill in job_skills}
+        resume_set = frozenset(skill.strip().lower() for skill in resume_skills)
+
+        def select(skills: List[str], keep) -> List[str]:
+            selected: Dict[str, str] = {}
+            for skill in skills:
+                key = skill.strip().lower()
+                if keep(key) and key not in selected:
+                    selected[key] = skill
+            return list(selected.values())
+
         return {
-            "matched": [],
-            "missing": [],
-            "extra": []
+            "matched": select(job_skills, lambda key: key in resume_set),
+            "missing": select(job_skills, lambda key: key not in resume_set),
+            "extra": select(resume_skills, lambda key: key not in job_set)
         }
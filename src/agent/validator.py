@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Shortest bullet text (in characters) accepted in full and baseline mode
+MIN_BULLET_LENGTH = 30
+
 
 def validate_bullet_length(
     bullet: "GeneratedBullet",
@@ -41,8 +44,8 @@ def validate_bullet_length(
     bullet_len = len(bullet.text)
 
     # Check minimum length (HARD CHECK - strictly enforced)
-    if bullet_len < 30:
-        return f"Bullet '{bullet.id}' too short: {bullet_len} chars (min 30)"
+    if bullet_len < MIN_BULLET_LENGTH:
+        return f"Bullet '{bullet.id}' too short: {bullet_len} chars (min {MIN_BULLET_LENGTH})"
 
     # Check maximum length (SOFT CHECK - warning only, no failure)
     if bullet_len > max_len:
@@ -309,7 +312,8 @@ def detect_hallucinations(
 def validate_package(
     pkg: "FullGeneratedPackage",
     job: "JobDescription",
-    resume: "CandidateProfile"
+    resume: "CandidateProfile",
+    skip_bullet_checks: bool = False
 ) -> list[str]:
     """
     Validate entire generated package (bullets + cover letter).
@@ -320,6 +324,8 @@ def validate_package(
         pkg: Full generated package to validate
         job: Target job description
         resume: Candidate's resume
+        skip_bullet_checks: Skip the per-bullet length and hallucination checks,
+                            for bullets that already passed validate_bullets_only()
 
     Returns:
         List of error messages (empty list if all valid)
@@ -336,7 +342,10 @@ def validate_package(
     errors = []
 
     # Validate bullets
-    if pkg.bullets:
+    if pkg.bullets and skip_bullet_checks:
+        logger.debug("Skipping per-bullet checks for already validated bullets")
+
+    elif pkg.bullets:
         logger.debug(f"Validating {len(pkg.bullets)} bullets")
 
         for bullet in pkg.bullets:
@@ -0,0 +1,262 @@
+"""
+Batch Execution
+Runs large job batches through a bounded pool of workers, optionally under an
+adaptive concurrency limit.
+"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager, suppress
+from typing import Any, Awaitable, Callable, Deque, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+async def run_bounded(
+    items: Sequence[Any],
+    process: Callable[[Any, int], Awaitable[Any]],
+    concurrency: int,
+    return_exceptions: bool = False,
+    on_result: Optional[Callable[[int, Any], None]] = None,
+    stop: Optional[asyncio.Event] = None,
+) -> List[Any]:
+    """
+    Apply an async function to every item with a fixed pool of workers.
+
+    ``concurrency`` worker coroutines pull (index, item) pairs from a queue
+    bounded to twice that size, so only O(concurrency) tasks and queued items
+    exist at once instead of one task per item, and the producer waits while
+    workers are busy.
+
+    Args:
+        items: Items to process
+        process: Async function called as process(item, index)
+        concurrency: Number of workers (maximum items in flight)
+        return_exceptions: Store an item's exception as its result instead of
+                           cancelling the remaining work and raising it
+        on_result: Called as on_result(index, result) as soon as each item
+                   finishes (completion order), e.g. to log progress or start
+                   downstream work before the slowest item is done
+        stop: Once set, no further items are started (items already running
+              finish normally), e.g. when a shared budget is exhausted
+
+    Returns:
+        One result per item, in input order; items skipped because ``stop``
+        was set are left as None
+
+    Example:
+        >>> results = await run_bounded(pairs, process_pair, concurrency=3)
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    results: List[Any] = [None] * len(items)
+    num_workers = min(concurrency, len(items))
+    if num_workers == 0:
+        return results
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def produce() -> None:
+        for index, item in enumerate(items):
+            if stop is not None and stop.is_set():
+                break
+            await queue.put((index, item))
+        for _ in range(num_workers):
+            await queue.put(None)
+
+    async def work() -> None:
+        while (entry := await queue.get()) is not None:
+            index, item = entry
+            if stop is not None and stop.is_set():
+                continue
+            try:
+                result = await process(item, index)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                result = e
+            results[index] = result
+            if on_result is not None:
+                on_result(index, result)
+
+    tasks = [asyncio.create_task(produce())]
+    tasks.extend(asyncio.create_task(work()) for _ in range(num_workers))
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return results
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit that adapts to rate-limit feedback (additive increase,
+    multiplicative decrease).
+
+    Starts at ``initial`` slots, adds one slot after every ``increase_every``
+    consecutive successes (up to ``maximum``) and halves on a throttle signal
+    (down to 1). Throttles within ``cooldown`` seconds of the last decrease are
+    ignored, since requests already in flight report the same overload. Work
+    already holding a slot is never interrupted; a lower limit only delays new
+    acquisitions.
+
+    Example:
+        >>> limit = AdaptiveConcurrency(initial=3, maximum=32)
+        >>> async with limit:
+        ...     result = await call_llm()
+        >>> limit.record_success()
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: int,
+        increase_every: int = 10,
+        cooldown: float = 5.0,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            initial: Starting number of slots
+            maximum: Upper bound on the number of slots
+            increase_every: Consecutive successes needed to add a slot (default: 10)
+            cooldown: Seconds after a decrease during which throttles are ignored (default: 5.0)
+        """
+        if not 1 <= initial <= maximum:
+            raise ValueError(f"Need 1 <= initial <= maximum, got initial={initial}, maximum={maximum}")
+
+        self.limit = initial
+        self.maximum = maximum
+        self.increase_every = increase_every
+        self.cooldown = cooldown
+
+        self._active = 0
+        self._streak = 0
+        self._last_decrease = float("-inf")
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return self
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                with suppress(ValueError):
+                    self._waiters.remove(future)
+            else:
+                self._release()  # Granted a slot just before being cancelled
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._release()
+
+    def record_success(self) -> None:
+        """Count a success; add a slot after ``increase_every`` in a row."""
+        self._streak += 1
+        if self._streak >= self.increase_every and self.limit < self.maximum:
+            self._streak = 0
+            self.limit += 1
+            logger.debug(f"Concurrency limit raised to {self.limit}")
+            self._wake()
+
+    def record_throttle(self) -> None:
+        """Halve the limit after a rate-limit response (at most once per cooldown)."""
+        self._streak = 0
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(1, self.limit // 2)
+        logger.info(f"Rate limited; concurrency limit lowered to {self.limit}")
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._active < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._active += 1
+                future.set_result(None)
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Use uvloop (winloop on Windows) for event loops created after this call.
+
+    libuv-based loops schedule tasks and poll sockets with less overhead than
+    the stock selector loop, which adds up when many LLM requests are in
+    flight. Call it before asyncio.run(); a loop that is already running is
+    not replaced. Does nothing if the package is not installed.
+
+    Returns:
+        True if a faster event loop policy was installed
+
+    Example:
+        >>> install_fast_event_loop()
+        >>> asyncio.run(main_async(args))
+    """
+    module_name = "winloop" if sys.platform == "win32" else "uvloop"
+    try:
+        loop_module = importlib.import_module(module_name)
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+    logger.debug(f"Using {module_name} event loop")
+    return True
+
+
+# Per running loop: [number of open eager_tasks() blocks, task factory to restore]
+_eager_task_state: dict = {}
+
+
+@contextmanager
+def eager_tasks() -> Iterator[None]:
+    """
+    Start tasks eagerly on the running loop for the duration of the block.
+
+    With asyncio.eager_task_factory (Python 3.12+), a new task runs
+    synchronously until its first real suspension, so steps that finish
+    without awaiting I/O (cache hits, short-circuited validation) skip an
+    event-loop round trip. Blocks may overlap (e.g. concurrent batch runs on
+    one loop): the factory is installed by the first block to enter and the
+    original one restored when the last block exits, whatever the order. On
+    older Pythons this is a no-op.
+
+    Example:
+        >>> with eager_tasks():
+        ...     results = await run_bounded(pairs, process_pair, concurrency=3)
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        yield
+        return
+
+    loop = asyncio.get_running_loop()
+    state = _eager_task_state.get(loop)
+    if state is None:
+        state = _eager_task_state[loop] = [0, loop.get_task_factory()]
+        loop.set_task_factory(factory)
+    state[0] += 1
+    try:
+        yield
+    finally:
+        state[0] -= 1
+        if state[0] == 0:
+            del _eager_task_state[loop]
+            loop.set_task_factory(state[1])
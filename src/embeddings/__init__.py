@@ -3,7 +3,7 @@ Embeddings Package
 Handles text encoding and vector search with SentenceBERT and FAISS.
 """
 
-from .sentence_bert import SentenceBertEncoder
+from .sentence_bert import SentenceBertEncoder, get_shared_encoder
 from .faiss_index import ResumeFaissIndex
 from .retriever import (
     retrieve_relevant_experiences,
@@ -17,6 +17,7 @@ __all__ = [
     # Core classes
     "SentenceBertEncoder",
     "ResumeFaissIndex",
+    "get_shared_encoder",
     # Retrieval functions
     "retrieve_relevant_experiences",
     "retrieve_for_skills",
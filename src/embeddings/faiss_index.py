@@ -18,8 +18,14 @@ class ResumeFaissIndex:
     """
     FAISS-based vector store for resume experience semantic search.
 
-    Uses IndexFlatIP (inner product) for cosine similarity search.
-    Stores embeddings of resume bullets with metadata for retrieval.
+    Uses inner product over normalized embeddings for cosine similarity.
+    Small resumes (up to brute_force_max_vectors bullets) are searched exactly
+    with one faiss.knn() call straight over the stored embeddings; larger
+    corpora get an HNSW graph, whose queries touch ~log(N) vectors instead of
+    all of them, over 8-bit scalar-quantized vectors (IndexHNSWSQ, a quarter of
+    the float32 size) unless quantize=False. Stores embeddings of resume
+    bullets (or only their quantized codes, for large corpora) with metadata
+    for retrieval.
 
     Example:
         >>> encoder = SentenceBertEncoder()
@@ -28,36 +34,67 @@ class ResumeFaissIndex:
         >>> results = index.search("machine learning experience", top_k=3)
     """
 
-    def __init__(self, encoder: SentenceBertEncoder):
+    def __init__(
+        self,
+        encoder: SentenceBertEncoder,
+        brute_force_max_vectors: int = 10_000,
+        hnsw_m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        quantize: bool = True
+    ):
         """
         Initialize FAISS index with encoder.
 
         Args:
             encoder: SentenceBertEncoder instance for embedding text
+            brute_force_max_vectors: Largest number of bullets searched exactly
+                                     without an index object; above it an HNSW
+                                     index is built (default: 10000)
+            hnsw_m: Neighbors per node in the HNSW graph (default: 32)
+            ef_construction: HNSW candidate list size while building (default: 40)
+            ef_search: HNSW candidate list size per query, raised to top_k when
+                       smaller; higher trades speed for recall (default: 16)
+            quantize: Store HNSW-indexed vectors as 8-bit codes instead of
+                      float32; small corpora are always searched exactly
+                      (default: True)
 
         Note:
             Index is not built until build_from_experiences() is called
         """
         self.encoder = encoder
-        self._index: "faiss.IndexFlatIP | None" = None
+        self.brute_force_max_vectors = brute_force_max_vectors
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.quantize = quantize
+        self._index: "faiss.Index | None" = None
         self.embeddings: np.ndarray | None = None
         self.metadata: list[dict] = []  # {"experience_id": str, "text": str}
 
     @property
-    def index(self) -> "faiss.IndexFlatIP":
+    def index(self) -> "faiss.Index":
         """
         Get the FAISS index, creating it if needed.
 
+        Small resumes are searched without one, so an exact IndexFlatIP is
+        created from the stored embeddings on first access.
+
         Returns:
-            FAISS IndexFlatIP instance
+            FAISS IndexHNSWSQ/IndexHNSWFlat (large corpora) or IndexFlatIP instance
 
         Raises:
             RuntimeError: If index not built yet
         """
         if self._index is None:
-            raise RuntimeError(
-                "Index not built. Call build_from_experiences() first."
-            )
+            if self.embeddings is None:
+                raise RuntimeError(
+                    "Index not built. Call build_from_experiences() first."
+                )
+            import faiss
+
+            self._index = faiss.IndexFlatIP(self.embeddings.shape[1])
+            self._index.add(self.embeddings)
         return self._index
 
     def build_from_experiences(
@@ -117,17 +154,31 @@ class ResumeFaissIndex:
         print(f"Encoding {len(all_texts)} bullets...")
         embeddings = self.encoder.encode_texts(all_texts, show_progress=True)
 
-        # Create FAISS index (IndexFlatIP for cosine similarity with normalized vectors)
-        dimension = embeddings.shape[1]
-        self._index = faiss.IndexFlatIP(dimension)
-
-        # Add embeddings to index
-        self._index.add(embeddings)
-
         # Store embeddings and metadata
+        self._index = None
         self.embeddings = embeddings
         self.metadata = all_metadata
 
+        # Build an HNSW graph only when brute-force search would be too slow.
+        # Inner product over normalized vectors keeps cosine similarity
+        if len(all_texts) > self.brute_force_max_vectors:
+            dimension = embeddings.shape[1]
+            if self.quantize:
+                self._index = faiss.IndexHNSWSQ(
+                    dimension, faiss.ScalarQuantizer.QT_8bit, self.hnsw_m,
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                # Learns each dimension's value range for the 8-bit codes
+                self._index.train(embeddings)
+            else:
+                self._index = faiss.IndexHNSWFlat(
+                    dimension, self.hnsw_m, faiss.METRIC_INNER_PRODUCT
+                )
+            self._index.hnsw.efConstruction = self.ef_construction
+            self._index.add(embeddings)
+            if self.quantize:
+                self.embeddings = None  # The index holds the (compressed) vectors
+
         print(f"Built FAISS index with {len(self)} items")
 
     def search(self, query: str, top_k: int = 5) -> list[dict]:
@@ -149,31 +200,65 @@ class ResumeFaissIndex:
             >>> for r in results:
             ...     print(f"[{r['score']:.3f}] {r['text'][:60]}...")
         """
-        # Encode query
-        query_embedding = self.encoder.encode_single(query)
+        return self.search_many([query], top_k=top_k)[0]
 
-        # Reshape for FAISS (expects 2D array)
-        query_embedding = query_embedding.reshape(1, -1)
+    def search_many(self, queries: list[str], top_k: int = 5) -> list[list[dict]]:
+        """
+        Search for the top-k most similar resume bullets for several queries.
+
+        All queries are encoded in one batched forward pass and searched with a
+        single FAISS call, instead of one encode + search per query.
 
-        # Search index
-        scores, indices = self.index.search(query_embedding, top_k)
+        Args:
+            queries: Query texts (e.g., every responsibility of a job)
+            top_k: Number of results to return per query
+
+        Returns:
+            One result list per query, in query order (same format as search())
+
+        Example:
+            >>> per_query = index.search_many(job.responsibilities, top_k=5)
+        """
+        if not queries:
+            return []
+
+        if not self.is_built():
+            raise RuntimeError("Index not built. Call build_from_experiences() first.")
+
+        # Encode all queries at once (FAISS expects a 2D float32 array)
+        query_embeddings = self.encoder.encode_texts(queries)
+
+        # Search index, or all stored embeddings directly for small resumes
+        if self._index is not None:
+            if hasattr(self._index, "hnsw"):
+                self._index.hnsw.efSearch = max(self.ef_search, top_k)
+            scores, indices = self._index.search(query_embeddings, top_k)
+        else:
+            import faiss
+
+            scores, indices = faiss.knn(
+                query_embeddings, self.embeddings, top_k, metric=faiss.METRIC_INNER_PRODUCT
+            )
 
         # Build results with metadata
-        results = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx == -1:  # FAISS returns -1 for empty slots
-                continue
-
-            meta = self.metadata[idx]
-            results.append({
-                "experience_id": meta["experience_id"],  # Backwards compatible
-                "source_id": meta.get("source_id", meta["experience_id"]),
-                "source_type": meta.get("source_type", "experience"),
-                "text": meta["text"],
-                "score": float(score),
-            })
-
-        return results
+        all_results = []
+        for row_scores, row_indices in zip(scores, indices):
+            results = []
+            for score, idx in zip(row_scores, row_indices):
+                if idx == -1:  # FAISS returns -1 for empty slots
+                    continue
+
+                meta = self.metadata[idx]
+                results.append({
+                    "experience_id": meta["experience_id"],  # Backwards compatible
+                    "source_id": meta.get("source_id", meta["experience_id"]),
+                    "source_type": meta.get("source_type", "experience"),
+                    "text": meta["text"],
+                    "score": float(score),
+                })
+            all_results.append(results)
+
+        return all_results
 
     def get_all_bullets_for_experience(self, experience_id: str) -> list[str]:
         """
@@ -193,7 +278,7 @@ class ResumeFaissIndex:
 
     def is_built(self) -> bool:
         """Check if index has been built."""
-        return self._index is not None
+        return self._index is not None or self.embeddings is not None
 
     def __len__(self) -> int:
         """Return number of vectors in index."""
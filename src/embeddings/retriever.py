@@ -61,14 +61,9 @@ def retrieve_relevant_experiences(
     if not job.responsibilities:
         raise ValueError("Job has no responsibilities to search for")
 
-    results = {}
-
-    for responsibility in job.responsibilities:
-        # Search for relevant bullets
-        retrieved_items = index.search(responsibility, top_k=top_k)
-        results[responsibility] = retrieved_items
-
-    return results
+    # Search for relevant bullets for all responsibilities in one batch
+    retrieved = index.search_many(job.responsibilities, top_k=top_k)
+    return dict(zip(job.responsibilities, retrieved))
 
 
 def retrieve_for_skills(
@@ -103,15 +98,10 @@ def retrieve_for_skills(
     if not index.is_built():
         raise RuntimeError("FAISS index must be built before retrieval")
 
-    results = {}
-
-    for skill in skills:
-        # Create a query that emphasizes experience with the skill
-        query = f"experience with {skill}"
-        retrieved_items = index.search(query, top_k=top_k)
-        results[skill] = retrieved_items
-
-    return results
+    # Create queries that emphasize experience with each skill
+    queries = [f"experience with {skill}" for skill in skills]
+    retrieved = index.search_many(queries, top_k=top_k)
+    return dict(zip(skills, retrieved))
 
 
 def get_top_matching_experiences(
@@ -3,12 +3,94 @@ SentenceBERT Encoder
 Handles text embedding using Sentence Transformers with lazy loading.
 """
 
+import asyncio
+import functools
+import logging
+import os
 import numpy as np
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+logger = logging.getLogger(__name__)
+
+# Dynamically int8-quantized ONNX export shipped in the sentence-transformers
+# model repos (e.g. all-MiniLM-L6-v2). For other models, create it once with
+# sentence_transformers.backend.export_dynamic_quantized_onnx_model(model, "avx512_vnni", path)
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+def detect_device() -> str:
+    """
+    Pick the fastest available torch device: CUDA, then Apple MPS, then CPU.
+
+    Returns:
+        Device string accepted by SentenceTransformer ('cuda', 'mps' or 'cpu')
+    """
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            return "cuda"
+        mps = getattr(torch.backends, "mps", None)
+        if mps is not None and mps.is_available():
+            return "mps"
+    except Exception:
+        pass
+    return "cpu"
+
+
+def _positive_int_env(name: str) -> int | None:
+    """Return an environment variable as a positive int, or None if unset/invalid."""
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def configure_cpu_threads(num_threads: int | None = None) -> int:
+    """
+    Size torch's CPU thread pools for encoder inference.
+
+    Call before the first torch import where possible: the OMP/MKL variables
+    are only read when those runtimes start. An OMP_NUM_THREADS set in the
+    environment overrides the default, which is this worker's share of the
+    CPUs the process may run on (split across WEB_CONCURRENCY server workers)
+    minus one, leaving a core for the asyncio event loop.
+
+    Args:
+        num_threads: Intra-op thread count; derived from OMP_NUM_THREADS or
+                     the CPU affinity and worker count if None
+
+    Returns:
+        Number of intra-op threads configured
+    """
+    if num_threads is None:
+        num_threads = _positive_int_env("OMP_NUM_THREADS")
+    if num_threads is None:
+        try:
+            available = len(os.sched_getaffinity(0))
+        except AttributeError:
+            available = os.cpu_count() or 4
+        workers = _positive_int_env("WEB_CONCURRENCY") or 1
+        num_threads = max(1, available // workers - 1)
+
+    os.environ.setdefault("OMP_NUM_THREADS", str(num_threads))
+    os.environ.setdefault("MKL_NUM_THREADS", str(num_threads))
+
+    import torch
+
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started
+        pass
+    return num_threads
+
 
 class SentenceBertEncoder:
     """
@@ -22,9 +104,18 @@ class SentenceBertEncoder:
     - Fast inference
     - Good quality for semantic search
     - ~80MB model size
+
+    With use_onnx=True and no GPU, the int8-quantized ONNX export is run
+    through ONNX Runtime instead of FP32 torch (needs
+    ``sentence-transformers[onnx]``); falls back to torch if unavailable.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        device: str | None = None,
+        use_onnx: bool = False
+    ):
         """
         Initialize encoder (model not loaded yet).
 
@@ -34,10 +125,16 @@ class SentenceBertEncoder:
                        - 'all-MiniLM-L6-v2' (384d, fast, default)
                        - 'all-mpnet-base-v2' (768d, higher quality)
                        - 'all-MiniLM-L12-v2' (384d, better quality)
+            device: Torch device ('cuda', 'mps', 'cpu'); auto-detected on load if None
+            use_onnx: Use the int8 ONNX model when running on CPU (default: False)
         """
         self.model_name = model_name
+        self.device = device
+        self.use_onnx = use_onnx
+        self.backend = "torch"
         self._model: "SentenceTransformer | None" = None
         self._embedding_dim: int | None = None
+        self._worker: ThreadPoolExecutor | None = None
 
     @property
     def model(self) -> "SentenceTransformer":
@@ -53,19 +150,40 @@ class SentenceBertEncoder:
         if self._model is None:
             from sentence_transformers import SentenceTransformer
 
-            self._model = SentenceTransformer(self.model_name)
+            if self.device is None:
+                self.device = detect_device()
+
+            if self.use_onnx and self.device == "cpu":
+                try:
+                    self._model = SentenceTransformer(
+                        self.model_name,
+                        device="cpu",
+                        backend="onnx",
+                        model_kwargs={"file_name": ONNX_INT8_FILE, "provider": "CPUExecutionProvider"},
+                    )
+                    self.backend = "onnx"
+                except Exception as e:
+                    logger.warning(f"ONNX int8 model unavailable ({e}); falling back to torch")
+
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name, device=self.device)
             # Cache embedding dimension
             self._embedding_dim = self._model.get_sentence_embedding_dimension()
 
         return self._model
 
-    def encode_texts(self, texts: list[str], batch_size: int = 32, show_progress: bool = False) -> np.ndarray:
+    def encode_texts(self, texts: list[str], batch_size: int = 64, show_progress: bool = False) -> np.ndarray:
         """
         Encode multiple texts into embeddings.
 
+        Pass all texts in one call rather than looping over encode_single():
+        SentenceTransformer sorts the list by length before batching, so each
+        batch is padded only to its own longest text, and rows come back in
+        input order.
+
         Args:
             texts: List of text strings to encode
-            batch_size: Batch size for encoding (default: 32)
+            batch_size: Batch size for encoding (default: 64)
             show_progress: Show progress bar (default: False)
 
         Returns:
@@ -128,6 +246,43 @@ class SentenceBertEncoder:
             _ = self.model
         return self._embedding_dim
 
+    def warmup(self, num_texts: int = 4) -> None:
+        """
+        Load the model and run one small batch through it.
+
+        Pays the model load and device initialization (e.g. CUDA context)
+        up front so the first real request does not.
+
+        Args:
+            num_texts: Number of dummy texts in the warmup batch (default: 4)
+        """
+        self.encode_texts(["warmup"] * num_texts)
+
+    async def run_async(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run encoder-bound work on this encoder's worker thread.
+
+        Encoding is CPU/GPU-bound; calling it from a coroutine would stall
+        every other task on the event loop. The worker is a single thread, so
+        calls into the model are serialized and the model is not replicated.
+
+        Args:
+            func: Function that uses this encoder (e.g. index.build_from_experiences)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            func's return value
+
+        Example:
+            >>> index = ResumeFaissIndex(encoder)
+            >>> await encoder.run_async(index.build_from_experiences, resume.experiences)
+        """
+        if self._worker is None:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sbert")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._worker, functools.partial(func, *args, **kwargs))
+
     def is_loaded(self) -> bool:
         """
         Check if model is already loaded in memory.
@@ -140,4 +295,30 @@ class SentenceBertEncoder:
     def __repr__(self) -> str:
         """String representation."""
         loaded = "loaded" if self.is_loaded() else "not loaded"
-        return f"SentenceBertEncoder(model='{self.model_name}', {loaded})"
+        device = self.device or "auto"
+        return (
+            f"SentenceBertEncoder(model='{self.model_name}', device='{device}', "
+            f"backend='{self.backend}', {loaded})"
+        )
+
+
+_shared_encoders: dict[str, SentenceBertEncoder] = {}
+
+
+def get_shared_encoder(model_name: str = "all-MiniLM-L6-v2") -> SentenceBertEncoder:
+    """
+    Return the process-wide encoder for a model, creating it on first use.
+
+    Batch runs in the same process reuse one encoder, so the model is loaded
+    into memory only once.
+
+    Args:
+        model_name: HuggingFace model identifier
+
+    Returns:
+        Shared SentenceBertEncoder (model loads lazily on first encode)
+    """
+    encoder = _shared_encoders.get(model_name)
+    if encoder is None:
+        encoder = _shared_encoders[model_name] = SentenceBertEncoder(model_name)
+    return encoder
@@ -237,25 +237,15 @@ def compute_alignment_score(
     if not bullets:
         return 0.0
 
-    # Get job embedding
-    job_text = job.get_search_text()
-    job_embedding = encoder.encode([job_text])[0]
+    # Embed the job text and every bullet in one batched forward pass
+    embeddings = encoder.encode_texts([job.get_search_text()] + [b.text for b in bullets])
+    job_embedding, bullet_embeddings = embeddings[0], embeddings[1:]
 
-    # Get bullet embeddings
-    bullet_texts = [b.text for b in bullets]
-    bullet_embeddings = encoder.encode(bullet_texts)
-
-    # Compute cosine similarities
-    from numpy import dot
-    from numpy.linalg import norm
-
-    similarities = []
-    for bullet_emb in bullet_embeddings:
-        similarity = dot(job_embedding, bullet_emb) / (norm(job_embedding) * norm(bullet_emb))
-        similarities.append(float(similarity))
+    # Embeddings are L2-normalized, so cosine similarity is a dot product
+    similarities = bullet_embeddings @ job_embedding
 
     # Return average similarity
-    return sum(similarities) / len(similarities) if similarities else 0.0
+    return float(similarities.mean())
 
 
 def compute_gold_similarity(
@@ -277,25 +267,15 @@ def compute_gold_similarity(
     if not bullets or not gold_bullets:
         return 0.0
 
-    # Get embeddings
-    bullet_texts = [b.text for b in bullets]
-    bullet_embeddings = encoder.encode(bullet_texts)
-    gold_embeddings = encoder.encode(gold_bullets)
-
-    # Compute pairwise similarities and take max for each generated bullet
-    from numpy import dot
-    from numpy.linalg import norm
-
-    similarities = []
-    for bullet_emb in bullet_embeddings:
-        # Find best match in gold set
-        best_sim = 0.0
-        for gold_emb in gold_embeddings:
-            sim = dot(bullet_emb, gold_emb) / (norm(bullet_emb) * norm(gold_emb))
-            best_sim = max(best_sim, float(sim))
-        similarities.append(best_sim)
-
-    return sum(similarities) / len(similarities) if similarities else 0.0
+    # Embed generated and gold bullets in one batched forward pass
+    embeddings = encoder.encode_texts([b.text for b in bullets] + list(gold_bullets))
+    bullet_embeddings, gold_embeddings = embeddings[:len(bullets)], embeddings[len(bullets):]
+
+    # Pairwise cosine similarities (embeddings are L2-normalized); take the
+    # best gold match for each generated bullet, floored at 0
+    best_matches = (bullet_embeddings @ gold_embeddings.T).max(axis=1).clip(min=0.0)
+
+    return float(best_matches.mean())
 
 
 async def compare_systems(
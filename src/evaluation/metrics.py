@@ -62,21 +62,21 @@ def compute_package_metrics(
     metrics["num_bullets"] = len(bullets)
 
     if bullets:
-        # Bullet length metrics
-        bullet_lengths_chars = [len(b.text) for b in bullets]
-        bullet_lengths_words = [len(b.text.split()) for b in bullets]
+        # Bullet lengths and mentioned skills, gathered in one pass over the bullets
+        bullet_lengths_chars = []
+        bullet_lengths_words = []
+        bullet_skills_mentioned = set()
+        for bullet in bullets:
+            bullet_lengths_chars.append(len(bullet.text))
+            bullet_lengths_words.append(len(bullet.text.split()))
+            if bullet.skills_covered:
+                bullet_skills_mentioned.update(s.lower() for s in bullet.skills_covered)
 
         metrics["avg_bullet_length_chars"] = sum(bullet_lengths_chars) / len(bullet_lengths_chars)
         metrics["avg_bullet_length_words"] = sum(bullet_lengths_words) / len(bullet_lengths_words)
         metrics["min_bullet_length_chars"] = min(bullet_lengths_chars)
         metrics["max_bullet_length_chars"] = max(bullet_lengths_chars)
 
-        # Collect all skills mentioned in bullets
-        bullet_skills_mentioned = set()
-        for bullet in bullets:
-            if bullet.skills_covered:
-                bullet_skills_mentioned.update(s.lower() for s in bullet.skills_covered)
-
         # Required skills coverage
         required_skills = job.required_skills if job.required_skills else []
         metrics["num_required_skills"] = len(required_skills)
@@ -253,15 +253,18 @@ def compute_basic_metrics(
     metrics["num_bullets"] = len(bullets)
 
     if bullets:
-        # Average bullet length
-        bullet_lengths = [len(b.text) for b in bullets]
-        metrics["avg_bullet_length_chars"] = sum(bullet_lengths) / len(bullet_lengths)
-
-        # Collect all skills mentioned in bullets
+        # Lengths, mentioned skills and source experiences in one pass
+        total_length = 0
         bullet_skills_mentioned = set()
+        unique_sources = set()
         for bullet in bullets:
+            total_length += len(bullet.text)
             if bullet.skills_covered:
                 bullet_skills_mentioned.update(s.lower() for s in bullet.skills_covered)
+            if bullet.source_experience_id:
+                unique_sources.add(bullet.source_experience_id)
+
+        metrics["avg_bullet_length_chars"] = total_length / len(bullets)
 
         # Required skills coverage
         required_skills = job.required_skills if job.required_skills else []
@@ -281,11 +284,6 @@ def compute_basic_metrics(
         else:
             metrics["nice_to_have_skill_coverage"] = 1.0
 
-        # Count unique source experiences
-        unique_sources = set()
-        for bullet in bullets:
-            if bullet.source_experience_id:
-                unique_sources.add(bullet.source_experience_id)
         metrics["num_experiences_with_bullets"] = len(unique_sources)
 
     else:
@@ -162,9 +162,7 @@ async def run_dataset_eval(
                 result["baseline"]["errors"] = baseline_errors if baseline_errors else ["Generation failed"]
 
         except Exception as e:
-            logger.error(f"[{pair_id}] BASELINE exception: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[{pair_id}] BASELINE exception: {e}")
             result["baseline"]["metrics"] = {}
             result["baseline"]["errors"] = [str(e)]
 
@@ -200,9 +198,7 @@ async def run_dataset_eval(
                 result["full"]["errors"] = full_errors if full_errors else ["Generation failed"]
 
         except Exception as e:
-            logger.error(f"[{pair_id}] FULL exception: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[{pair_id}] FULL exception: {e}")
             result["full"]["metrics"] = {}
             result["full"]["errors"] = [str(e)]
 
@@ -0,0 +1,143 @@
+"""
+Generation Cache
+Memoizes /generate responses by the content hash of the job and resume inputs.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationCache:
+    """
+    Cache of generation responses keyed by hash(job, resume).
+
+    Uses Redis when a URL is given and the ``redis`` package is installed, so
+    the cache is shared across workers and survives restarts. Otherwise keeps
+    a bounded in-process LRU. Entries expire after ``ttl_seconds`` either way.
+    Cache errors are logged and treated as misses, never raised.
+
+    Example:
+        >>> cache = GenerationCache(redis_url=os.getenv("REDIS_URL"))
+        >>> key = GenerationCache.make_key(job_yaml, resume_json)
+        >>> cached = await cache.get(key)
+        >>> if cached is None:
+        ...     response = await generate(...)
+        ...     await cache.set(key, response.model_dump())
+    """
+
+    KEY_PREFIX = "gen:"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 86400,
+        max_entries: int = 256,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            redis_url: Redis connection URL (e.g. 'redis://localhost:6379/0'); in-process if None
+            ttl_seconds: Entry lifetime in seconds (default: 1 day)
+            max_entries: Maximum entries kept by the in-process cache (default: 256)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._redis = None
+        self._local: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+        if redis_url:
+            try:
+                import redis.asyncio as redis_asyncio
+
+                self._redis = redis_asyncio.from_url(redis_url)
+            except ImportError:
+                logger.warning("redis package not installed; using in-process generation cache")
+
+    @property
+    def backend(self) -> str:
+        """Name of the storage backend ('redis' or 'memory')."""
+        return "redis" if self._redis is not None else "memory"
+
+    @staticmethod
+    def make_key(job_content: str, resume_content: str) -> str:
+        """
+        Hash a job/resume pair into a cache key.
+
+        Args:
+            job_content: Job description text (YAML or raw)
+            resume_content: Resume text (JSON or raw)
+
+        Returns:
+            32-character hex digest (BLAKE2b, 16 bytes)
+        """
+        payload = f"{job_content}\x00{resume_content}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response dict, or None on miss/expiry/error
+        """
+        try:
+            if self._redis is not None:
+                blob = await self._redis.get(self.KEY_PREFIX + key)
+            else:
+                blob = self._get_local(key)
+        except Exception as e:
+            logger.warning(f"Generation cache lookup failed: {e}")
+            return None
+
+        return json.loads(blob) if blob is not None else None
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable response dict
+        """
+        blob = json.dumps(value)
+        try:
+            if self._redis is not None:
+                await self._redis.setex(self.KEY_PREFIX + key, self.ttl_seconds, blob)
+            else:
+                self._set_local(key, blob)
+        except Exception as e:
+            logger.warning(f"Generation cache store failed: {e}")
+
+    def _get_local(self, key: str) -> Optional[str]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, blob = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return blob
+
+    def _set_local(self, key: str, blob: str) -> None:
+        self._local[key] = (time.monotonic() + self.ttl_seconds, blob)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def close(self) -> None:
+        """Close the Redis connection, if any."""
+        if self._redis is not None:
+            # redis-py >= 5 names it aclose(); older releases only have close()
+            close = getattr(self._redis, "aclose", None) or self._redis.close
+            await close()
@@ -9,6 +9,8 @@ AutoResuAgent system with retrieval, validation, and retry loops.
 import logging
 from typing import TYPE_CHECKING
 
+from ..llm.base import FatalLLMError
+
 if TYPE_CHECKING:
     from ..models import JobDescription, CandidateProfile, GeneratedBullet, GeneratedCoverLetter
     from ..llm import BaseLLMClient
@@ -137,6 +139,8 @@ Generate ONLY the JSON, no other text."""
         logger.info(f"Generated {len(bullets)} baseline bullets")
         return bullets
 
+    except FatalLLMError:
+        raise
     except Exception as e:
         logger.error(f"Baseline generation failed: {e}")
         return []
@@ -244,8 +248,8 @@ Generate ONLY the JSON, no other text."""
         logger.info(f"Generated baseline cover letter ({cover_letter.get_word_count()} words)")
         return cover_letter
 
+    except FatalLLMError:
+        raise
     except Exception as e:
-        logger.error(f"Baseline cover letter generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Baseline cover letter generation failed: {e}")
         return None
@@ -5,7 +5,8 @@ Generates tailored resume bullet points using LLMs and retrieved context.
 
 import json
 import logging
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from ..models import JobDescription, CandidateProfile, GeneratedBullet
@@ -13,13 +14,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Start of the bullet list in a {"bullets": [...]} or bare [...] response
+_BULLET_LIST_START = re.compile(r'"bullets"\s*:\s*\[|^\s*\[')
+_LIST_SEPARATOR = re.compile(r"[\s,]*")
+
 
 async def generate_bullets_for_job(
     job: "JobDescription",
     resume: "CandidateProfile",
     retrieved: dict[str, list[dict]],
     llm: "BaseLLMClient",
-    validation_feedback: str | None = None
+    validation_feedback: str | None = None,
+    on_partial_bullets: Callable[[list["GeneratedBullet"]], None] | None = None
 ) -> list["GeneratedBullet"]:
     """
     Generate tailored resume bullets for a specific job.
@@ -42,6 +48,12 @@ async def generate_bullets_for_job(
                 ...
             }
         llm: LLM client (OpenAI or Anthropic)
+        validation_feedback: Errors from the previous attempt, if this is a retry
+        on_partial_bullets: If given, the response is streamed and this is called
+                            with the bullets parsed so far each time another one
+                            completes (e.g. to start work that needs only the
+                            first few). They are not validated yet; a restarted
+                            request starts the list again from its first bullet
 
     Returns:
         List of GeneratedBullet objects with validation applied
@@ -67,12 +79,14 @@ Your task is to generate compelling, professional resume bullet points that:
 
 Respond with valid JSON only."""
 
-    # Build user prompt with job details and retrieved context
+    # Build user prompt with job details and retrieved context. It is the
+    # same on every retry, so it goes first as a cacheable prefix
     user_prompt = _build_bullet_generation_prompt(job, resume, retrieved)
 
     # Add validation feedback if this is a retry
+    feedback_prompt = ""
     if validation_feedback:
-        user_prompt += f"""
+        feedback_prompt = f"""
 
 **VALIDATION FEEDBACK FROM PREVIOUS ATTEMPT:**
 The previous bullet generation had these issues:
@@ -81,6 +95,20 @@ The previous bullet generation had these issues:
 **IMPORTANT:** Please fix these issues in your new generation. Pay special attention to covering all missing skills.
 """
 
+    on_text = None
+    if on_partial_bullets is not None:
+        stream_parser = _BulletStreamParser()
+
+        def on_text(text: str) -> None:
+            if stream_parser.feed(text):
+                partial = []
+                for bullet_dict in stream_parser.items:
+                    try:
+                        partial.append(_bullet_from_dict(dict(bullet_dict), retrieved, resume))
+                    except Exception:
+                        break  # Malformed bullet; the full response reports it
+                on_partial_bullets(partial)
+
     # Generate bullets using LLM
     logger.debug(f"Calling LLM with {len(retrieved)} responsibilities")
 
@@ -88,7 +116,9 @@ The previous bullet generation had these issues:
         response = await llm.generate_with_retry(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
-            json_mode=True
+            json_mode=True,
+            prompt_suffix=feedback_prompt,
+            on_text=on_text
         )
 
         # Parse JSON response
@@ -102,28 +132,21 @@ The previous bullet generation had these issues:
         else:
             raise ValueError(f"Unexpected JSON structure: {list(data.keys())}")
 
-        # Import here to avoid circular dependency
-        from ..models import GeneratedBullet
-
         # Convert to GeneratedBullet objects (Pydantic will validate)
         # Post-process to ensure source_experience_id is set
         bullets = []
         for bullet_dict in bullets_data:
-            # If LLM didn't provide source_experience_id, infer it from retrieved context
             llm_provided_id = bullet_dict.get("source_experience_id")
+            bullet = _bullet_from_dict(bullet_dict, retrieved, resume)
 
-            if not llm_provided_id:
-                # Try to match bullet to retrieved context based on skills/content
-                source_exp_id = _infer_source_experience_id(bullet_dict, retrieved, resume)
-                if source_exp_id:
-                    bullet_dict["source_experience_id"] = source_exp_id
-                    logger.info(f"✓ Inferred source_experience_id={source_exp_id} for bullet {bullet_dict.get('id', '?')}")
-                else:
-                    logger.warning(f"✗ Could not infer source_experience_id for bullet {bullet_dict.get('id', '?')}")
-            else:
+            if llm_provided_id:
                 logger.info(f"✓ LLM provided source_experience_id={llm_provided_id} for bullet {bullet_dict.get('id', '?')}")
+            elif bullet.source_experience_id:
+                logger.info(f"✓ Inferred source_experience_id={bullet.source_experience_id} for bullet {bullet_dict.get('id', '?')}")
+            else:
+                logger.warning(f"✗ Could not infer source_experience_id for bullet {bullet_dict.get('id', '?')}")
 
-            bullets.append(GeneratedBullet(**bullet_dict))
+            bullets.append(bullet)
 
         logger.info(f"Generated {len(bullets)} bullets successfully")
 
@@ -146,6 +169,89 @@ The previous bullet generation had these issues:
         raise
 
 
+def _bullet_from_dict(
+    bullet_dict: dict,
+    retrieved: dict[str, list[dict]],
+    resume: "CandidateProfile"
+) -> "GeneratedBullet":
+    """
+    Build a GeneratedBullet from one item of the LLM response.
+
+    If the LLM didn't provide source_experience_id, it is inferred from the
+    retrieved context (see _infer_source_experience_id()).
+
+    Args:
+        bullet_dict: One bullet object from the LLM's JSON (updated in place)
+        retrieved: Retrieved context used for generation
+        resume: Candidate's resume
+
+    Returns:
+        Validated GeneratedBullet
+    """
+    # Import here to avoid circular dependency
+    from ..models import GeneratedBullet
+
+    if not bullet_dict.get("source_experience_id"):
+        # Try to match bullet to retrieved context based on skills/content
+        source_exp_id = _infer_source_experience_id(bullet_dict, retrieved, resume)
+        if source_exp_id:
+            bullet_dict["source_experience_id"] = source_exp_id
+
+    return GeneratedBullet(**bullet_dict)
+
+
+class _BulletStreamParser:
+    """
+    Extracts complete bullet objects from a partially received JSON response.
+
+    Fed the response text received so far; each object in the bullet list is
+    decoded once its closing brace has arrived. Text that does not extend the
+    previous feed (a retried request) restarts parsing.
+    """
+
+    __slots__ = ("_decoder", "_text", "_pos", "items")
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = ""
+        self._pos: int | None = None  # Just past the last decoded item
+        self.items: list[dict] = []
+
+    def feed(self, text: str) -> bool:
+        """
+        Parse the response text received so far.
+
+        Args:
+            text: Full text received so far (not just the new chunk)
+
+        Returns:
+            True if at least one more bullet object was completed
+        """
+        if not text.startswith(self._text):
+            self._pos = None
+            self.items = []
+        self._text = text
+
+        if self._pos is None:
+            match = _BULLET_LIST_START.search(text)
+            if match is None:
+                return False
+            self._pos = match.end()
+
+        completed = False
+        while True:
+            start = _LIST_SEPARATOR.match(text, self._pos).end()
+            if start >= len(text) or text[start] != "{":
+                return completed
+            try:
+                item, end = self._decoder.raw_decode(text, start)
+            except json.JSONDecodeError:
+                return completed  # Rest of this object has not arrived yet
+            self.items.append(item)
+            self._pos = end
+            completed = True
+
+
 def _infer_source_experience_id(
     bullet_dict: dict,
     retrieved: dict[str, list[dict]],
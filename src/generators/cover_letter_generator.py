@@ -15,6 +15,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of tailored bullets quoted in the cover letter prompt
+COVER_LETTER_SAMPLE_BULLETS = 5
+
 
 async def generate_cover_letter(
     job: "JobDescription",
@@ -134,6 +137,9 @@ def _build_cover_letter_prompt(
     Build the user prompt for cover letter generation.
 
     Includes job details, candidate info, and sample tailored bullets for context.
+    Only the first COVER_LETTER_SAMPLE_BULLETS bullets affect the prompt, so a
+    cover letter started while bullets are still streaming gets the same prompt
+    as one built from the final list.
     """
     prompt_parts = [
         "Generate a personalized cover letter for the following job application:\n",
@@ -181,13 +187,10 @@ def _build_cover_letter_prompt(
         prompt_parts.append(f"\n**Tailored Resume Bullets for This Job (for reference):**")
         prompt_parts.append("These bullets demonstrate the candidate's relevant experience:\n")
 
-        # Show top 5 bullets as examples
-        for i, bullet in enumerate(bullets[:5], 1):
+        # Show top bullets as examples
+        for i, bullet in enumerate(bullets[:COVER_LETTER_SAMPLE_BULLETS], 1):
             prompt_parts.append(f"{i}. {bullet.text}")
 
-        if len(bullets) > 5:
-            prompt_parts.append(f"   ...and {len(bullets) - 5} more relevant accomplishments")
-
     # Instructions
     prompt_parts.append("\n**Task:**")
     prompt_parts.append(
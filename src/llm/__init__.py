@@ -3,12 +3,15 @@ LLM Package
 Language model client implementations.
 """
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, FatalLLMError, LLMRetriesExhaustedError, QuotaExceededError
 from .openai_client import OpenAILLMClient
 from .anthropic_client import AnthropicLLMClient
 
 __all__ = [
     "BaseLLMClient",
+    "FatalLLMError",
+    "LLMRetriesExhaustedError",
+    "QuotaExceededError",
     "OpenAILLMClient",
     "AnthropicLLMClient",
 ]
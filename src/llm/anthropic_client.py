@@ -3,13 +3,13 @@ Anthropic Claude Client
 Async client for Anthropic's Claude models with JSON output support.
 """
 
-import asyncio
 import json
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, FatalLLMError, QuotaExceededError
 
 if TYPE_CHECKING:
+    import httpx
     from anthropic import AsyncAnthropic
     from ..orchestration import Config
 
@@ -44,6 +44,8 @@ class AnthropicLLMClient(BaseLLMClient):
         ... )
     """
 
+    provider_name = "Anthropic"
+
     def __init__(
         self,
         config_or_api_key: Union["Config", str, None] = None,
@@ -53,6 +55,7 @@ class AnthropicLLMClient(BaseLLMClient):
         max_tokens: int = 4096,
         temperature: float = 0.0,
         max_retries: int = 3,
+        http_client: Optional["httpx.AsyncClient"] = None,
     ):
         """
         Initialize Anthropic client.
@@ -64,6 +67,8 @@ class AnthropicLLMClient(BaseLLMClient):
             max_tokens: Maximum tokens for generation (default: 4096)
             temperature: Temperature for generation (default: 0.0)
             max_retries: Maximum retry attempts (default: 3)
+            http_client: httpx client to send requests with; share one between
+                         clients to reuse its connection pool (default: SDK's own)
 
         Raises:
             ValueError: If no API key is provided
@@ -117,6 +122,7 @@ class AnthropicLLMClient(BaseLLMClient):
 
         self.client: "AsyncAnthropic" = AsyncAnthropic(
             api_key=self.api_key,
+            http_client=http_client,
         )
 
     async def generate(
@@ -125,6 +131,8 @@ class AnthropicLLMClient(BaseLLMClient):
         system_prompt: str,
         user_prompt: str,
         json_mode: bool = True,
+        prompt_suffix: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         Generate text using Anthropic's API.
@@ -133,6 +141,12 @@ class AnthropicLLMClient(BaseLLMClient):
             system_prompt: System instruction
             user_prompt: User message
             json_mode: If True, instruct model to output JSON
+            prompt_suffix: Text that changes between otherwise identical calls
+                           (e.g. retry feedback). When given, user_prompt is sent
+                           as a cached block and the suffix after it, so retries
+                           re-read the prefix from Anthropic's prompt cache
+            on_text: If given, stream the response and call this with the text
+                     received so far as each chunk arrives
 
         Returns:
             Generated text (raw JSON string if json_mode=True)
@@ -153,25 +167,53 @@ class AnthropicLLMClient(BaseLLMClient):
                 "Ensure all strings are properly quoted and the JSON is valid."
             )
 
-        # Also add JSON instruction to user prompt for emphasis
-        if json_mode and "json" not in user_prompt.lower():
-            user_prompt = (
-                f"{user_prompt}\n\n"
-                "Remember: Respond with valid JSON only."
-            )
+        # Also add JSON instruction to user prompt for emphasis, after the
+        # cached prefix when there is one so the prefix stays byte-identical
+        if json_mode and "json" not in f"{user_prompt}{prompt_suffix or ''}".lower():
+            reminder = "\n\nRemember: Respond with valid JSON only."
+            if prompt_suffix is None:
+                user_prompt += reminder
+            else:
+                prompt_suffix += reminder
+
+        if prompt_suffix is None:
+            message_content = user_prompt
+        else:
+            message_content = [
+                {"type": "text", "text": user_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+            if prompt_suffix:
+                message_content.append({"type": "text", "text": prompt_suffix})
 
         self.logger.debug(f"Calling Anthropic API with model={self.model}")
 
         try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
+            params = {
+                "model": self.model,
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+                "system": system_prompt,
+                "messages": [
+                    {"role": "user", "content": message_content}
                 ],
-            )
+            }
+            if on_text is None:
+                response = await self.client.messages.create(**params)
+            else:
+                streamed = ""
+                async with self.client.messages.stream(**params) as stream:
+                    async for text in stream.text_stream:
+                        streamed += text
+                        on_text(streamed)
+                    response = await stream.get_final_message()
+
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                self.logger.debug(
+                    f"Input tokens: {usage.input_tokens} uncached, "
+                    f"{getattr(usage, 'cache_read_input_tokens', None) or 0} read from cache, "
+                    f"{getattr(usage, 'cache_creation_input_tokens', None) or 0} written to cache"
+                )
 
             # Extract content from response
             if not response.content or len(response.content) == 0:
@@ -206,59 +248,22 @@ class AnthropicLLMClient(BaseLLMClient):
 
         except Exception as e:
             self.logger.error(f"Anthropic API error: {e}")
+            from anthropic import AuthenticationError, BadRequestError, PermissionDeniedError, RateLimitError
+            if isinstance(e, (AuthenticationError, PermissionDeniedError)):
+                raise FatalLLMError(f"Anthropic rejected the request: {e}") from e
+            # Anthropic reports an empty credit balance as a 400, not a 429
+            if isinstance(e, BadRequestError) and "credit balance" in str(e).lower():
+                raise QuotaExceededError(f"Anthropic credit exhausted: {e}") from e
+            if isinstance(e, RateLimitError) and self.on_rate_limit is not None:
+                self.on_rate_limit()
             raise
 
-    async def generate_with_retry(
-        self,
-        *,
-        system_prompt: str,
-        user_prompt: str,
-        json_mode: bool = True,
-    ) -> str:
-        """
-        Generate with automatic retry logic.
-
-        Uses exponential backoff: 1s, 2s, 4s for retries.
-
-        Args:
-            system_prompt: System instruction
-            user_prompt: User prompt
-            json_mode: Request JSON output
-
-        Returns:
-            Generated text
-
-        Raises:
-            Exception: If all retries exhausted
-        """
-        last_error = None
-
-        for attempt in range(self.max_retries):
-            try:
-                return await self.generate(
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    json_mode=json_mode,
-                )
-            except Exception as e:
-                last_error = e
-                self.logger.warning(
-                    f"Attempt {attempt + 1}/{self.max_retries} failed: {e}"
-                )
-
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff
-                    wait_time = 2 ** attempt
-                    self.logger.info(f"Retrying in {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-
-        # All retries exhausted
-        error_msg = (
-            f"Anthropic generation failed after {self.max_retries} attempts. "
-            f"Last error: {last_error}"
-        )
-        self.logger.error(error_msg)
-        raise Exception(error_msg)
+    async def warm_up(self) -> None:
+        """Open a pooled HTTPS connection with a small GET /v1/models."""
+        try:
+            await self.client.with_options(max_retries=0, timeout=5.0).models.list(limit=1)
+        except Exception as e:
+            self.logger.debug(f"Connection warm-up failed: {e}")
 
     def get_model_name(self) -> str:
         """Get the Anthropic model name."""
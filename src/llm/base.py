@@ -6,7 +6,8 @@ Abstract class for language model clients with async support.
 from abc import ABC, abstractmethod
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional
+import random
+from typing import TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
     from ..orchestration import Config
@@ -14,6 +15,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class FatalLLMError(Exception):
+    """
+    LLM error that no retry can fix (e.g. invalid API key, missing permission).
+
+    Retry loops and per-job error handling re-raise it instead of recording a
+    failed attempt, so a batch stops at the first one rather than spending
+    every remaining job on the same failure.
+    """
+
+
+class QuotaExceededError(FatalLLMError):
+    """
+    The account's LLM quota or credit is exhausted.
+
+    Batch executors stop starting new jobs when they see it and report the
+    remaining jobs as skipped, so they can be retried once quota is restored.
+    """
+
+
+class LLMRetriesExhaustedError(Exception):
+    """
+    Every attempt of generate_with_retry() failed with a retryable error.
+
+    The request was already retried with backoff, so callers should not wrap
+    it in another retry loop with the same prompt.
+    """
+
+
 class BaseLLMClient(ABC):
     """
     Abstract base class for async LLM clients.
@@ -29,6 +58,9 @@ class BaseLLMClient(ABC):
     - Direct parameters: api_key, model, max_tokens, temperature
     """
 
+    # Provider shown in error messages; set by each client
+    provider_name: str = "LLM"
+
     def __init__(
         self,
         config: Optional["Config"] = None,
@@ -49,6 +81,10 @@ class BaseLLMClient(ABC):
         self.max_retries = config.max_retries if config else max_retries
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # Called each time the provider answers with a rate-limit (429) error,
+        # e.g. so a batch can lower its concurrency
+        self.on_rate_limit: Optional[Callable[[], None]] = None
+
     @abstractmethod
     async def generate(
         self,
@@ -56,6 +92,8 @@ class BaseLLMClient(ABC):
         system_prompt: str,
         user_prompt: str,
         json_mode: bool = True,
+        prompt_suffix: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         Generate text from prompts.
@@ -64,6 +102,14 @@ class BaseLLMClient(ABC):
             system_prompt: System instruction (required, keyword-only)
             user_prompt: User message/prompt (required, keyword-only)
             json_mode: If True, request JSON output and return raw JSON string
+            prompt_suffix: Part of the user message that varies between calls
+                           which otherwise share user_prompt (e.g. retry feedback).
+                           It is sent after user_prompt, which implementations
+                           may cache with the provider's prompt caching
+            on_text: If given, the response is streamed and this is called with
+                     the text received so far each time more arrives (e.g. to
+                     act on the first items of a long JSON list early); the
+                     complete text is still returned
 
         Returns:
             Generated text (raw JSON string if json_mode=True)
@@ -74,7 +120,7 @@ class BaseLLMClient(ABC):
         Note:
             Implementations should:
             - Use self.config for model/temperature/max_tokens
-            - Implement retry logic with self.max_retries
+            - Leave retries to generate_with_retry()
             - Handle API-specific errors
             - Return raw JSON string when json_mode=True
         """
@@ -86,23 +132,29 @@ class BaseLLMClient(ABC):
         system_prompt: str,
         user_prompt: str,
         json_mode: bool = True,
+        prompt_suffix: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         Generate with automatic retry logic.
 
-        This is a helper that subclasses can call to implement retries.
-        Subclasses should implement their own retry logic or use this.
+        Shared by every client. Uses exponential backoff with jitter: about
+        1s, 2s, 4s (±50%) between attempts.
 
         Args:
             system_prompt: System instruction
             user_prompt: User prompt
             json_mode: Request JSON output
+            prompt_suffix: Varying text sent after user_prompt (see generate())
+            on_text: Streaming callback (see generate()); a retried attempt
+                     starts again from its first chunk
 
         Returns:
             Generated text
 
         Raises:
-            Exception: If all retries exhausted
+            FatalLLMError: Immediately, without retrying
+            LLMRetriesExhaustedError: If all retries are exhausted
         """
         last_error = None
 
@@ -112,7 +164,11 @@ class BaseLLMClient(ABC):
                     system_prompt=system_prompt,
                     user_prompt=user_prompt,
                     json_mode=json_mode,
+                    prompt_suffix=prompt_suffix,
+                    on_text=on_text,
                 )
+            except FatalLLMError:
+                raise
             except Exception as e:
                 last_error = e
                 self.logger.warning(
@@ -120,16 +176,28 @@ class BaseLLMClient(ABC):
                 )
 
                 if attempt < self.max_retries - 1:
-                    # Exponential backoff
-                    wait_time = 2 ** attempt
-                    self.logger.info(f"Retrying in {wait_time}s...")
+                    # Exponential backoff with jitter, so concurrent jobs that
+                    # were throttled together do not all retry at once
+                    wait_time = 2 ** attempt * random.uniform(0.5, 1.5)
+                    self.logger.info(f"Retrying in {wait_time:.1f}s...")
                     await asyncio.sleep(wait_time)
 
         # All retries exhausted
-        raise Exception(
-            f"Generation failed after {self.max_retries} attempts. "
+        error_msg = (
+            f"{self.provider_name} generation failed after {self.max_retries} attempts. "
             f"Last error: {last_error}"
         )
+        self.logger.error(error_msg)
+        raise LLMRetriesExhaustedError(error_msg) from last_error
+
+    async def warm_up(self) -> None:
+        """
+        Open a connection to the provider before a burst of requests.
+
+        Resolves DNS and completes the TLS handshake so concurrent requests
+        that follow find a connection in the client's pool. Failures are
+        ignored. The base implementation does nothing.
+        """
 
     def get_model_name(self) -> str:
         """Get the model name for this client (to be overridden)."""
@@ -3,12 +3,12 @@ OpenAI LLM Client
 Async client for OpenAI's GPT models with JSON mode support.
 """
 
-import asyncio
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, FatalLLMError, QuotaExceededError
 
 if TYPE_CHECKING:
+    import httpx
     from openai import AsyncOpenAI
     from ..orchestration import Config
 
@@ -39,6 +39,8 @@ class OpenAILLMClient(BaseLLMClient):
         ... )
     """
 
+    provider_name = "OpenAI"
+
     def __init__(
         self,
         config_or_api_key: Union["Config", str, None] = None,
@@ -48,6 +50,7 @@ class OpenAILLMClient(BaseLLMClient):
         max_tokens: int = 4096,
         temperature: float = 0.0,
         max_retries: int = 3,
+        http_client: Optional["httpx.AsyncClient"] = None,
     ):
         """
         Initialize OpenAI client.
@@ -59,6 +62,8 @@ class OpenAILLMClient(BaseLLMClient):
             max_tokens: Maximum tokens for generation (default: 4096)
             temperature: Temperature for generation (default: 0.0)
             max_retries: Maximum retry attempts (default: 3)
+            http_client: httpx client to send requests with; share one between
+                         clients to reuse its connection pool (default: SDK's own)
 
         Raises:
             ValueError: If no API key is provided
@@ -112,6 +117,7 @@ class OpenAILLMClient(BaseLLMClient):
 
         self.client: "AsyncOpenAI" = AsyncOpenAI(
             api_key=self.api_key,
+            http_client=http_client,
         )
 
     async def generate(
@@ -121,6 +127,8 @@ class OpenAILLMClient(BaseLLMClient):
         system_prompt: Optional[str] = None,
         user_prompt: Optional[str] = None,
         json_mode: bool = False,
+        prompt_suffix: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         Generate text using OpenAI's API.
@@ -134,6 +142,12 @@ class OpenAILLMClient(BaseLLMClient):
             system_prompt: System instruction (keyword-only)
             user_prompt: User message (keyword-only)
             json_mode: If True, use JSON response format
+            prompt_suffix: Text appended to user_prompt that changes between
+                           otherwise identical calls (e.g. retry feedback); keeping
+                           it last lets OpenAI's automatic prompt caching reuse the
+                           shared prefix
+            on_text: If given, stream the response and call this with the text
+                     received so far as each chunk arrives
 
         Returns:
             Generated text (raw JSON string if json_mode=True)
@@ -151,7 +165,7 @@ class OpenAILLMClient(BaseLLMClient):
             # Advanced pattern: generate(system_prompt=..., user_prompt=...)
             messages = [
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
+                {"role": "user", "content": f"{user_prompt}{prompt_suffix or ''}"},
             ]
         else:
             raise ValueError(
@@ -176,72 +190,56 @@ class OpenAILLMClient(BaseLLMClient):
         self.logger.debug(f"Calling OpenAI API with model={self.model}")
 
         try:
-            response = await self.client.chat.completions.create(**params)
-
-            # Extract content
-            content = response.choices[0].message.content
+            if on_text is None:
+                response = await self.client.chat.completions.create(**params)
+
+                # Extract content
+                content = response.choices[0].message.content
+                usage = getattr(response, "usage", None)
+            else:
+                content, usage = "", None
+                stream = await self.client.chat.completions.create(
+                    **params, stream=True, stream_options={"include_usage": True}
+                )
+                async for chunk in stream:
+                    if chunk.usage is not None:
+                        usage = chunk.usage  # Sent in a final chunk without choices
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        content += chunk.choices[0].delta.content
+                        on_text(content)
 
             if not content:
                 raise ValueError("OpenAI returned empty content")
 
+            if usage is not None:
+                details = getattr(usage, "prompt_tokens_details", None)
+                self.logger.debug(
+                    f"Prompt tokens: {usage.prompt_tokens} "
+                    f"({getattr(details, 'cached_tokens', None) or 0} read from cache)"
+                )
+
             self.logger.debug(f"Generated {len(content)} characters")
             return content
 
         except Exception as e:
             self.logger.error(f"OpenAI API error: {e}")
+            from openai import AuthenticationError, PermissionDeniedError, RateLimitError
+            if isinstance(e, (AuthenticationError, PermissionDeniedError)):
+                raise FatalLLMError(f"OpenAI rejected the request: {e}") from e
+            # A plain 429 is worth retrying; an empty quota is not
+            if isinstance(e, RateLimitError):
+                if e.code == "insufficient_quota":
+                    raise QuotaExceededError(f"OpenAI quota exhausted: {e}") from e
+                if self.on_rate_limit is not None:
+                    self.on_rate_limit()
             raise
 
-    async def generate_with_retry(
-        self,
-        *,
-        system_prompt: str,
-        user_prompt: str,
-        json_mode: bool = True,
-    ) -> str:
-        """
-        Generate with automatic retry logic.
-
-        Uses exponential backoff: 1s, 2s, 4s for retries.
-
-        Args:
-            system_prompt: System instruction
-            user_prompt: User prompt
-            json_mode: Request JSON output
-
-        Returns:
-            Generated text
-
-        Raises:
-            Exception: If all retries exhausted
-        """
-        last_error = None
-
-        for attempt in range(self.max_retries):
-            try:
-                return await self.generate(
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    json_mode=json_mode,
-                )
-            except Exception as e:
-                last_error = e
-                self.logger.warning(
-                    f"Attempt {attempt + 1}/{self.max_retries} failed: {e}"
-                )
-
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff
-                    wait_time = 2 ** attempt
-                    self.logger.info(f"Retrying in {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-
-        # All retries exhausted
-        error_msg = (
-            f"OpenAI generation failed after {self.max_retries} attempts. "
-            f"Last error: {last_error}"
-        )
-        self.logger.error(error_msg)
-        raise Exception(error_msg)
+    async def warm_up(self) -> None:
+        """Open a pooled HTTPS connection with a small GET /models/{model}."""
+        try:
+            await self.client.with_options(max_retries=0, timeout=5.0).models.retrieve(self.model)
+        except Exception as e:
+            self.logger.debug(f"Connection warm-up failed: {e}")
 
     def get_model_name(self) -> str:
         """Get the OpenAI model name."""
@@ -63,7 +63,7 @@ async def run_pipeline(
     from .config import get_config
     from ..models import load_job_from_yaml, load_resume_from_json
     from ..llm import OpenAILLMClient, AnthropicLLMClient
-    from ..embeddings import SentenceBertEncoder
+    from ..embeddings import get_shared_encoder
     from ..agent import AgentExecutor
     from ..renderer import (
         render_resume_tex,
@@ -105,7 +105,7 @@ async def run_pipeline(
 
         # Step 2: Initialize encoder
         logger.info("Step 2: Initializing SentenceBERT encoder...")
-        encoder = SentenceBertEncoder()
+        encoder = get_shared_encoder()
 
         # Step 3: Run agent executor
         logger.info("Step 3: Running agent executor...")
@@ -233,12 +233,9 @@ async def run_pipeline(
 
     except Exception as e:
         error_msg = f"Pipeline failed: {str(e)}"
-        logger.error(error_msg)
+        logger.exception(error_msg)
         errors.append(error_msg)
 
-        import traceback
-        traceback.print_exc()
-
         return {
             "success": False,
             "package": None,
@@ -364,10 +361,7 @@ async def run_batch(
 
     except Exception as e:
         error_msg = f"Batch pipeline failed: {str(e)}"
-        logger.error(error_msg)
-
-        import traceback
-        traceback.print_exc()
+        logger.exception(error_msg)
 
         # Return error results for all jobs
         return [
@@ -414,6 +408,7 @@ async def run_batch_pipeline(
           - job: "data/jobs/job2.yaml"
             resume: "data/resumes/resume.json"
         max_concurrent: 3
+        initial_concurrent: 2  # optional: adapt between 1 and max_concurrent on 429s
         output_dir: "outputs/batch_my_batch"
         ```
 
@@ -438,7 +433,7 @@ async def run_batch_pipeline(
     """
     from .config import get_config
     from ..models import load_job_from_yaml, load_resume_from_json
-    from ..embeddings import SentenceBertEncoder
+    from ..embeddings import get_shared_encoder
     from ..agent import AsyncBatchExecutor, BatchJobResult
     from ..renderer import (
         render_resume_tex,
@@ -488,28 +483,20 @@ async def run_batch_pipeline(
         llm = config.get_llm_client("anthropic")
         logger.info(f"Using Anthropic ({llm.get_model_name()})")
 
-    encoder = SentenceBertEncoder()
+    encoder = get_shared_encoder()
     logger.info("Encoder initialized")
 
-    # Step 3: Run batch executor
-    logger.info("Step 3: Running batch executor...")
-    batch_executor = AsyncBatchExecutor(pairs, max_concurrent=max_concurrent)
-    batch_results: list[BatchJobResult] = await batch_executor.run(
-        llm, encoder, max_retries=config.max_retries
-    )
-
-    # Step 4: Process results - render LaTeX and collect metrics
-    logger.info("Step 4: Processing results (rendering LaTeX, collecting metrics)...")
+    # Step 3: Run batch executor; each result is rendered (step 4) as soon
+    # as its job finishes, and the batch keeps no packages in memory
+    logger.info("Step 3: Running batch executor (rendering LaTeX as jobs finish)...")
     template_dir = Path("data/templates")
     pdflatex_available = check_pdflatex_installed()
 
     if not pdflatex_available:
         logger.warning("pdflatex not found - only .tex files will be generated")
 
-    formatted_results: list[dict[str, Any]] = []
-    metrics_records: list[dict[str, Any]] = []
-
-    for result in batch_results:
+    def render_outputs(result: BatchJobResult) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Render one result's LaTeX/PDF files; return its result dict and metrics record."""
         result_dict: dict[str, Any] = {
             "job_path": str(result.job_path),
             "resume_path": str(result.resume_path),
@@ -585,8 +572,34 @@ async def run_batch_pipeline(
                 result_dict["errors"].append(error_msg)
                 metrics_record["errors"].append(error_msg)
 
-        formatted_results.append(result_dict)
-        metrics_records.append(metrics_record)
+        return result_dict, metrics_record
+
+    # (result dict, metrics record) per pair, filled in as jobs finish
+    processed: dict[tuple[Path, Path], tuple[dict[str, Any], dict[str, Any]]] = {}
+
+    async def write_outputs(result: BatchJobResult) -> None:
+        # Rendering and pdflatex block, so they run off the event loop
+        processed[(result.job_path, result.resume_path)] = await asyncio.to_thread(
+            render_outputs, result
+        )
+
+    batch_executor = AsyncBatchExecutor(
+        pairs,
+        max_concurrent=max_concurrent,
+        initial_concurrent=batch_config.get("initial_concurrent")
+    )
+    batch_results: list[BatchJobResult] = await batch_executor.run(
+        llm, encoder, max_retries=config.max_retries,
+        sink=write_outputs, keep_packages=False
+    )
+
+    # Step 4: Collect processed results in input order
+    formatted_results: list[dict[str, Any]] = []
+    metrics_records: list[dict[str, Any]] = []
+    for result in batch_results:
+        result_dict, metrics_record = processed[(result.job_path, result.resume_path)]
+        formatted_results.append(dict(result_dict))
+        metrics_records.append(dict(metrics_record))
 
     # Step 5: Write metrics.jsonl
     logger.info("Step 5: Writing metrics.jsonl...")
@@ -13,62 +13,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
-class DataParser:
-    """
-    Parse raw text into structured data using LLM.
-
-    Converts unstructured job postings and resumes (from LinkedIn, PDFs, etc.)
-    into valid YAML/JSON that matches our Pydantic schemas.
-
-    Example:
-        >>> parser = DataParser(llm_client)
-        >>> job_yaml = await parser.parse_raw_job("Senior ML Engineer at TechCorp...")
-        >>> resume_json = await parser.parse_raw_resume("John Doe | ML Engineer...")
-    """
-
-    def __init__(self, llm: "BaseLLMClient"):
-        """
-        Initialize parser with LLM client.
-
-        Args:
-            llm: LLM client (OpenAI or Anthropic) for extraction
-        """
-        self.llm = llm
-
-    async def parse_raw_job(self, raw_text: str) -> str:
-        """
-        Parse raw job posting text into structured YAML.
-
-        Extracts job details from unstructured text (LinkedIn, company careers page, etc.)
-        and converts it into valid YAML matching the JobDescription schema.
-
-        Args:
-            raw_text: Raw job posting text
-
-        Returns:
-            YAML string matching JobDescription schema
-
-        Example:
-            >>> yaml_str = await parser.parse_raw_job('''
-            ... Senior ML Engineer at TechCorp
-            ... San Francisco, CA
-            ...
-            ... Responsibilities:
-            ... - Build ML models
-            ... - Deploy to production
-            ...
-            ... Requirements:
-            ... - Python, TensorFlow
-            ... - 5+ years experience
-            ... ''')
-        """
-        prompt = f"""You are a job posting extraction expert. Extract structured information from the raw job posting below.
-
-Raw Job Posting:
-{raw_text}
-
-Your task is to extract and return ONLY valid YAML in the following schema. Do not include any explanations, markdown formatting, or code blocks - return ONLY the raw YAML text.
+# Schema instructions of the extraction prompts
+JOB_EXTRACTION_INSTRUCTIONS = """Your task is to extract and return ONLY valid YAML in the following schema. Do not include any explanations, markdown formatting, or code blocks - return ONLY the raw YAML text.
 
 Required Schema:
 job_id: string (generate a unique ID like "job-YYYY-MM-DD-company-title")
@@ -110,60 +56,10 @@ responsibilities:
   - Lead ML infrastructure projects
 """
 
-        response = await self.llm.generate(prompt)
-
-        # Clean up response (remove markdown code blocks if present)
-        yaml_text = response.strip()
-        if yaml_text.startswith("```yaml"):
-            yaml_text = yaml_text[7:]
-        if yaml_text.startswith("```"):
-            yaml_text = yaml_text[3:]
-        if yaml_text.endswith("```"):
-            yaml_text = yaml_text[:-3]
-        yaml_text = yaml_text.strip()
-
-        # Validate it's parseable YAML
-        try:
-            yaml.safe_load(yaml_text)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Generated invalid YAML: {e}\n\nGenerated text:\n{yaml_text}")
-
-        return yaml_text
-
-    async def parse_raw_resume(self, raw_text: str) -> str:
-        """
-        Parse raw resume text into structured JSON.
-
-        Extracts candidate information from unstructured text (LinkedIn profile,
-        PDF resume, etc.) and converts it into valid JSON matching the CandidateProfile schema.
-
-        Args:
-            raw_text: Raw resume text
-
-        Returns:
-            JSON string matching CandidateProfile schema
-
-        Example:
-            >>> json_str = await parser.parse_raw_resume('''
-            ... John Doe
-            ... ML Engineer | San Francisco, CA
-            ... john@example.com
-            ...
-            ... Experience:
-            ... Senior ML Engineer at TechCorp (2020-Present)
-            ... - Built recommendation system
-            ... - Deployed to production
-            ... ''')
-        """
-        prompt = f"""You are a resume extraction expert. Extract structured information from the raw resume/profile below.
-
-Raw Resume/Profile:
-{raw_text}
-
-Your task is to extract and return ONLY valid JSON in the following schema. Do not include any explanations, markdown formatting, or code blocks - return ONLY the raw JSON text.
+RESUME_EXTRACTION_INSTRUCTIONS = """Your task is to extract and return ONLY valid JSON in the following schema. Do not include any explanations, markdown formatting, or code blocks - return ONLY the raw JSON text.
 
 Required Schema:
-{{
+{
   "candidate_id": "string (generate unique ID like 'cand-YYYY-MM-DD-lastname')",
   "name": "string (full name)",
   "email": "string (email address, or 'unknown@example.com' if not found)",
@@ -173,7 +69,7 @@ Required Schema:
   "github_url": "string or null (GitHub URL if mentioned)",
   "skills": ["array of skill strings"],
   "experiences": [
-    {{
+    {
       "id": "string (e.g., 'exp-1', 'exp-2')",
       "role": "string (job title)",
       "company": "string (company name)",
@@ -181,29 +77,29 @@ Required Schema:
       "start_date": "string (e.g., 'Jan 2020', '2020-01')",
       "end_date": "string or null (null for current position)",
       "bullets": ["array of accomplishment strings"]
-    }}
+    }
   ],
   "education": [
-    {{
+    {
       "institution": "string (school/university name)",
       "degree": "string (degree name)",
       "location": "string or null",
       "start_date": "string or null",
       "end_date": "string or null",
       "gpa": "string or null"
-    }}
+    }
   ],
   "projects": [
-    {{
+    {
       "id": "string (e.g., 'proj-1', 'proj-2')",
       "title": "string (project name)",
       "description": "string (brief description)",
       "tech_stack": ["array of technologies"],
       "link": "string or null (GitHub/demo URL)",
       "bullets": ["array of accomplishment strings"]
-    }}
+    }
   ]
-}}
+}
 
 Important Extraction Rules:
 - Extract ALL technical skills mentioned throughout the resume
@@ -218,7 +114,7 @@ Important Extraction Rules:
 - Return ONLY the JSON text, no markdown code blocks or explanations
 
 Example Output Format:
-{{
+{
   "candidate_id": "cand-2025-12-04-doe",
   "name": "John Doe",
   "email": "john@example.com",
@@ -228,7 +124,7 @@ Example Output Format:
   "github_url": "github.com/johndoe",
   "skills": ["Python", "TensorFlow", "AWS", "Docker"],
   "experiences": [
-    {{
+    {
       "id": "exp-1",
       "role": "Senior ML Engineer",
       "company": "TechCorp",
@@ -239,20 +135,20 @@ Example Output Format:
         "Built recommendation system serving 1M+ users",
         "Reduced model latency by 40%"
       ]
-    }}
+    }
   ],
   "education": [
-    {{
+    {
       "institution": "Stanford University",
       "degree": "Master of Science in Computer Science",
       "location": "Stanford, CA",
       "start_date": "2017",
       "end_date": "2019",
       "gpa": "3.9"
-    }}
+    }
   ],
   "projects": [
-    {{
+    {
       "id": "proj-1",
       "title": "ML Pipeline",
       "description": "End-to-end ML pipeline for production",
@@ -262,30 +158,151 @@ Example Output Format:
         "Built scalable pipeline handling 10M requests/day",
         "Reduced deployment time by 60%"
       ]
-    }}
+    }
   ]
-}}
+}
 """
 
-        response = await self.llm.generate(prompt)
+def _extraction_system_prompt(document_kind: str, instructions: str) -> str:
+    """
+    Build the static system prompt of an extraction task.
+
+    The raw documents go in the user message, so this prefix is byte-identical
+    across calls and can be served from the provider's prompt cache.
+    """
+    return (
+        f"You are a {document_kind} extraction expert. Extract structured information "
+        f"from the raw {document_kind} in the user message.\n\n" + instructions
+    )
 
-        # Clean up response (remove markdown code blocks if present)
-        json_text = response.strip()
-        if json_text.startswith("```json"):
-            json_text = json_text[7:]
-        if json_text.startswith("```"):
-            json_text = json_text[3:]
-        if json_text.endswith("```"):
-            json_text = json_text[:-3]
-        json_text = json_text.strip()
 
-        # Validate it's parseable JSON
-        try:
-            json.loads(json_text)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Generated invalid JSON: {e}\n\nGenerated text:\n{json_text}")
+JOB_EXTRACTION_SYSTEM_PROMPT = _extraction_system_prompt("job posting", JOB_EXTRACTION_INSTRUCTIONS)
+RESUME_EXTRACTION_SYSTEM_PROMPT = _extraction_system_prompt("resume", RESUME_EXTRACTION_INSTRUCTIONS)
+
+
+# libyaml-backed loader when PyYAML was built with it; pure-Python SafeLoader otherwise
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _strip_code_fence(text: str, language: str) -> str:
+    """Remove a surrounding markdown code block (```language ... ```) if present."""
+    text = text.strip()
+    if text.startswith(f"```{language}"):
+        text = text[3 + len(language):]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def _clean_job_yaml(response: str) -> str:
+    """Strip code fences from an LLM job extraction and check it is valid YAML."""
+    yaml_text = _strip_code_fence(response, "yaml")
+    try:
+        yaml.load(yaml_text, Loader=_YamlSafeLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Generated invalid YAML: {e}\n\nGenerated text:\n{yaml_text}")
+    return yaml_text
+
+
+def _clean_resume_json(response: str) -> str:
+    """Strip code fences from an LLM resume extraction and check it is valid JSON."""
+    json_text = _strip_code_fence(response, "json")
+    try:
+        json.loads(json_text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Generated invalid JSON: {e}\n\nGenerated text:\n{json_text}")
+    return json_text
+
+
+class DataParser:
+    """
+    Parse raw text into structured data using LLM.
+
+    Converts unstructured job postings and resumes (from LinkedIn, PDFs, etc.)
+    into valid YAML/JSON that matches our Pydantic schemas.
+
+    Example:
+        >>> parser = DataParser(llm_client)
+        >>> job_yaml = await parser.parse_raw_job("Senior ML Engineer at TechCorp...")
+        >>> resume_json = await parser.parse_raw_resume("John Doe | ML Engineer...")
+    """
+
+    def __init__(self, llm: "BaseLLMClient"):
+        """
+        Initialize parser with LLM client.
+
+        Args:
+            llm: LLM client (OpenAI or Anthropic) for extraction
+        """
+        self.llm = llm
+
+    async def parse_raw_job(self, raw_text: str) -> str:
+        """
+        Parse raw job posting text into structured YAML.
+
+        Extracts job details from unstructured text (LinkedIn, company careers page, etc.)
+        and converts it into valid YAML matching the JobDescription schema.
+
+        Args:
+            raw_text: Raw job posting text
 
-        return json_text
+        Returns:
+            YAML string matching JobDescription schema
+
+        Example:
+            >>> yaml_str = await parser.parse_raw_job('''
+            ... Senior ML Engineer at TechCorp
+            ... San Francisco, CA
+            ...
+            ... Responsibilities:
+            ... - Build ML models
+            ... - Deploy to production
+            ...
+            ... Requirements:
+            ... - Python, TensorFlow
+            ... - 5+ years experience
+            ... ''')
+        """
+        response = await self.llm.generate(
+            system_prompt=JOB_EXTRACTION_SYSTEM_PROMPT,
+            user_prompt=f"Raw Job Posting:\n{raw_text}",
+            json_mode=False
+        )
+        return _clean_job_yaml(response)
+
+    async def parse_raw_resume(self, raw_text: str) -> str:
+        """
+        Parse raw resume text into structured JSON.
+
+        Extracts candidate information from unstructured text (LinkedIn profile,
+        PDF resume, etc.) and converts it into valid JSON matching the CandidateProfile schema.
+
+        Args:
+            raw_text: Raw resume text
+
+        Returns:
+            JSON string matching CandidateProfile schema
+
+        Example:
+            >>> json_str = await parser.parse_raw_resume('''
+            ... John Doe
+            ... ML Engineer | San Francisco, CA
+            ... john@example.com
+            ...
+            ... Experience:
+            ... Senior ML Engineer at TechCorp (2020-Present)
+            ... - Built recommendation system
+            ... - Deployed to production
+            ... ''')
+        """
+        response = await self.llm.generate(
+            system_prompt=RESUME_EXTRACTION_SYSTEM_PROMPT,
+            user_prompt=f"Raw Resume/Profile:\n{raw_text}",
+            json_mode=False
+        )
+        return _clean_resume_json(response)
 
     def _escape_latex(self, text: str) -> str:
         """
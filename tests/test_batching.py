@@ -0,0 +1,196 @@
+"""Tests for bounded batch execution."""
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.batching import AdaptiveConcurrency, eager_tasks, install_fast_event_loop, run_bounded
+
+
+def test_run_bounded_limits_concurrency_and_keeps_order():
+    """Test that at most `concurrency` items run at once and results keep input order."""
+    running = 0
+    peak = 0
+
+    async def process(item, index):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (item % 3))
+        running -= 1
+        if item == 4:
+            raise ValueError("bad item")
+        return (index, item * 10)
+
+    completed = []
+    results = asyncio.run(run_bounded(
+        list(range(10)), process, concurrency=3,
+        return_exceptions=True, on_result=lambda index, result: completed.append(index)
+    ))
+
+    assert peak == 3
+    assert sorted(completed) == list(range(10))
+    assert completed != list(range(10))  # reported in completion order
+    assert isinstance(results[4], ValueError)
+    assert [r for i, r in enumerate(results) if i != 4] == [(i, i * 10) for i in range(10) if i != 4]
+
+
+def test_run_bounded_cancels_remaining_items_on_error():
+    """Test that an exception stops the pool instead of running every item."""
+    started = []
+    cancelled = []
+
+    async def process(item, index):
+        started.append(item)
+        if item == 1:
+            raise PermissionError("invalid api key")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    try:
+        asyncio.run(run_bounded(list(range(10)), process, concurrency=3))
+    except PermissionError:
+        pass
+    else:
+        raise AssertionError("expected PermissionError")
+
+    assert started == [0, 1, 2]
+    assert sorted(cancelled) == [0, 2]
+
+
+def test_run_bounded_stop_skips_unstarted_items():
+    """Test that setting `stop` lets running items finish but starts no new ones."""
+    async def run():
+        stop = asyncio.Event()
+
+        async def process(item, index):
+            if item == 2:
+                stop.set()
+            await asyncio.sleep(0.01)
+            return item
+
+        return await run_bounded(list(range(20)), process, concurrency=3, stop=stop)
+
+    results = asyncio.run(run())
+
+    assert results[:3] == [0, 1, 2]
+    assert results[3:] == [None] * 17
+
+
+def test_adaptive_concurrency_halves_on_throttle_and_grows_on_success():
+    """Test additive increase / multiplicative decrease of the limit."""
+    limit = AdaptiveConcurrency(initial=4, maximum=6, increase_every=2, cooldown=60)
+
+    limit.record_throttle()
+    limit.record_throttle()  # within cooldown: ignored
+    assert limit.limit == 2
+
+    for _ in range(10):
+        limit.record_success()
+    assert limit.limit == 6  # capped at maximum
+
+
+def test_adaptive_concurrency_limits_running_work():
+    """Test that at most `limit` holders run at once and a raise admits waiters."""
+    async def run():
+        limit = AdaptiveConcurrency(initial=1, maximum=3, increase_every=1)
+        running = 0
+        peaks = []
+
+        async def work(item, index):
+            nonlocal running
+            async with limit:
+                running += 1
+                peaks.append(running)
+                await asyncio.sleep(0.01)
+                running -= 1
+            limit.record_success()
+
+        await run_bounded(list(range(9)), work, concurrency=3)
+        return peaks, limit.limit
+
+    peaks, final_limit = asyncio.run(run())
+
+    assert peaks[0] == 1
+    assert max(peaks) == 3
+    assert final_limit == 3
+
+
+def test_eager_tasks_restores_task_factory():
+    """Test that eager_tasks() only applies inside the block."""
+    async def run():
+        loop = asyncio.get_running_loop()
+        before = loop.get_task_factory()
+        with eager_tasks():
+            inside = loop.get_task_factory()
+            results = await run_bounded([1, 2, 3], lambda item, index: asyncio.sleep(0, item), 2)
+        return before, inside, loop.get_task_factory(), results
+
+    before, inside, after, results = asyncio.run(run())
+
+    assert after is before
+    assert inside is getattr(asyncio, "eager_task_factory", before)
+    assert results == [1, 2, 3]
+
+
+def test_overlapping_eager_tasks_blocks_restore_original_factory(monkeypatch):
+    """Test that blocks exiting out of entry order leave the loop's own factory in place."""
+    def fake_eager_factory(loop, coro, **kwargs):
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    monkeypatch.setattr(asyncio, "eager_task_factory", fake_eager_factory, raising=False)
+
+    async def block(entered, release):
+        with eager_tasks():
+            entered.set()
+            await release.wait()
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        before = loop.get_task_factory()
+        entered = [asyncio.Event(), asyncio.Event()]
+        release = [asyncio.Event(), asyncio.Event()]
+        first = asyncio.create_task(block(entered[0], release[0]))
+        await entered[0].wait()
+        second = asyncio.create_task(block(entered[1], release[1]))
+        await entered[1].wait()
+
+        release[0].set()  # The first block to enter exits first
+        await first
+        still_eager = loop.get_task_factory()
+        release[1].set()
+        await second
+        return before, still_eager, loop.get_task_factory()
+
+    before, still_eager, after = asyncio.run(run())
+
+    assert still_eager is fake_eager_factory
+    assert after is before
+
+
+def test_install_fast_event_loop_sets_policy_when_available(monkeypatch):
+    """Test that the uvloop/winloop policy is installed only when importable."""
+    module_name = "winloop" if sys.platform == "win32" else "uvloop"
+    previous = asyncio.get_event_loop_policy()
+    try:
+        monkeypatch.setitem(sys.modules, module_name, None)  # import raises ImportError
+        assert install_fast_event_loop() is False
+        assert asyncio.get_event_loop_policy() is previous
+
+        class FakePolicy(asyncio.DefaultEventLoopPolicy):
+            pass
+
+        fake = types.ModuleType(module_name)
+        fake.EventLoopPolicy = FakePolicy
+        monkeypatch.setitem(sys.modules, module_name, fake)
+        assert install_fast_event_loop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), FakePolicy)
+    finally:
+        asyncio.set_event_loop_policy(previous)
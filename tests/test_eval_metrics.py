@@ -218,6 +218,129 @@ def test_semantic_matching_edge_cases():
     assert result['recall'] == 0.0
     assert result['f1'] == 0.0
 
+    # Case 5: Same bullets in a different order (matched without encoding)
+    model = MagicMock()
+    result = compute_semantic_matching(["a", "b", "a"], ["b", "a", "a"], model, 0.7)
+    assert result['tp'] == 2
+    assert result['fp'] == 1
+    assert result['fn'] == 1
+    model.encode.assert_not_called()
+
+    # Case 6: Same bullets but no model - the no-model result, like any other pair
+    result = compute_semantic_matching(["a", "b"], ["a", "b"], None, 0.7)
+    assert result['f1'] == 0.0
+    assert result['tp'] == 0
+
+
+def test_gather_bullets_offsets():
+    """Test that gathered bullets can be sliced back per pair and mode."""
+    import sys
+    from pathlib import Path
+    script_dir = Path(__file__).parent.parent / "scripts"
+    sys.path.insert(0, str(script_dir))
+    from eval_metrics import gather_bullets
+
+    records = [
+        {"baseline": {"bullets": ["b1", "b2"]}, "full": {"package": {"bullets": [{"text": "f1"}]}}},
+        {"baseline": {}, "full": {"bullets": ["f2", "f3"]}},
+        {"baseline": {"bullets": ["same"]}, "full": {"bullets": ["same"]}},
+    ]
+
+    all_texts, offsets = gather_bullets(records)
+
+    assert all_texts == ["b1", "b2", "f1", "f2", "f3", "same"]
+    b_start, b_end, f_start, f_end = offsets[0]
+    assert all_texts[b_start:b_end] == ["b1", "b2"]
+    assert all_texts[f_start:f_end] == ["f1"]
+    b_start, b_end, f_start, f_end = offsets[1]
+    assert all_texts[b_start:b_end] == []
+    assert all_texts[f_start:f_end] == ["f2", "f3"]
+    b_start, b_end, f_start, f_end = offsets[2]
+    assert (f_start, f_end) == (b_start, b_end)
+    assert all_texts[f_start:f_end] == ["same"]
+
+
+def test_encode_bullets_cached_only_encodes_misses(tmp_path):
+    """Test that cached embeddings are reused and only new texts are encoded."""
+    import sys
+    from pathlib import Path
+    script_dir = Path(__file__).parent.parent / "scripts"
+    sys.path.insert(0, str(script_dir))
+    from eval_metrics import encode_bullets_cached
+    from _embedding_cache import EmbeddingCache
+
+    def fake_encode(texts, **kwargs):
+        vectors = np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    model = MagicMock()
+    model.encode.side_effect = fake_encode
+
+    with EmbeddingCache(tmp_path, "org/model") as cache:
+        first = encode_bullets_cached(model, ["a", "bb"], cache)
+        second = encode_bullets_cached(model, ["bb", "ccc", "a"], cache)
+
+    assert model.encode.call_args_list[-1].args[0] == ["ccc"]
+    np.testing.assert_array_equal(first, fake_encode(["a", "bb"]))
+    np.testing.assert_allclose(second, fake_encode(["bb", "ccc", "a"]), rtol=1e-6)
+
+
+def test_quantize_embeddings_handles_empty_input():
+    """Test that empty embedding arrays quantize to empty int8 arrays."""
+    import sys
+    from pathlib import Path
+    script_dir = Path(__file__).parent.parent / "scripts"
+    sys.path.insert(0, str(script_dir))
+    from eval_metrics import quantize_embeddings
+
+    for shape in [(0,), (0, 8)]:
+        quantized = quantize_embeddings(np.zeros(shape, dtype=np.float32))
+        assert quantized.dtype == np.int8
+        assert quantized.shape == shape
+
+
+def test_encode_bullets_cached_handles_no_bullets(tmp_path):
+    """Test that an empty bullet list is neither encoded nor written to the cache."""
+    import sys
+    from pathlib import Path
+    script_dir = Path(__file__).parent.parent / "scripts"
+    sys.path.insert(0, str(script_dir))
+    from eval_metrics import encode_bullets_cached
+    from _embedding_cache import EmbeddingCache
+
+    model = MagicMock()
+    model.encode.return_value = np.zeros((0,), dtype=np.float32)
+
+    with EmbeddingCache(tmp_path, "org/model") as cache:
+        embeddings = encode_bullets_cached(model, [], cache)
+        cache.put_many([], np.zeros((0,), dtype=np.float32))
+
+    model.encode.assert_not_called()
+    assert embeddings.size == 0
+    assert embeddings[[]].size == 0
+
+
+def test_greedy_match_first_claim_wins():
+    """Test greedy matching when two baseline bullets prefer the same full bullet."""
+    import sys
+    from pathlib import Path
+    script_dir = Path(__file__).parent.parent / "scripts"
+    sys.path.insert(0, str(script_dir))
+    from eval_metrics import greedy_match, _greedy_match_loop
+
+    sim_matrix = np.array([
+        [0.9, 0.1, 0.2],  # claims full 0
+        [0.8, 0.6, 0.1],  # also prefers full 0 -> unmatched
+        [0.1, 0.2, 0.3],  # best is below threshold -> unmatched
+        [0.2, 0.1, 0.75],  # claims full 2
+    ])
+
+    tp, fp, fn = greedy_match(sim_matrix, 0.7)
+
+    assert (tp, fp, fn) == (2, 1, 2)
+    # The numba kernel's pure-Python body must agree with the NumPy path
+    assert _greedy_match_loop(sim_matrix, 0.7) == (2, 1, 2)
+
 
 def test_load_jsonl_handles_invalid_lines():
     """Test that load_jsonl skips invalid JSON lines gracefully."""
@@ -0,0 +1,79 @@
+"""Tests for resume bullet indexing and search."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.embeddings.faiss_index import ResumeFaissIndex
+
+
+class FakeEncoder:
+    """Encoder stub mapping each word to a fixed, normalized random vector."""
+
+    def __init__(self, dim=16):
+        self.dim = dim
+        self.vectors = {}
+
+    def encode_texts(self, texts, batch_size=64, show_progress=False):
+        rows = []
+        for text in texts:
+            if text not in self.vectors:
+                vector = np.random.default_rng(len(self.vectors)).normal(size=self.dim)
+                self.vectors[text] = vector / np.linalg.norm(vector)
+            rows.append(self.vectors[text])
+        return np.array(rows, dtype=np.float32)
+
+
+def test_brute_force_search_matches_hnsw_index():
+    """Test that small resumes skip the index object but rank bullets the same."""
+    encoder = FakeEncoder()
+    experiences = [
+        SimpleNamespace(id="exp-1", bullets=["a", "b", "c"]),
+        SimpleNamespace(id="exp-2", bullets=["d", "e"]),
+    ]
+    queries = ["a", "e", "unrelated"]
+
+    brute = ResumeFaissIndex(encoder)
+    brute.build_from_experiences(experiences)
+    hnsw = ResumeFaissIndex(encoder, brute_force_max_vectors=0, quantize=False)
+    hnsw.build_from_experiences(experiences)
+
+    assert brute.is_built() and brute._index is None
+    assert type(hnsw.index).__name__ == "IndexHNSWFlat"
+
+    brute_results = brute.search_many(queries, top_k=8)
+    assert brute_results == hnsw.search_many(queries, top_k=8)
+    assert brute_results[0][0]["text"] == "a"
+    assert brute_results[1][0]["source_id"] == "exp-2"
+    assert len(brute_results[2]) == 5  # empty slots past the 5 bullets are dropped
+
+    # The index object is still available on demand
+    assert brute.index.ntotal == 5
+
+
+def test_large_corpora_store_quantized_vectors():
+    """Test that HNSW-indexed corpora keep 8-bit codes instead of float32 embeddings."""
+    encoder = FakeEncoder(dim=32)
+    experiences = [
+        SimpleNamespace(id=f"exp-{i}", bullets=[f"bullet {i}.{j}" for j in range(10)])
+        for i in range(20)
+    ]
+    queries = [f"bullet {i}.3" for i in range(20)]
+
+    exact = ResumeFaissIndex(encoder)
+    exact.build_from_experiences(experiences)
+    quantized = ResumeFaissIndex(encoder, brute_force_max_vectors=100)
+    quantized.build_from_experiences(experiences)
+
+    assert type(quantized.index).__name__ == "IndexHNSWSQ"
+    assert quantized.embeddings is None and quantized.is_built()
+
+    for exact_hits, quantized_hits in zip(
+        exact.search_many(queries, top_k=1), quantized.search_many(queries, top_k=1)
+    ):
+        assert quantized_hits[0]["text"] == exact_hits[0]["text"]
+        assert abs(quantized_hits[0]["score"] - exact_hits[0]["score"]) < 0.05
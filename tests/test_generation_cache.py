@@ -0,0 +1,40 @@
+"""Tests for the /generate response cache."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.generation_cache import GenerationCache
+
+
+def test_make_key_depends_on_both_inputs():
+    """Test that keys are stable and distinguish job/resume boundaries."""
+    key = GenerationCache.make_key("job", "resume")
+
+    assert key == GenerationCache.make_key("job", "resume")
+    assert len(key) == 32
+    assert key != GenerationCache.make_key("jobr", "esume")
+
+
+def test_in_memory_cache_round_trip_and_eviction():
+    """Test get/set, LRU eviction, and expiry of the in-process backend."""
+    async def run():
+        cache = GenerationCache(max_entries=2)
+        assert cache.backend == "memory"
+
+        await cache.set("a", {"success": True, "bullets": [{"id": "b1"}]})
+        await cache.set("b", {"success": True})
+        assert await cache.get("a") == {"success": True, "bullets": [{"id": "b1"}]}
+
+        # "a" was used most recently, so adding "c" evicts "b"
+        await cache.set("c", {"success": True})
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+
+        expired = GenerationCache(ttl_seconds=-1)
+        await expired.set("a", {"success": True})
+        assert await expired.get("a") is None
+
+    asyncio.run(run())
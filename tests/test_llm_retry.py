@@ -0,0 +1,100 @@
+"""Tests for the shared LLM retry loop."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.llm.anthropic_client import AnthropicLLMClient
+from src.llm.base import BaseLLMClient, FatalLLMError, LLMRetriesExhaustedError
+from src.llm.openai_client import OpenAILLMClient
+
+
+class FlakyLLM(BaseLLMClient):
+    """Client stub raising the queued errors before succeeding."""
+
+    def __init__(self, errors, max_retries=3):
+        super().__init__(max_retries=max_retries)
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def generate(self, *, system_prompt, user_prompt, json_mode=True, prompt_suffix=None, on_text=None):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return f"{user_prompt}{prompt_suffix or ''}"
+
+    def get_model_name(self):
+        return "flaky"
+
+
+def test_generate_with_retry_backs_off_with_jitter(monkeypatch):
+    """Test that transient errors are retried with randomized exponential waits."""
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    llm = FlakyLLM([TimeoutError(), TimeoutError()])
+
+    result = asyncio.run(llm.generate_with_retry(
+        system_prompt="s", user_prompt="prefix", prompt_suffix="+feedback"
+    ))
+
+    assert result == "prefix+feedback"
+    assert llm.calls == 3
+    assert 0.5 <= waits[0] <= 1.5 and 1.0 <= waits[1] <= 3.0
+
+
+def test_generate_with_retry_error_types(monkeypatch):
+    """Test that fatal errors are not retried and exhaustion has its own type."""
+    async def fake_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    fatal = FlakyLLM([FatalLLMError("bad key")])
+    try:
+        asyncio.run(fatal.generate_with_retry(system_prompt="s", user_prompt="u"))
+    except FatalLLMError:
+        assert fatal.calls == 1
+    else:
+        raise AssertionError("expected FatalLLMError")
+
+    flaky = FlakyLLM([TimeoutError()] * 3)
+    try:
+        asyncio.run(flaky.generate_with_retry(system_prompt="s", user_prompt="u"))
+    except LLMRetriesExhaustedError as e:
+        assert flaky.calls == 3
+        assert isinstance(e.__cause__, TimeoutError)
+    else:
+        raise AssertionError("expected LLMRetriesExhaustedError")
+
+
+@pytest.mark.parametrize("client_class,provider", [
+    (OpenAILLMClient, "OpenAI"),
+    (AnthropicLLMClient, "Anthropic"),
+])
+def test_provider_clients_use_shared_retry_loop(monkeypatch, client_class, provider):
+    """Test that each provider client retries through BaseLLMClient.generate_with_retry."""
+    async def fake_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    llm = client_class(api_key="test-key", max_retries=2)
+    calls = []
+
+    async def failing_generate(**kwargs):
+        calls.append(kwargs)
+        raise TimeoutError("slow")
+
+    monkeypatch.setattr(llm, "generate", failing_generate)
+
+    assert client_class.generate_with_retry is BaseLLMClient.generate_with_retry
+    with pytest.raises(LLMRetriesExhaustedError, match=f"^{provider} generation failed after 2"):
+        asyncio.run(llm.generate_with_retry(system_prompt="s", user_prompt="u"))
+    assert len(calls) == 2
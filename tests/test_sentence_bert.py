@@ -0,0 +1,59 @@
+"""Tests for the Sentence-BERT encoder wrapper (no model download needed)."""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.embeddings.sentence_bert import (
+    SentenceBertEncoder, configure_cpu_threads, get_shared_encoder
+)
+
+
+def test_run_async_uses_one_worker_thread():
+    """Test that encoder work runs off the event loop, always on the same thread."""
+    encoder = SentenceBertEncoder()
+
+    def work(value, scale=1):
+        return threading.current_thread().name, value * scale
+
+    async def run():
+        return await asyncio.gather(*(encoder.run_async(work, i, scale=2) for i in range(4)))
+
+    results = asyncio.run(run())
+
+    assert [value for _, value in results] == [0, 2, 4, 6]
+    assert len({name for name, _ in results}) == 1
+    assert results[0][0] != threading.main_thread().name
+    assert not encoder.is_loaded()
+
+
+def test_get_shared_encoder_returns_one_instance_per_model():
+    """Test that batch runs share an encoder per model name."""
+    assert get_shared_encoder() is get_shared_encoder("all-MiniLM-L6-v2")
+    assert get_shared_encoder("all-mpnet-base-v2") is not get_shared_encoder()
+
+
+def test_configure_cpu_threads_splits_cores_between_workers(monkeypatch):
+    """Test that server workers share the CPUs and OMP_NUM_THREADS overrides the split."""
+    import os
+    import torch
+
+    configured = []
+    monkeypatch.setattr(torch, "set_num_threads", configured.append)
+    monkeypatch.setattr(torch, "set_num_interop_threads", lambda n: None)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(16)), raising=False)
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "WEB_CONCURRENCY"):
+        monkeypatch.delenv(name, raising=False)
+
+    assert configure_cpu_threads() == 15
+
+    monkeypatch.delenv("OMP_NUM_THREADS")
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    assert configure_cpu_threads() == 3
+
+    monkeypatch.setenv("OMP_NUM_THREADS", "6")
+    assert configure_cpu_threads() == 6
+    assert configured == [15, 3, 6]
@@ -0,0 +1,58 @@
+"""Tests for starting the cover letter while bullets stream."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("src.models")
+
+from src.agent import executor as executor_module
+from src.generators.cover_letter_generator import (
+    COVER_LETTER_SAMPLE_BULLETS, _build_cover_letter_prompt
+)
+
+
+def make_bullets(*texts):
+    return [SimpleNamespace(text=text) for text in texts]
+
+
+def test_result_for_reuses_early_task_only_for_identical_prompt(monkeypatch):
+    """Test that the streamed cover letter is used only when the final prompt matches."""
+    calls = []
+
+    async def fake_generate_cover_letter(job, resume, bullets, llm):
+        calls.append([bullet.text for bullet in bullets])
+        return f"letter {len(calls)}"
+
+    monkeypatch.setattr(executor_module, "generate_cover_letter", fake_generate_cover_letter)
+    job = SimpleNamespace(
+        title="ML Engineer", company="Acme", location=None,
+        responsibilities=[], required_skills=[]
+    )
+    resume = SimpleNamespace(
+        name="Ann Lee", email="ann@example.com", location=None, skills=[], experiences=[]
+    )
+    streamed = make_bullets(*(f"bullet {i}" for i in range(COVER_LETTER_SAMPLE_BULLETS)))
+
+    async def run(final_bullets):
+        speculative = executor_module._SpeculativeCoverLetter(job, resume, llm=None)
+        speculative.on_partial_bullets(streamed)
+        return await speculative.result_for(final_bullets)
+
+    # More bullets after the quoted sample leave the prompt unchanged
+    longer = streamed + make_bullets("bullet 5", "bullet 6")
+    assert _build_cover_letter_prompt(job, resume, longer) == _build_cover_letter_prompt(
+        job, resume, streamed
+    )
+    assert asyncio.run(run(longer)) == "letter 1"
+    assert len(calls) == 1
+
+    # A different final sample gets a fresh cover letter
+    changed = make_bullets("other") + streamed[1:]
+    assert asyncio.run(run(changed)) == f"letter {len(calls)}"
+    assert calls[-1][0] == "other"
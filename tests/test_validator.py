@@ -0,0 +1,24 @@
+"""Tests for generated package validation."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agent.validator import validate_package
+
+
+def test_validate_package_can_skip_bullet_checks():
+    """Test that pre-validated bullets skip per-bullet checks but package checks still run."""
+    job = SimpleNamespace(job_id="job-1", required_skills=["Python"], nice_to_have_skills=[])
+    resume = SimpleNamespace(skills=["Python"], experiences=[])
+    short_bullet = SimpleNamespace(id="b1", text="Too short", skills_covered=["Python"])
+    cover_letter = SimpleNamespace(job_id="job-1", text="Dear team, " * 30)
+    package = SimpleNamespace(job_id="job-1", bullets=[short_bullet], cover_letter=cover_letter)
+
+    assert len(validate_package(package, job, resume)) == 1
+    assert validate_package(package, job, resume, skip_bullet_checks=True) == []
+
+    package.bullets = []
+    assert validate_package(package, job, resume, skip_bullet_checks=True) == ["Package has no bullets"]